@@ -1,6 +1,9 @@
 from flask import Flask, jsonify, request, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import os
+import signal
+import sys
 import pandas as pd
 import numpy as np
 import traceback
@@ -14,7 +17,18 @@ from error_handler import (
     validate_required_fields, validate_field_types, validate_positive_numbers
 )
 from dashboard_data import DashboardDataGenerator
+from records import Record
+
+class RecordJSONProvider(DefaultJSONProvider):
+    """JSON provider that also encodes the slotted ticket, developer and metric records"""
+    @staticmethod
+    def default(o):
+        if isinstance(o, Record):
+            return o.to_dict()
+        return DefaultJSONProvider.default(o)
+
 app = Flask(__name__)
+app.json = RecordJSONProvider(app)
 # Add a secret key for JWT token generation
 app.config['SECRET_KEY'] = 'your_secure_secret_key_here'  # Change this in production!
 # Enable CORS for all routes
@@ -90,7 +104,7 @@ def create_ticket():
 @handle_errors
 @login_required
 def get_ticket(ticket_id):
-    ticket = next((t for t in system.tickets if t['id'] == ticket_id), None)
+    ticket = system.get_ticket(ticket_id)
     if not ticket:
         raise NotFoundError("Ticket", ticket_id)
     return jsonify(ticket)
@@ -310,6 +324,15 @@ def balance_workload():
 def get_progress_report():
     report = system.generate_progress_report()
     return jsonify(report)
+@app.route('/api/system/sprint-forecast', methods=['GET'])
+@handle_errors
+@login_required
+def get_sprint_forecast():
+    samples = request.args.get('samples', 10000, type=int)
+    if not 100 <= samples <= 200000:
+        raise ValidationError("samples must be between 100 and 200000")
+    forecast = system.forecast_sprint(n_samples=samples)
+    return jsonify(forecast)
 @app.route('/api/system/real-time-metrics', methods=['GET'])
 @handle_errors
 @login_required
@@ -330,7 +353,9 @@ def get_dashboard():
     dashboard_data = generator.generate_dashboard_data(
         system.tickets, 
         system.developers, 
-        system.performance_tracker.get_historical_performance_data()
+        system.performance_tracker.get_historical_performance_data(),
+        summary_counts=system.get_summary_counts(),
+        completion_percentiles=system.get_developer_completion_percentiles()
     )
     return jsonify(dashboard_data)
 @app.route('/api/system/reset', methods=['POST'])
@@ -356,5 +381,10 @@ def reset_ticket_ids():
 @app.route('/')
 def index():
     return jsonify({"message": "Smart Sprint API is running"})
+def handle_shutdown(signum, frame):
+    """Flush pending background saves before the server exits"""
+    system.shutdown()
+    sys.exit(0)
 if __name__ == '__main__':
+    signal.signal(signal.SIGTERM, handle_shutdown)
     app.run(debug=True, host='0.0.0.0', port=5001)
\ No newline at end of file
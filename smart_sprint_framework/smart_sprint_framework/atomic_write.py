@@ -0,0 +1,170 @@
+import contextlib
+import glob
+import os
+import shutil
+import time
+import uuid
+
+# Durability policies for data file writes:
+#   none   - no fsync; an interrupted write still never leaves a partial file,
+#            but the last saves can be lost if the machine loses power
+#   batch  - each save's files are synced together at the end of the save
+#   always - every file (and every change journal record) is synced as it is written
+DURABILITY_NONE = 'none'
+DURABILITY_BATCH = 'batch'
+DURABILITY_ALWAYS = 'always'
+DURABILITY_POLICIES = (DURABILITY_NONE, DURABILITY_BATCH, DURABILITY_ALWAYS)
+DEFAULT_DURABILITY = DURABILITY_BATCH
+
+TEMP_SUFFIX = '.tmp'
+
+# Temporary files younger than this may belong to a save still running in
+# another process, so recovery leaves them alone
+TEMP_FILE_GRACE_SECONDS = 3600
+
+
+def resolve_durability(durability=None):
+    """Return the given policy, or the SMART_SPRINT_DURABILITY setting, or the default"""
+    durability = durability or os.environ.get('SMART_SPRINT_DURABILITY', DEFAULT_DURABILITY)
+    if durability not in DURABILITY_POLICIES:
+        raise ValueError(f"Unknown durability policy: {durability}")
+    return durability
+
+
+def fsync_directory(directory):
+    """Make a rename inside directory durable"""
+    if os.name == 'nt':
+        # Windows cannot open directories; NTFS journals the rename itself
+        return
+    fd = os.open(directory or '.', os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_path(path):
+    # Opened for writing because Windows refuses to flush a read-only handle
+    fd = os.open(path, os.O_RDWR)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _create_temp_file(path):
+    """Create an empty temporary file beside path, with the permissions path has or would get"""
+    directory, name = os.path.split(os.path.abspath(path))
+    while True:
+        temp_path = os.path.join(directory, f'.{name}.{uuid.uuid4().hex[:12]}{TEMP_SUFFIX}')
+        try:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+            break
+        except FileExistsError:
+            continue
+    if os.path.exists(path):
+        shutil.copymode(path, temp_path)
+    return fd, temp_path
+
+
+def remove_stale_temp_files(paths, min_age=TEMP_FILE_GRACE_SECONDS):
+    """Delete temporary files left next to `paths` by writes that never finished.
+
+    Only files not modified for `min_age` seconds are removed; a newer one
+    may still be written by another process sharing the files.
+    """
+    removed = []
+    cutoff = time.time() - min_age
+    for path in paths:
+        directory, name = os.path.split(os.path.abspath(path))
+        for temp_path in glob.glob(os.path.join(glob.escape(directory), f'.{glob.escape(name)}.*{TEMP_SUFFIX}')):
+            try:
+                if os.path.getmtime(temp_path) > cutoff:
+                    continue
+            except OSError:
+                continue
+            _remove_quietly(temp_path)
+            removed.append(temp_path)
+    return removed
+
+
+class AtomicWriteBatch:
+    """Writes files through temporary files and renames them into place.
+
+    A reader (or a restart after a crash) sees either the old or the new
+    version of each file, never a partial one. With the batch policy the
+    files of one save are synced and renamed together when the batch is
+    committed; with the always policy each file is synced and renamed as
+    soon as it is closed. Leaving the `with` block with an exception
+    discards every file that has not been renamed yet.
+    """
+    def __init__(self, durability=None):
+        self.durability = resolve_durability(durability)
+        self._staged = []
+
+    @contextlib.contextmanager
+    def open(self, path, mode='w', **kwargs):
+        """Open a temporary file that replaces `path` when the batch commits"""
+        fd, temp_path = _create_temp_file(path)
+        try:
+            with os.fdopen(fd, mode, **kwargs) as f:
+                yield f
+                f.flush()
+                if self.durability == DURABILITY_ALWAYS:
+                    os.fsync(f.fileno())
+        except BaseException:
+            _remove_quietly(temp_path)
+            raise
+
+        if self.durability == DURABILITY_ALWAYS:
+            os.replace(temp_path, path)
+            fsync_directory(os.path.dirname(os.path.abspath(path)))
+        else:
+            self._staged.append((temp_path, path))
+
+    def commit(self):
+        """Sync and rename every staged file into place"""
+        staged, self._staged = self._staged, []
+        if self.durability == DURABILITY_BATCH:
+            for temp_path, _ in staged:
+                _fsync_path(temp_path)
+
+        directories = set()
+        for temp_path, path in staged:
+            os.replace(temp_path, path)
+            directories.add(os.path.dirname(os.path.abspath(path)))
+
+        if self.durability == DURABILITY_BATCH:
+            for directory in directories:
+                fsync_directory(directory)
+
+    def abort(self):
+        """Discard every staged file"""
+        staged, self._staged = self._staged, []
+        for temp_path, _ in staged:
+            _remove_quietly(temp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
+
+
+@contextlib.contextmanager
+def atomic_write(path, mode='w', durability=None, **kwargs):
+    """Write a single file atomically; see AtomicWriteBatch"""
+    with AtomicWriteBatch(durability) as batch:
+        with batch.open(path, mode, **kwargs) as f:
+            yield f
@@ -0,0 +1,260 @@
+import argparse
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import zlib
+from atomic_write import atomic_write
+
+# Default retention: newest snapshot per hour for a day, per day for a week, per week for a month
+DEFAULT_RETENTION = {'hourly': 24, 'daily': 7, 'weekly': 4}
+
+# A chunk ends after a line whose checksum hits this mask, so an inserted
+# row only changes the chunk it lands in rather than every chunk after it
+CHUNK_BOUNDARY_MASK = 0x1F
+MAX_CHUNK_LINES = 512
+
+
+class BackupStore:
+    """Content-addressed, deduplicating backup store for the data files.
+
+    Files are split into line-aligned chunks that are stored gzip-compressed
+    under their SHA-256 hash, so a snapshot only costs the chunks that
+    changed since the previous one. Snapshots whose files are all unchanged
+    are skipped entirely.
+    """
+    def __init__(self, root='backups', retention=None, durability=None):
+        self.root = root
+        self.durability = durability
+        self.objects_dir = os.path.join(root, 'objects')
+        self.manifest_path = os.path.join(root, 'manifest.json')
+        self.retention = retention or dict(DEFAULT_RETENTION)
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self):
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (ValueError, OSError) as e:
+                print(f"Warning: Could not read backup manifest: {e}")
+        return {'snapshots': []}
+
+    def _save_manifest(self):
+        os.makedirs(self.root, exist_ok=True)
+        with atomic_write(self.manifest_path, 'w', self.durability, encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2)
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def _split_chunks(self, content):
+        """Split file content into line-aligned, content-defined chunks"""
+        chunks = []
+        current = []
+        for line in content.splitlines(keepends=True):
+            current.append(line)
+            if (zlib.crc32(line) & CHUNK_BOUNDARY_MASK) == 0 or len(current) >= MAX_CHUNK_LINES:
+                chunks.append(b''.join(current))
+                current = []
+        if current:
+            chunks.append(b''.join(current))
+        return chunks
+
+    def _store_chunk(self, chunk):
+        digest = hashlib.sha256(chunk).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with atomic_write(path, 'wb', self.durability) as f:
+                f.write(gzip.compress(chunk))
+        return digest
+
+    def latest_snapshot(self):
+        snapshots = self.manifest['snapshots']
+        return snapshots[-1] if snapshots else None
+
+    def backup(self, paths, now=None):
+        """Back up the given files, returning the new snapshot or None if nothing changed"""
+        now = now or datetime.datetime.now()
+        latest = self.latest_snapshot()
+        previous_files = latest['files'] if latest else {}
+
+        files = {}
+        changed = False
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+
+            with open(path, 'rb') as f:
+                content = f.read()
+            digest = hashlib.sha256(content).hexdigest()
+            name = os.path.basename(path)
+
+            previous = previous_files.get(name)
+            if previous and previous['sha256'] == digest:
+                # Unchanged file: reuse its chunk list without touching the object store
+                files[name] = previous
+                continue
+
+            changed = True
+            files[name] = {
+                'sha256': digest,
+                'size': len(content),
+                'chunks': [self._store_chunk(chunk) for chunk in self._split_chunks(content)]
+            }
+
+        if not changed and set(files) == set(previous_files):
+            return None
+
+        snapshot = {
+            'id': self._new_snapshot_id(now),
+            'created_at': now.isoformat(),
+            'files': files
+        }
+        self.manifest['snapshots'].append(snapshot)
+        self.apply_retention(now)
+        self._save_manifest()
+        return snapshot
+
+    def _new_snapshot_id(self, now):
+        base_id = now.strftime("%Y%m%d_%H%M%S")
+        existing = {s['id'] for s in self.manifest['snapshots']}
+        snapshot_id = base_id
+        suffix = 1
+        while snapshot_id in existing:
+            snapshot_id = f"{base_id}_{suffix}"
+            suffix += 1
+        return snapshot_id
+
+    def apply_retention(self, now=None):
+        """Thin snapshots to the newest one per hour, day and week within the retention window"""
+        now = now or datetime.datetime.now()
+        snapshots = self.manifest['snapshots']
+        if not snapshots:
+            return []
+
+        keep = {snapshots[-1]['id']}  # Always keep the most recent snapshot
+        buckets = {
+            'hourly': lambda t: t.strftime('%Y%m%d%H'),
+            'daily': lambda t: t.strftime('%Y%m%d'),
+            'weekly': lambda t: t.strftime('%G%V')
+        }
+        windows = {
+            'hourly': datetime.timedelta(hours=self.retention.get('hourly', 0)),
+            'daily': datetime.timedelta(days=self.retention.get('daily', 0)),
+            'weekly': datetime.timedelta(weeks=self.retention.get('weekly', 0))
+        }
+
+        for policy, bucket_of in buckets.items():
+            seen = set()
+            # Walk newest first so each bucket keeps its latest snapshot
+            for snapshot in reversed(snapshots):
+                created_at = datetime.datetime.fromisoformat(snapshot['created_at'])
+                if now - created_at > windows[policy]:
+                    continue
+                bucket = bucket_of(created_at)
+                if bucket not in seen:
+                    seen.add(bucket)
+                    keep.add(snapshot['id'])
+
+        removed = [s for s in snapshots if s['id'] not in keep]
+        if removed:
+            self.manifest['snapshots'] = [s for s in snapshots if s['id'] in keep]
+            # Persist the trimmed list before deleting anything: an orphaned chunk
+            # is harmless, a manifest naming deleted chunks is not
+            self._save_manifest()
+            self._collect_garbage()
+        return removed
+
+    def _collect_garbage(self):
+        """Delete chunk objects no longer referenced by any snapshot"""
+        referenced = set()
+        for snapshot in self.manifest['snapshots']:
+            for info in snapshot['files'].values():
+                referenced.update(info['chunks'])
+
+        if not os.path.exists(self.objects_dir):
+            return
+
+        for prefix in os.listdir(self.objects_dir):
+            prefix_dir = os.path.join(self.objects_dir, prefix)
+            for name in os.listdir(prefix_dir):
+                if prefix + name not in referenced:
+                    os.remove(os.path.join(prefix_dir, name))
+
+    def file_versions(self, name):
+        """Ids of the snapshots that contain a file, newest first"""
+        return [s['id'] for s in reversed(self.manifest['snapshots']) if name in s['files']]
+
+    def read_file(self, snapshot_id, name):
+        """Reassemble a file from a snapshot and verify its checksum"""
+        snapshot = next((s for s in self.manifest['snapshots'] if s['id'] == snapshot_id), None)
+        if not snapshot or name not in snapshot['files']:
+            raise KeyError(f"{name} not found in backup {snapshot_id}")
+
+        info = snapshot['files'][name]
+        parts = []
+        for digest in info['chunks']:
+            with open(self._object_path(digest), 'rb') as f:
+                parts.append(gzip.decompress(f.read()))
+        content = b''.join(parts)
+
+        if hashlib.sha256(content).hexdigest() != info['sha256']:
+            raise ValueError(f"Backup of {name} in {snapshot_id} is corrupted")
+        return content
+
+    def restore(self, snapshot_id, target_dir='.', files=None):
+        """Restore files from a snapshot into target_dir"""
+        snapshot = next((s for s in self.manifest['snapshots'] if s['id'] == snapshot_id), None)
+        if not snapshot:
+            raise KeyError(f"Backup {snapshot_id} not found")
+
+        restored = []
+        for name in files or snapshot['files']:
+            content = self.read_file(snapshot_id, name)
+            target_path = os.path.join(target_dir, name)
+            with atomic_write(target_path, 'wb', self.durability) as f:
+                f.write(content)
+            restored.append(target_path)
+        return restored
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Manage Smart Sprint data backups')
+    parser.add_argument('--root', default='backups', help='Backup directory')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('list', help='List available backups')
+    subparsers.add_parser('prune', help='Apply the retention policy now')
+
+    restore_parser = subparsers.add_parser('restore', help='Restore data files from a backup')
+    restore_parser.add_argument('snapshot_id', help="Backup id from 'list', or 'latest'")
+    restore_parser.add_argument('--target', default='.', help='Directory to restore into')
+    restore_parser.add_argument('--file', action='append', dest='files', help='Restore only this file')
+
+    args = parser.parse_args()
+    store = BackupStore(args.root)
+
+    if args.command == 'list':
+        for snapshot in store.manifest['snapshots']:
+            names = ', '.join(sorted(snapshot['files']))
+            print(f"{snapshot['id']}  {snapshot['created_at']}  {names}")
+    elif args.command == 'prune':
+        removed = store.apply_retention()
+        print(f"Removed {len(removed)} backups")
+    elif args.command == 'restore':
+        snapshot_id = args.snapshot_id
+        if snapshot_id == 'latest':
+            latest = store.latest_snapshot()
+            if not latest:
+                print("No backups available")
+                return
+            snapshot_id = latest['id']
+        for path in store.restore(snapshot_id, args.target, args.files):
+            print(f"Restored {path}")
+
+
+if __name__ == "__main__":
+    main()
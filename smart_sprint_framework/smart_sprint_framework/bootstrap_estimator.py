@@ -0,0 +1,126 @@
+import math
+import os
+import numpy as np
+from monte_carlo import MonteCarloEstimator
+from records import complexity_key
+
+# Estimation engines SmartSprintSystem can run timeline estimates with
+ENGINE_UNIFORM = 'uniform'
+ENGINE_BOOTSTRAP = 'bootstrap'
+ESTIMATION_ENGINES = (ENGINE_UNIFORM, ENGINE_BOOTSTRAP)
+
+
+def create_estimator(engine=None, **options):
+    """Create the estimator named by `engine` or the SMART_SPRINT_ESTIMATOR variable"""
+    engine = engine or os.environ.get('SMART_SPRINT_ESTIMATOR', ENGINE_UNIFORM)
+
+    if engine == ENGINE_UNIFORM:
+        return MonteCarloEstimator(**options)
+    if engine == ENGINE_BOOTSTRAP:
+        return BootstrapEstimator(**options)
+    raise ValueError(f"Unknown estimation engine: {engine}")
+
+
+class BootstrapEstimator(MonteCarloEstimator):
+    """Monte Carlo estimator that resamples recorded completion_time / estimated_hours ratios.
+
+    Ratios are kept per complexity level (and, with `per_developer`, per
+    developer and complexity level) as sorted arrays, concatenated into one
+    pool so a whole (tasks, samples) matrix is resampled with a single
+    gather. A sorted array maps a uniform draw to a ratio by its rank, so
+    antithetic pairs still mirror each other in the adaptive mode. Levels
+    with fewer than `min_samples` ratios fall back to the per-complexity
+    ratios and then to the uniform ranges.
+
+    rebuild() loads the history once; add() merges each new metric into its
+    sorted arrays. Arrays are replaced rather than changed in place, so a
+    shallow copy of the estimator keeps sampling the history as it was.
+    """
+    def __init__(self, n_simulations=1000, seed=None, batch_rows=1024, tolerance=None,
+                 adaptive_batch=256, min_batches=4, max_simulations=100000,
+                 min_samples=5, per_developer=False):
+        super().__init__(n_simulations, seed, batch_rows, tolerance, adaptive_batch, min_batches, max_simulations)
+        self.min_samples = min_samples
+        self.per_developer = per_developer
+        self._set_ratios({})
+
+    def rebuild(self, metrics, tickets_by_id):
+        """Build the ratio arrays from every recorded metric"""
+        collected = {}
+        for metric in metrics:
+            for key, ratio in self._keyed_ratios(metric, tickets_by_id.get(metric['ticket_id'])):
+                collected.setdefault(key, []).append(ratio)
+        self._set_ratios({key: np.sort(np.array(values, dtype=float)) for key, values in collected.items()})
+
+    def add(self, metric, ticket):
+        """Merge one newly recorded metric into the ratio arrays"""
+        keyed = self._keyed_ratios(metric, ticket)
+        if not keyed:
+            return
+        ratios = dict(self._ratios)
+        for key, ratio in keyed:
+            current = ratios.get(key, np.empty(0))
+            ratios[key] = np.insert(current, np.searchsorted(current, ratio), ratio)
+        self._set_ratios(ratios)
+
+    def ratios(self, complexity, developer_id=None):
+        """Sorted recorded ratios for a complexity level (and developer), empty without history"""
+        key = (developer_id, complexity_key(complexity)) if developer_id is not None else complexity_key(complexity)
+        return self._ratios.get(key, np.empty(0))
+
+    def _keyed_ratios(self, metric, ticket):
+        """The (key, ratio) pairs a metric contributes; none without a usable ticket estimate"""
+        if not ticket or ticket.get('complexity') is None:
+            return []
+        try:
+            ratio = float(metric['completion_time']) / float(ticket.get('estimated_hours'))
+        except (TypeError, ValueError, ZeroDivisionError):
+            return []
+        if not math.isfinite(ratio) or ratio < 0:
+            return []
+
+        complexity = complexity_key(ticket['complexity'])
+        keyed = [(complexity, ratio)]
+        if self.per_developer:
+            keyed.append(((metric['developer_id'], complexity), ratio))
+        return keyed
+
+    def _set_ratios(self, ratios):
+        """Swap in new ratio arrays together with the pool built from them"""
+        spans = {}
+        offset = 0
+        for key, values in ratios.items():
+            spans[key] = (offset, len(values))
+            offset += len(values)
+        pool = np.concatenate(list(ratios.values())) if ratios else np.empty(0)
+        self._table = (pool, spans)
+        self._ratios = ratios
+        self.version += 1
+
+    def _factor_params(self, complexities, developer_ids):
+        """Per task: pool offset and length of its ratios (length 0 if too few), then the uniform (min, max)"""
+        _, spans = self._table
+        params = np.zeros((len(complexities), 4))
+        for i, complexity in enumerate(complexities):
+            key = complexity_key(complexity)
+            span = None
+            if self.per_developer and developer_ids is not None and developer_ids[i] is not None:
+                span = spans.get((developer_ids[i], key))
+            if span is None or span[1] < self.min_samples:
+                span = spans.get(key)
+            if span is not None and span[1] >= self.min_samples:
+                params[i, :2] = span
+            params[i, 2:] = self.complexity_factors[complexity]
+        return params
+
+    def _factors(self, params, u):
+        pool, _ = self._table
+        uniform = super()._factors(params[:, 2:], u)
+        if not pool.size:
+            return uniform
+        offsets = params[:, :1].astype(np.int64)
+        lengths = params[:, 1:2].astype(np.int64)
+        # Rank of each draw within its task's sorted ratios, i.e. a resample with replacement
+        ranks = np.minimum((u * lengths).astype(np.int64), np.maximum(lengths - 1, 0))
+        resampled = pool[np.minimum(offsets + ranks, pool.size - 1)]
+        return np.where(lengths > 0, resampled, uniform)
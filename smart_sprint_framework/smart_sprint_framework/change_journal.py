@@ -0,0 +1,146 @@
+import json
+import os
+import datetime
+import threading
+from atomic_write import atomic_write, DURABILITY_ALWAYS, DURABILITY_NONE
+from records import json_default
+
+# Record types written to the change journal
+TICKET_CREATED = 'ticket_created'
+TICKET_ASSIGNED = 'ticket_assigned'
+TICKET_COMPLETED = 'ticket_completed'
+TICKET_UPDATED = 'ticket_updated'
+METRIC_RECORDED = 'metric_recorded'
+
+# Header record describing the snapshot files the journal applies to
+SNAPSHOT_BASE = 'snapshot_base'
+
+
+class ChangeJournal:
+    """Append-only log of typed change records, one JSON object per line.
+
+    The journal holds every change made since the CSV snapshot files were
+    last written. On startup the records are replayed on top of the
+    snapshot, and compaction rewrites the snapshot and truncates the log.
+    """
+    def __init__(self, path='change_journal.jsonl', fsync=True):
+        self.path = path
+        self.fsync = fsync
+        self.lock = threading.Lock()
+        self.base = None
+        self.record_count = 0
+        self._repair_tail()
+        self._scan()
+
+    def _repair_tail(self):
+        """Cut a line left half-written by a crash mid-append, so the next append starts on a fresh line"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r+b') as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            # Walk back from the end to the last complete line
+            while position > 0:
+                start = max(position - 65536, 0)
+                f.seek(start)
+                block = f.read(position - start)
+                if position == end and block.endswith(b'\n'):
+                    return
+                newline = block.rfind(b'\n')
+                if newline >= 0:
+                    position = start + newline + 1
+                    break
+                position = start
+            f.truncate(position)
+            if self.fsync:
+                os.fsync(f.fileno())
+        print(f"Warning: Dropped a partly written record at the end of {self.path}")
+
+    def _scan(self):
+        """Read the snapshot header and count the records already in the journal"""
+        for record in self._read_lines():
+            if record.get('type') == SNAPSHOT_BASE:
+                self.base = record.get('data')
+            else:
+                self.record_count += 1
+
+    def _read_lines(self):
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn tails are cut on open, so this is a line damaged some other way
+                    print(f"Warning: Skipping unreadable journal record at line {line_number}")
+
+    def _write(self, f, record):
+        f.write(json.dumps(record, default=json_default) + '\n')
+        f.flush()
+        if self.fsync:
+            os.fsync(f.fileno())
+
+    def append(self, record_type, data):
+        """Append a single change record and make it durable"""
+        record = {
+            'type': record_type,
+            'timestamp': datetime.datetime.now().isoformat(),
+            'data': data
+        }
+
+        with self.lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                self._write(f, record)
+            self.record_count += 1
+
+        return record
+
+    def sync(self):
+        """Make every appended record durable"""
+        with self.lock:
+            if os.path.exists(self.path):
+                with open(self.path, 'rb+') as f:
+                    os.fsync(f.fileno())
+
+    def records(self):
+        """Yield change records in the order they were appended"""
+        for record in self._read_lines():
+            if record.get('type') != SNAPSHOT_BASE:
+                yield record
+
+    def position(self):
+        """Byte offset of the end of the journal, for use with truncate(keep_from=...)"""
+        with self.lock:
+            return os.path.getsize(self.path) if os.path.exists(self.path) else 0
+
+    def truncate(self, base=None, keep_from=None):
+        """Drop records, optionally recording the snapshot they now start from.
+
+        Records appended after the `keep_from` offset are kept, so changes made
+        while a snapshot was being written are not lost.
+        """
+        with self.lock:
+            tail = b''
+            if keep_from is not None and os.path.exists(self.path):
+                with open(self.path, 'rb') as f:
+                    f.seek(keep_from)
+                    tail = f.read()
+
+            # Rewrite through a temporary file so a crash here cannot lose the kept tail
+            durability = DURABILITY_ALWAYS if self.fsync else DURABILITY_NONE
+            with atomic_write(self.path, 'w', durability, encoding='utf-8') as f:
+                if base is not None:
+                    f.write(json.dumps({
+                        'type': SNAPSHOT_BASE,
+                        'timestamp': datetime.datetime.now().isoformat(),
+                        'data': base
+                    }, default=json_default) + '\n')
+                f.write(tail.decode('utf-8'))
+
+            self.base = base
+            self.record_count = tail.count(b'\n')
@@ -98,7 +98,7 @@ class SmartSprintCLI:
                 
                 # Show assigned developer name and status
                 if ticket.get('assigned_to') is not None:
-                    dev = next((d for d in self.system.developers if d['id'] == ticket['assigned_to']), None)
+                    dev = self.system.get_developer(ticket['assigned_to'])
                     if dev:
                         print(f"Assigned to: {dev['name']} (Status: {ticket['status']})")
                     else:
@@ -182,7 +182,7 @@ class SmartSprintCLI:
         ticket_id = int(input("Enter ticket ID: "))
         
         # Check if the ticket exists
-        ticket = next((t for t in self.system.tickets if t['id'] == ticket_id), None)
+        ticket = self.system.get_ticket(ticket_id)
         if not ticket:
             print(f"Error: Ticket with ID {ticket_id} not found.")
             print("Available ticket IDs:")
@@ -198,7 +198,7 @@ class SmartSprintCLI:
             return
         
         if ticket.get('assigned_to') is not None:
-            dev = next((d for d in self.system.developers if d['id'] == ticket['assigned_to']), None)
+            dev = self.system.get_developer(ticket['assigned_to'])
             if dev:
                 print(f"This ticket is already assigned to {dev['name']} (Status: {ticket['status']}).")
                 reassign = input("Would you like to reassign it to a different developer? (y/n): ").lower()
@@ -220,7 +220,7 @@ class SmartSprintCLI:
         print("Recommended Developers (with historical performance):")
         
         for i, rec in enumerate(recommendations, 1):
-            dev = next((d for d in self.system.developers if d['id'] == rec['developer_id']), None)
+            dev = self.system.get_developer(rec['developer_id'])
             if dev:
                 availability = dev['availability'] - dev['current_workload']
                 # Format availability to show negative values in parentheses
@@ -244,7 +244,7 @@ class SmartSprintCLI:
         show_timeline = input("\nWould you like to see the estimated timeline for the top recommended developer? (y/n): ").lower()
         if show_timeline == 'y' and recommendations:
             top_dev_id = recommendations[0]['developer_id']
-            top_dev = next((d for d in self.system.developers if d['id'] == top_dev_id), None)
+            top_dev = self.system.get_developer(top_dev_id)
             
             if top_dev:
                 # Get timeline estimate
@@ -273,7 +273,7 @@ class SmartSprintCLI:
                     developer_id = recommendations[choice_num-1]['developer_id']
                     # Assign the selected developer
                     if self.system.assign_developer_to_ticket(ticket_id, developer_id):
-                        dev = next((d for d in self.system.developers if d['id'] == developer_id), None)
+                        dev = self.system.get_developer(developer_id)
                         print(f"Developer {dev['name']} assigned to ticket '{ticket['title']}'")
                     else:
                         print("Assignment failed. The developer may not have enough availability for this ticket.")
@@ -294,7 +294,7 @@ class SmartSprintCLI:
         
         if self.system.complete_ticket(ticket_id, completion_time, revisions, sentiment_score):
             print("Ticket completed successfully!")
-            ticket = next((t for t in self.system.tickets if t['id'] == ticket_id), None)
+            ticket = self.system.get_ticket(ticket_id)
             if ticket:
                 print(f"Ticket '{ticket['title']}' marked as completed")
         else:
@@ -325,7 +325,7 @@ class SmartSprintCLI:
             print("No performance data found for this developer.")
             return
         
-        dev = next((d for d in self.system.developers if d['id'] == developer_id), None)
+        dev = self.system.get_developer(developer_id)
         if dev:
             print(f"Developer: {dev['name']}")
             print(f"Average Completion Time: {performance['average_completion_time']:.1f} hours")
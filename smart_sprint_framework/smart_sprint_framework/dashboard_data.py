@@ -2,17 +2,18 @@ import datetime
 import numpy as np
 from collections import defaultdict, Counter
 import ast  # For parsing string representations of lists
+from ticket_index import summarize
 
 class DashboardDataGenerator:
     def __init__(self):
         pass
     
-    def generate_dashboard_data(self, tickets, developers, performance_data):
+    def generate_dashboard_data(self, tickets, developers, performance_data, summary_counts=None, completion_percentiles=None):
         """Generate comprehensive data for dashboard visualization"""
         dashboard_data = {
-            'summary': self._generate_summary_data(tickets, developers),
+            'summary': self._generate_summary_data(tickets, developers, summary_counts),
             'ticket_trends': self._generate_ticket_trends(tickets),
-            'developer_performance': self._generate_developer_performance_data(developers, performance_data),
+            'developer_performance': self._generate_developer_performance_data(developers, performance_data, completion_percentiles),
             'priority_distribution': self._generate_priority_distribution(tickets),
             'complexity_analysis': self._generate_complexity_analysis(tickets),
             'workload_distribution': self._generate_workload_distribution(developers),
@@ -22,23 +23,24 @@ class DashboardDataGenerator:
         
         return dashboard_data
     
-    def _generate_summary_data(self, tickets, developers):
-        """Generate summary statistics"""
-        total_tickets = len(tickets)
-        completed_tickets = len([t for t in tickets if t['status'] == 'completed'])
-        in_progress_tickets = len([t for t in tickets if t['status'] == 'in_progress'])
-        backlog_tickets = len([t for t in tickets if t['status'] == 'backlog'])
-        
-        total_workload = sum(dev['current_workload'] for dev in developers)
-        total_availability = sum(dev['availability'] for dev in developers)
+    def _generate_summary_data(self, tickets, developers, summary_counts=None):
+        """Generate summary statistics, from precomputed counters when given"""
+        counts = summary_counts or summarize(tickets, developers)
+        total_tickets = counts['total_tickets']
+        completed_tickets = counts['status_counts'].get('completed', 0)
+        in_progress_tickets = counts['status_counts'].get('in_progress', 0)
+        backlog_tickets = counts['status_counts'].get('backlog', 0)
+        
+        total_workload = counts['total_workload']
+        total_availability = counts['total_availability']
         utilization_rate = (total_workload / total_availability * 100) if total_availability > 0 else 0
         
         # Calculate completion rate
         completion_rate = (completed_tickets / total_tickets * 100) if total_tickets > 0 else 0
         
         # Calculate average completion time
-        completed_with_time = [t for t in tickets if t['status'] == 'completed' and t.get('completion_time')]
-        avg_completion_time = np.mean([t['completion_time'] for t in completed_with_time]) if completed_with_time else 0
+        completed_with_time = counts['completed_with_time']
+        avg_completion_time = counts['completion_time_total'] / completed_with_time if completed_with_time else 0
         
         return {
             'total_tickets': total_tickets,
@@ -74,8 +76,8 @@ class DashboardDataGenerator:
         
         return trend_data
     
-    def _generate_developer_performance_data(self, developers, performance_data):
-        """Generate developer performance metrics"""
+    def _generate_developer_performance_data(self, developers, performance_data, completion_percentiles=None):
+        """Generate developer performance metrics, with completion time percentiles per developer id when given"""
         performance_metrics = []
         
         for dev in developers:
@@ -120,6 +122,12 @@ class DashboardDataGenerator:
                 'current_workload': dev['current_workload'],
                 'skills': skills  # Ensure skills is a list
             })
+            
+            if completion_percentiles is not None:
+                percentiles = completion_percentiles.get(dev_id) or {}
+                for key in ('p50', 'p80', 'p95'):
+                    value = percentiles.get(key)
+                    performance_metrics[-1][f'completion_time_{key}'] = round(value, 1) if value is not None else None
         
         return performance_metrics
     
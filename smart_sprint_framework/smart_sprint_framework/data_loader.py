@@ -0,0 +1,156 @@
+import ast
+import json
+import os
+import pandas as pd
+
+# Defaults for developer fields that are missing or not numeric
+DEFAULT_AVAILABILITY = 40
+DEFAULT_EXPERIENCE_LEVEL = 3
+
+# Key columns every version of each data file has; a header without them
+# was cut short or belongs to some other file
+KEY_COLUMNS = {
+    'developers_small.csv': ['id', 'name'],
+    'sprint_documents_small.csv': ['id', 'title'],
+    'performance_data_small.csv': ['developer_id', 'ticket_id']
+}
+
+
+def _parse_skills(value):
+    """Parse a skills cell written as a JSON list, a Python list literal or comma-separated text"""
+    if not isinstance(value, str):
+        return value
+    try:
+        return json.loads(value)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return [skill.strip() for skill in value.split(',')]
+
+
+def _parse_unique(series, parser):
+    """Apply a parser once per distinct value instead of once per row"""
+    parsed = {value: parser(value) for value in series.dropna().unique()}
+
+    def lookup(value):
+        result = parsed.get(value, value) if isinstance(value, str) else value
+        # Rows sharing a value still get their own list
+        return list(result) if isinstance(result, list) else result
+
+    return series.map(lookup)
+
+
+def _numeric(series, default, dtype):
+    """Coerce a column to numbers, replacing missing or invalid values with default"""
+    return pd.to_numeric(series, errors='coerce').fillna(default).astype(dtype)
+
+
+def _optional_int(series):
+    """Coerce a column to Python ints, with None where the value is missing or invalid"""
+    numbers = pd.to_numeric(series, errors='coerce')
+    return numbers.astype('Int64').astype(object).where(numbers.notna(), None)
+
+
+def check_data_file(path, content=None):
+    """Return a description of what is wrong with a data file, or None if it looks complete.
+
+    Checks the header against KEY_COLUMNS and that the file ends with a
+    newline, which catches files cut short by a write that never finished.
+    Other schema differences are left to the loader.
+    """
+    if content is None:
+        with open(path, 'rb') as f:
+            content = f.read()
+
+    if not content.strip():
+        return 'file is empty'
+    if not content.endswith(b'\n'):
+        return 'last line is incomplete'
+
+    header = content.split(b'\n', 1)[0].decode('utf-8', errors='replace').strip()
+    columns = [column.strip().strip('"') for column in header.split(',')]
+    missing = [column for column in KEY_COLUMNS.get(os.path.basename(path), []) if column not in columns]
+    if missing:
+        return f"missing columns: {', '.join(missing)}"
+    return None
+
+
+def to_records(df):
+    """Convert a normalized frame to a list of dicts with native Python values"""
+    return df.to_dict('records')
+
+
+def normalize_developers(df):
+    """Parse skills and coerce numeric developer fields column-wise.
+
+    Returns the cleaned frame and the index labels of rows dropped for
+    missing names or skills.
+    """
+    df = df.copy()
+    df['skills'] = _parse_unique(df['skills'], _parse_skills)
+    df['current_workload'] = _numeric(df['current_workload'], 0, float)
+    df['availability'] = _numeric(df['availability'], DEFAULT_AVAILABILITY, float)
+    df['experience_level'] = _numeric(df['experience_level'], DEFAULT_EXPERIENCE_LEVEL, int)
+
+    # Validate required fields
+    has_name = df['name'].notna() & (df['name'].astype(str) != '')
+    has_skills = df['skills'].map(lambda skills: bool(skills) if isinstance(skills, (list, str)) else False)
+    valid = has_name & has_skills
+    return df[valid], list(df.index[~valid])
+
+
+def normalize_tickets(df):
+    """Split tasks, coerce assignees and statuses, and fix assigned backlog tickets column-wise.
+
+    Returns the cleaned frame and the ids of tickets whose status was fixed.
+    """
+    df = df.copy()
+
+    # Convert tasks from comma-separated text to lists
+    split_tasks = df['tasks'].astype(object).str.strip().str.split(r'\s*,\s*', regex=True)
+    df['tasks'] = [tasks if isinstance(tasks, list) else [] for tasks in split_tasks]
+
+    df['assigned_to'] = _optional_int(df['assigned_to'])
+
+    status = df['status'].astype(object)
+    missing_status = status.isna() | (status.astype(str) == 'nan')
+    df['status'] = status.where(~missing_status, 'backlog').astype(str)
+
+    # Ensure logical flow - if ticket is assigned but status is backlog, set to in_progress
+    needs_fix = df['assigned_to'].notna() & (df['status'] == 'backlog')
+    df.loc[needs_fix, 'status'] = 'in_progress'
+    fixed_ids = df.loc[needs_fix, 'id'].tolist()
+
+    # Add entities field if missing
+    if 'entities' not in df.columns:
+        df['entities'] = [
+            {'priorities': ['medium'], 'dependencies': [], 'deadlines': [], 'tasks': []}
+            for _ in range(len(df))
+        ]
+
+    return df, fixed_ids
+
+
+def normalize_metrics(df):
+    """Coerce performance metric columns, dropping rows with invalid values.
+
+    Returns the cleaned frame and the number of rows dropped.
+    """
+    df = df.copy()
+    int_columns = ['developer_id', 'ticket_id', 'revisions']
+    float_columns = ['completion_time', 'sentiment_score']
+
+    valid = pd.Series(True, index=df.index)
+    for column in int_columns + float_columns:
+        df[column] = pd.to_numeric(df[column], errors='coerce')
+        valid &= df[column].notna()
+
+    df = df[valid].copy()
+    for column in int_columns:
+        df[column] = df[column].astype(int)
+    for column in float_columns:
+        df[column] = df[column].astype(float)
+
+    return df, int((~valid).sum())
@@ -1,16 +1,235 @@
 import sqlite3
 import json
 import os
+import threading
+import weakref
+import contextlib
 from datetime import datetime
 
+# Connection settings: WAL lets readers run alongside the writer, and
+# synchronous=NORMAL is durable in WAL mode without an fsync per commit
+CONNECTION_PRAGMAS = [
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA cache_size=-20000',  # ~20 MB page cache
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA busy_timeout=5000'
+]
+
+# Insert statements shared by the single-row and bulk write methods
+DEVELOPER_INSERT = '''
+INSERT INTO developers (id, name, skills, availability, current_workload, experience_level)
+VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+TICKET_INSERT = '''
+INSERT INTO tickets (id, title, description, priority, complexity, estimated_hours, status, tasks,
+                     assigned_to, entities, dependencies, deadline, completion_time, jira_id)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+METRIC_INSERT = '''
+INSERT INTO performance_metrics (developer_id, ticket_id, completion_time, revisions, sentiment_score, timestamp)
+VALUES (?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))
+'''
+
+# Secondary indexes. The filter columns lead and created_at follows, so
+# filtered board queries can walk an index in created_at order
+INDEXES = [
+    'CREATE INDEX IF NOT EXISTS idx_tickets_status ON tickets(status, created_at)',
+    'CREATE INDEX IF NOT EXISTS idx_tickets_assigned_to ON tickets(assigned_to, created_at)',
+    'CREATE INDEX IF NOT EXISTS idx_tickets_created_at ON tickets(created_at)',
+    'CREATE INDEX IF NOT EXISTS idx_performance_metrics_developer ON performance_metrics(developer_id, timestamp)',
+    'CREATE INDEX IF NOT EXISTS idx_comments_ticket ON comments(ticket_id, timestamp)'
+]
+
+# Default number of rows per page for the paginated queries
+DEFAULT_PAGE_SIZE = 50
+
+TICKET_FIELDS = [
+    'id', 'title', 'description', 'priority', 'complexity', 'estimated_hours', 'status', 'tasks',
+    'assigned_to', 'entities', 'dependencies', 'deadline', 'completion_time', 'jira_id',
+    'created_at', 'updated_at'
+]
+
+# Ticket columns stored as JSON text
+TICKET_JSON_FIELDS = ('tasks', 'entities', 'dependencies')
+
+COMMENT_INSERT = '''
+INSERT INTO comments (ticket_id, developer_id, comment, sentiment_label, sentiment_score)
+VALUES (?, ?, ?, ?, ?)
+'''
+
+def _developer_row(developer):
+    return (
+        developer.get('id'),
+        developer['name'],
+        json.dumps(developer['skills']),
+        developer['availability'],
+        developer['current_workload'],
+        developer.get('experience_level', 3)
+    )
+
+def _ticket_row(ticket):
+    return (
+        ticket.get('id'),
+        ticket['title'],
+        ticket['description'],
+        ticket['priority'],
+        ticket['complexity'],
+        ticket['estimated_hours'],
+        ticket['status'],
+        json.dumps(ticket.get('tasks', [])),
+        ticket.get('assigned_to'),
+        json.dumps(ticket.get('entities', {})),
+        json.dumps(ticket.get('dependencies', [])),
+        ticket.get('deadline'),
+        ticket.get('completion_time'),
+        ticket.get('jira_id')
+    )
+
+def _metric_row(metric):
+    return (
+        metric['developer_id'],
+        metric['ticket_id'],
+        metric['completion_time'],
+        metric['revisions'],
+        metric['sentiment_score'],
+        metric.get('timestamp')
+    )
+
+def _comment_row(comment):
+    return (
+        comment['ticket_id'],
+        comment['developer_id'],
+        comment['comment'],
+        comment.get('sentiment_label'),
+        comment.get('sentiment_score')
+    )
+
+class TicketRow(dict):
+    """Ticket dict whose JSON columns are decoded on first access.
+    
+    Listing code that only reads ids, statuses and hours never pays for
+    parsing tasks, entities or dependencies. Every read path (indexing, get,
+    iteration of values or items, copying, comparison and JSON encoding)
+    sees decoded values, so a TicketRow can be used wherever a ticket dict is.
+    """
+    __slots__ = ('_decoded',)
+    
+    # No __init__: rows are built by the C dict constructor, and JSON fields
+    # count as raw until _decode records them in _decoded
+    def _decode(self, key):
+        if key not in TICKET_JSON_FIELDS:
+            return
+        try:
+            decoded = self._decoded
+        except AttributeError:
+            decoded = self._decoded = set()
+        if key not in decoded:
+            decoded.add(key)
+            value = dict.get(self, key)
+            if isinstance(value, str):
+                dict.__setitem__(self, key, json.loads(value))
+    
+    def _decode_all(self):
+        for key in TICKET_JSON_FIELDS:
+            self._decode(key)
+    
+    def _mark_decoded(self, key):
+        if key in TICKET_JSON_FIELDS:
+            try:
+                self._decoded.add(key)
+            except AttributeError:
+                self._decoded = {key}
+    
+    def __getitem__(self, key):
+        self._decode(key)
+        return dict.__getitem__(self, key)
+    
+    def get(self, key, default=None):
+        self._decode(key)
+        return dict.get(self, key, default)
+    
+    def __setitem__(self, key, value):
+        self._mark_decoded(key)
+        dict.__setitem__(self, key, value)
+    
+    def __delitem__(self, key):
+        self._mark_decoded(key)
+        dict.__delitem__(self, key)
+    
+    def pop(self, key, *default):
+        self._decode(key)
+        return dict.pop(self, key, *default)
+    
+    def setdefault(self, key, default=None):
+        self._decode(key)
+        return dict.setdefault(self, key, default)
+    
+    def update(self, *args, **kwargs):
+        updates = dict(*args, **kwargs)
+        for key in updates:
+            self._mark_decoded(key)
+        dict.update(self, updates)
+    
+    def __iter__(self):
+        # Defining __iter__ stops dict() and {**row} from copying the raw JSON text
+        return dict.__iter__(self)
+    
+    def values(self):
+        self._decode_all()
+        return dict.values(self)
+    
+    def items(self):
+        self._decode_all()
+        return dict.items(self)
+    
+    def copy(self):
+        self._decode_all()
+        return dict(dict.items(self))
+    
+    def __eq__(self, other):
+        self._decode_all()
+        if isinstance(other, TicketRow):
+            other._decode_all()
+        return dict.__eq__(self, other)
+    
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+    
+    def __repr__(self):
+        self._decode_all()
+        return dict.__repr__(self)
+    
+    def __reduce__(self):
+        return (dict, (self.copy(),))
+
+class _ThreadConnection:
+    """Holds one thread's connection; the thread-local drops it when the thread ends"""
+    __slots__ = ('conn', '__weakref__')
+    
+    def __init__(self, conn):
+        self.conn = conn
+
+def _release_connection(connections, lock, conn):
+    """Close a connection whose thread has ended and forget it"""
+    with lock:
+        connections.discard(conn)
+    conn.close()
+
 class DatabaseManager:
     def __init__(self, db_path='smart_sprint.db'):
         self.db_path = db_path
+        self._local = threading.local()
+        self._connections = set()
+        self._connections_lock = threading.Lock()
         self.initialize_database()
     
     def initialize_database(self):
         """Create database tables if they don't exist"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
         cursor = conn.cursor()
         
         # Create developers table
@@ -40,6 +259,8 @@ class DatabaseManager:
             entities TEXT,  -- JSON object
             dependencies TEXT,  -- JSON array
             deadline TEXT,
+            completion_time REAL,
+            jira_id TEXT,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (assigned_to) REFERENCES developers(id)
@@ -76,37 +297,97 @@ class DatabaseManager:
         )
         ''')
         
+        # Add columns introduced after the tickets table was first created
+        existing_columns = {row['name'] for row in cursor.execute('PRAGMA table_info(tickets)')}
+        for column, column_type in [('completion_time', 'REAL'), ('jira_id', 'TEXT')]:
+            if column not in existing_columns:
+                cursor.execute(f'ALTER TABLE tickets ADD COLUMN {column} {column_type}')
+        
+        for index in INDEXES:
+            cursor.execute(index)
+        
         conn.commit()
-        conn.close()
     
     def get_connection(self):
-        """Get a database connection"""
-        return sqlite3.connect(self.db_path)
+        """Get this thread's pooled database connection, opening it on first use.
+        
+        The connection is closed when its thread ends, so short-lived request
+        threads do not leave connections behind.
+        """
+        holder = getattr(self._local, 'connection', None)
+        if holder is None:
+            # Each connection is only used by the thread that opened it; check_same_thread
+            # is off so close() can release connections from any thread
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            holder = _ThreadConnection(conn)
+            weakref.finalize(holder, _release_connection, self._connections, self._connections_lock, conn)
+            self._local.connection = holder
+            with self._connections_lock:
+                self._connections.add(conn)
+        return holder.conn
+    
+    @contextlib.contextmanager
+    def transaction(self):
+        """Unit of work: every write made inside the block commits together or not at all.
+        
+        Single-row and bulk methods called inside the block skip their own
+        commit. A nested transaction joins the outermost one.
+        """
+        conn = self.get_connection()
+        if getattr(self._local, 'in_transaction', False):
+            yield conn
+            return
+        
+        # Take the write lock up front so the unit of work cannot fail halfway on a busy database
+        conn.execute('BEGIN IMMEDIATE')
+        self._local.in_transaction = True
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._local.in_transaction = False
+    
+    def _commit(self, conn):
+        """Commit a single write unless it is part of an open transaction"""
+        if not getattr(self._local, 'in_transaction', False):
+            conn.commit()
+    
+    def _insert_many(self, query, rows):
+        with self.transaction() as conn:
+            conn.executemany(query, rows)
+        return len(rows)
+    
+    def close(self):
+        """Close every pooled connection"""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
     
     # Developer operations
     def add_developer(self, developer):
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('''
-        INSERT INTO developers (name, skills, availability, current_workload, experience_level)
-        VALUES (?, ?, ?, ?, ?)
-        ''', (
-            developer['name'],
-            json.dumps(developer['skills']),
-            developer['availability'],
-            developer['current_workload'],
-            developer.get('experience_level', 3)
-        ))
+        cursor.execute(DEVELOPER_INSERT, _developer_row(developer))
         
         developer_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        self._commit(conn)
         return developer_id
     
+    def add_developers(self, developers):
+        """Insert many developers in one transaction, returning the number inserted"""
+        return self._insert_many(DEVELOPER_INSERT, [_developer_row(developer) for developer in developers])
+    
     def get_developers(self):
         conn = self.get_connection()
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
         cursor.execute('SELECT * FROM developers')
@@ -117,7 +398,6 @@ class DatabaseManager:
             developer['skills'] = json.loads(developer['skills'])
             developers.append(developer)
         
-        conn.close()
         return developers
     
     def update_developer(self, developer_id, updates):
@@ -140,54 +420,94 @@ class DatabaseManager:
             query = f"UPDATE developers SET {', '.join(update_fields)} WHERE id = ?"
             values.append(developer_id)
             cursor.execute(query, values)
-            conn.commit()
-        
-        conn.close()
+            self._commit(conn)
     
     # Ticket operations
     def add_ticket(self, ticket):
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('''
-        INSERT INTO tickets (title, description, priority, complexity, estimated_hours, status, tasks, assigned_to, entities, dependencies, deadline)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            ticket['title'],
-            ticket['description'],
-            ticket['priority'],
-            ticket['complexity'],
-            ticket['estimated_hours'],
-            ticket['status'],
-            json.dumps(ticket.get('tasks', [])),
-            ticket.get('assigned_to'),
-            json.dumps(ticket.get('entities', {})),
-            json.dumps(ticket.get('dependencies', [])),
-            ticket.get('deadline')
-        ))
+        cursor.execute(TICKET_INSERT, _ticket_row(ticket))
         
         ticket_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        self._commit(conn)
         return ticket_id
     
-    def get_tickets(self):
+    def add_tickets(self, tickets):
+        """Insert many tickets in one transaction, returning the number inserted"""
+        return self._insert_many(TICKET_INSERT, [_ticket_row(ticket) for ticket in tickets])
+    
+    def get_tickets(self, columns=None):
+        """Get all tickets, newest first, as TicketRow dicts.
+        
+        `columns` limits the query to the given ticket fields, so listings can
+        skip the large JSON columns entirely.
+        """
         conn = self.get_connection()
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
-        cursor.execute('SELECT * FROM tickets ORDER BY created_at DESC')
-        tickets = []
-        
-        for row in cursor.fetchall():
-            ticket = dict(row)
-            ticket['tasks'] = json.loads(ticket['tasks'])
-            ticket['entities'] = json.loads(ticket['entities'])
-            ticket['dependencies'] = json.loads(ticket['dependencies'])
-            tickets.append(ticket)
-        
-        conn.close()
-        return tickets
+        cursor.execute(f'SELECT {self._ticket_projection(columns)} FROM tickets ORDER BY created_at DESC')
+        return self._ticket_rows(cursor)
+    
+    def _ticket_rows(self, cursor, limit=None):
+        # Zipping with the column names is much faster than dict(sqlite3.Row)
+        names = [description[0] for description in cursor.description]
+        cursor.row_factory = None
+        rows = cursor.fetchall() if limit is None else cursor.fetchmany(limit)
+        return [TicketRow(zip(names, row)) for row in rows]
+    
+    def _ticket_projection(self, columns, required=()):
+        if columns is None:
+            return '*'
+        
+        columns = list(dict.fromkeys(list(columns) + [column for column in required if column not in columns]))
+        unknown = [column for column in columns if column not in TICKET_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown ticket columns: {', '.join(unknown)}")
+        return ', '.join(columns)
+    
+    def get_tickets_page(self, status=None, assigned_to=None, priority=None, cursor=None, limit=DEFAULT_PAGE_SIZE,
+                         columns=None):
+        """Get one page of tickets, newest first, using keyset pagination.
+        
+        Returns (tickets, next_cursor). Pass next_cursor back to get the
+        following page; it is None on the last page. Each page costs the same
+        however deep into the table it is, unlike OFFSET. A `columns`
+        projection always includes id and created_at, which the cursor needs.
+        """
+        conditions = []
+        params = []
+        for column, value in [('status', status), ('assigned_to', assigned_to), ('priority', priority)]:
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        
+        if cursor:
+            created_at, ticket_id = self._parse_cursor(cursor)
+            conditions.append("(created_at, id) < (?, ?)")
+            params.extend([created_at, ticket_id])
+        
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        projection = self._ticket_projection(columns, required=('id', 'created_at'))
+        query = f"SELECT {projection} FROM tickets {where} ORDER BY created_at DESC, id DESC LIMIT ?"
+        # Fetch one extra row to tell whether another page follows
+        params.append(limit + 1)
+        
+        cursor = self.get_connection().execute(query, params)
+        tickets = self._ticket_rows(cursor, limit)
+        
+        next_cursor = None
+        if cursor.fetchone() is not None:
+            last = tickets[-1]
+            next_cursor = f"{last['created_at']}|{last['id']}"
+        return tickets, next_cursor
+    
+    def _parse_cursor(self, cursor):
+        try:
+            created_at, ticket_id = cursor.rsplit('|', 1)
+            return created_at, int(ticket_id)
+        except (AttributeError, ValueError):
+            raise ValueError(f"Invalid page cursor: {cursor!r}")
     
     def update_ticket(self, ticket_id, updates):
         conn = self.get_connection()
@@ -210,34 +530,25 @@ class DatabaseManager:
             query = f"UPDATE tickets SET {', '.join(update_fields)} WHERE id = ?"
             values.append(ticket_id)
             cursor.execute(query, values)
-            conn.commit()
-        
-        conn.close()
+            self._commit(conn)
     
     # Performance metrics operations
     def add_performance_metric(self, metric):
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('''
-        INSERT INTO performance_metrics (developer_id, ticket_id, completion_time, revisions, sentiment_score)
-        VALUES (?, ?, ?, ?, ?)
-        ''', (
-            metric['developer_id'],
-            metric['ticket_id'],
-            metric['completion_time'],
-            metric['revisions'],
-            metric['sentiment_score']
-        ))
+        cursor.execute(METRIC_INSERT, _metric_row(metric))
         
         metric_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        self._commit(conn)
         return metric_id
     
+    def add_performance_metrics(self, metrics):
+        """Insert many performance metrics in one transaction, returning the number inserted"""
+        return self._insert_many(METRIC_INSERT, [_metric_row(metric) for metric in metrics])
+    
     def get_performance_metrics(self, developer_id=None):
         conn = self.get_connection()
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
         if developer_id:
@@ -246,7 +557,6 @@ class DatabaseManager:
             cursor.execute('SELECT * FROM performance_metrics ORDER BY timestamp DESC')
         
         metrics = [dict(row) for row in cursor.fetchall()]
-        conn.close()
         return metrics
     
     # Comments operations for sentiment analysis
@@ -254,25 +564,18 @@ class DatabaseManager:
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute('''
-        INSERT INTO comments (ticket_id, developer_id, comment, sentiment_label, sentiment_score)
-        VALUES (?, ?, ?, ?, ?)
-        ''', (
-            comment['ticket_id'],
-            comment['developer_id'],
-            comment['comment'],
-            comment.get('sentiment_label'),
-            comment.get('sentiment_score')
-        ))
+        cursor.execute(COMMENT_INSERT, _comment_row(comment))
         
         comment_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        self._commit(conn)
         return comment_id
     
+    def add_comments(self, comments):
+        """Insert many comments in one transaction, returning the number inserted"""
+        return self._insert_many(COMMENT_INSERT, [_comment_row(comment) for comment in comments])
+    
     def get_comments(self, ticket_id=None):
         conn = self.get_connection()
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
         if ticket_id:
@@ -281,7 +584,6 @@ class DatabaseManager:
             cursor.execute('SELECT * FROM comments ORDER BY timestamp DESC')
         
         comments = [dict(row) for row in cursor.fetchall()]
-        conn.close()
         return comments
     
     # Utility methods
@@ -292,7 +594,10 @@ class DatabaseManager:
         
         os.makedirs(os.path.dirname(backup_path), exist_ok=True)
         
-        # Create backup
-        import shutil
-        shutil.copy2(self.db_path, backup_path)
+        # Use the online backup API so the copy includes pages still in the WAL
+        backup_conn = sqlite3.connect(backup_path)
+        try:
+            self.get_connection().backup(backup_conn)
+        finally:
+            backup_conn.close()
         return backup_path
\ No newline at end of file
@@ -0,0 +1,186 @@
+import math
+from error_handler import ConflictError
+
+
+def _is_missing(value):
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def parse_dependencies(value):
+    """Return the ticket ids in a dependencies value.
+
+    Tickets store dependencies as a list, as comma-separated text from the
+    CSV files, as a single number or not at all. Numeric ids become ints so
+    they compare equal to ticket ids.
+    """
+    if _is_missing(value):
+        return []
+    if isinstance(value, str):
+        value = [item.strip() for item in value.split(',') if item.strip()]
+    elif not isinstance(value, (list, tuple, set)):
+        value = [value]
+
+    ids = []
+    for item in value:
+        if _is_missing(item):
+            continue
+        try:
+            number = float(item)
+            ids.append(int(number) if number.is_integer() else item)
+        except (TypeError, ValueError):
+            ids.append(item)
+    return ids
+
+
+# Marks the end of a ticket's dependencies during the cycle search
+_DONE = object()
+
+
+class DependencyGraph:
+    """Forward and reverse dependency edges between tickets.
+
+    `depends_on[a]` holds the tickets a waits for and `blocks[b]` the
+    tickets waiting directly on b. Edges that would close a cycle are
+    rejected. The set of tickets each ticket blocks transitively is cached
+    as a bit mask; adding or removing an edge only drops the cached masks
+    of the tickets upstream of it, which are rebuilt on the next query
+    from the still-valid masks of their dependents.
+    """
+    def __init__(self, tickets=()):
+        self.rebuild(tickets)
+
+    def rebuild(self, tickets):
+        """Rebuild the graph from the tickets' dependencies, dropping edges that close a cycle"""
+        self.depends_on = {}
+        self.blocks = {}
+        self._bits = {}
+        self._reach = {}
+
+        for ticket in tickets:
+            self._node(ticket['id'])
+            for dependency_id in parse_dependencies(ticket.get('dependencies')):
+                self._link(ticket['id'], dependency_id)
+
+        cyclic = self._back_edges()
+        for ticket_id, dependency_id in cyclic:
+            self._unlink(ticket_id, dependency_id)
+        if cyclic:
+            print(f"Warning: Ignoring {len(cyclic)} ticket dependencies that form a cycle")
+
+    def add_ticket(self, ticket_id, dependencies=None):
+        """Add a ticket and its dependencies; returns the dependencies skipped because they close a cycle"""
+        skipped = []
+        self._node(ticket_id)
+        for dependency_id in parse_dependencies(dependencies):
+            try:
+                self.add_dependency(ticket_id, dependency_id)
+            except ConflictError as e:
+                print(f"Warning: {e.message}")
+                skipped.append(dependency_id)
+        return skipped
+
+    def set_dependencies(self, ticket_id, dependencies):
+        """Replace everything a ticket depends on; returns the dependencies skipped because they close a cycle"""
+        for dependency_id in list(self.depends_on.get(ticket_id, ())):
+            self.remove_dependency(ticket_id, dependency_id)
+        return self.add_ticket(ticket_id, dependencies)
+
+    def add_dependency(self, ticket_id, dependency_id):
+        """Record that ticket_id waits for dependency_id, raising ConflictError if that closes a cycle"""
+        if dependency_id in self.depends_on.get(ticket_id, ()):
+            return
+        if ticket_id == dependency_id or self._depends(dependency_id, ticket_id):
+            raise ConflictError(f"Ticket {ticket_id} cannot depend on ticket {dependency_id}: that would create a dependency cycle")
+        self._link(ticket_id, dependency_id)
+        self._invalidate(dependency_id)
+
+    def remove_dependency(self, ticket_id, dependency_id):
+        if dependency_id in self.depends_on.get(ticket_id, ()):
+            self._unlink(ticket_id, dependency_id)
+            self._invalidate(dependency_id)
+
+    def dependents(self, ticket_id):
+        """Tickets waiting directly on ticket_id"""
+        return set(self.blocks.get(ticket_id, ()))
+
+    def blocked_count(self, ticket_id):
+        """Number of tickets that wait for ticket_id directly or through other tickets"""
+        if ticket_id not in self.blocks:
+            return 0
+        return self._reach_mask(ticket_id).bit_count()
+
+    def _node(self, ticket_id):
+        if ticket_id not in self._bits:
+            self._bits[ticket_id] = 1 << len(self._bits)
+            self.depends_on.setdefault(ticket_id, set())
+            self.blocks.setdefault(ticket_id, set())
+
+    def _link(self, ticket_id, dependency_id):
+        self._node(ticket_id)
+        self._node(dependency_id)
+        self.depends_on[ticket_id].add(dependency_id)
+        self.blocks[dependency_id].add(ticket_id)
+
+    def _unlink(self, ticket_id, dependency_id):
+        self.depends_on[ticket_id].discard(dependency_id)
+        self.blocks[dependency_id].discard(ticket_id)
+
+    def _depends(self, ticket_id, other_id):
+        """Whether ticket_id waits for other_id, directly or transitively"""
+        seen = {ticket_id}
+        stack = [ticket_id]
+        while stack:
+            for dependency_id in self.depends_on.get(stack.pop(), ()):
+                if dependency_id == other_id:
+                    return True
+                if dependency_id not in seen:
+                    seen.add(dependency_id)
+                    stack.append(dependency_id)
+        return False
+
+    def _invalidate(self, ticket_id):
+        """Drop the cached masks of ticket_id and every ticket it waits for"""
+        stack = [ticket_id]
+        while stack:
+            node = stack.pop()
+            if self._reach.pop(node, None) is not None or node == ticket_id:
+                stack.extend(self.depends_on.get(node, ()))
+
+    def _reach_mask(self, ticket_id):
+        """Bit mask of the tickets blocked by ticket_id, computed dependents first"""
+        stack = [(ticket_id, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node in self._reach:
+                continue
+            if expanded:
+                mask = 0
+                for dependent in self.blocks[node]:
+                    mask |= self._bits[dependent] | self._reach[dependent]
+                self._reach[node] = mask
+            else:
+                stack.append((node, True))
+                stack.extend((dependent, False) for dependent in self.blocks[node] if dependent not in self._reach)
+        return self._reach[ticket_id]
+
+    def _back_edges(self):
+        """Edges that close a cycle, found with one depth-first pass"""
+        visiting, done, back_edges = set(), set(), []
+        for start in self.depends_on:
+            if start in done:
+                continue
+            visiting.add(start)
+            stack = [(start, iter(list(self.depends_on[start])))]
+            while stack:
+                node, dependencies = stack[-1]
+                dependency_id = next(dependencies, _DONE)
+                if dependency_id is _DONE:
+                    stack.pop()
+                    visiting.discard(node)
+                    done.add(node)
+                elif dependency_id in visiting:
+                    back_edges.append((node, dependency_id))
+                elif dependency_id not in done:
+                    visiting.add(dependency_id)
+                    stack.append((dependency_id, iter(list(self.depends_on[dependency_id]))))
+        return back_edges
@@ -2,7 +2,9 @@ import json
 import numpy as np
 
 class DeveloperRecommendationEngine:
-    def __init__(self):
+    def __init__(self, performance_view='all'):
+        # Which PerformanceTracker view of each developer's history to score against
+        self.performance_view = performance_view
         self.skill_match_weights = {
             'exact': 1.0,
             'related': 0.7,
@@ -0,0 +1,81 @@
+import zlib
+from collections import OrderedDict
+
+
+def input_seed(*values):
+    """Seed derived from the given values, the same in every process (unlike hash())"""
+    return zlib.crc32(repr(values).encode())
+
+
+class StatsVersions:
+    """Counters that change whenever a developer's workload or recorded metrics change.
+
+    `version(developer_id)` changes when that developer changes; `team`
+    changes when any developer does. The epoch moves on reset(), after the
+    developer list is replaced, so versions from before never match again.
+    """
+    def __init__(self):
+        self.epoch = 0
+        self.team = (0, 0)
+        self._versions = {}
+        self._changes = 0
+
+    def reset(self):
+        self.epoch += 1
+        self._versions = {}
+        self._changes = 0
+        self.team = (self.epoch, 0)
+
+    def bump(self, developer_id):
+        self._versions[developer_id] = self._versions.get(developer_id, 0) + 1
+        self._changes += 1
+        self.team = (self.epoch, self._changes)
+
+    def version(self, developer_id):
+        return (self.epoch, self._versions.get(developer_id, 0))
+
+
+class EstimateCache:
+    """Bounded LRU mapping of estimate keys to results.
+
+    Keys hold every input a result depends on, so a stale entry is simply
+    never asked for again and ages out. Values are stored as given; callers
+    copy them before handing them out.
+    """
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        if key not in self._entries:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def get_or_compute(self, key, compute):
+        """The cached value for key, computing and storing it with compute() on a miss"""
+        if key in self._entries:
+            return self.get(key)
+        self.misses += 1
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def put(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
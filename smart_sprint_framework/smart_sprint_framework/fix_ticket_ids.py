@@ -1,5 +1,7 @@
 import pandas as pd
 import os
+from atomic_write import AtomicWriteBatch
+from ticket_ids import TicketIdSequence
 
 def fix_ticket_ids():
     # Check if files exist
@@ -23,10 +25,6 @@ def fix_ticket_ids():
         # Apply new IDs
         tickets_df['id'] = tickets_df['id'].map(id_mapping)
         
-        # Save updated tickets
-        tickets_df.to_csv('sprint_documents_small.csv', index=False)
-        print("Updated ticket IDs in sprint_documents_small.csv")
-        
         # Load performance data
         perf_df = pd.read_csv('performance_data_small.csv')
         print(f"Loaded {len(perf_df)} performance records")
@@ -34,10 +32,18 @@ def fix_ticket_ids():
         # Update ticket IDs in performance data
         perf_df['ticket_id'] = perf_df['ticket_id'].map(id_mapping)
         
-        # Save updated performance data
-        perf_df.to_csv('performance_data_small.csv', index=False)
+        # Replace both files together, so they never disagree about ticket IDs
+        with AtomicWriteBatch() as batch:
+            with batch.open('sprint_documents_small.csv', 'w', newline='') as f:
+                tickets_df.to_csv(f, index=False)
+            with batch.open('performance_data_small.csv', 'w', newline='') as f:
+                perf_df.to_csv(f, index=False)
+        print("Updated ticket IDs in sprint_documents_small.csv")
         print("Updated ticket IDs in performance_data_small.csv")
         
+        # New tickets continue after the renumbered ones
+        TicketIdSequence().reset(len(old_ids) + 1)
+        
         return True
     except Exception as e:
         print(f"Error: {e}")
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+# Column dtypes; timestamps are epoch seconds, NaN when a metric has none
+COLUMNS = {
+    'developer_id': np.int64,
+    'ticket_id': np.int64,
+    'completion_time': np.float64,
+    'revisions': np.int64,
+    'sentiment_score': np.float64,
+    'timestamp': np.float64
+}
+
+# Columns summed by group_sums
+VALUE_COLUMNS = ('completion_time', 'revisions', 'sentiment_score')
+
+
+class MetricColumns:
+    """Performance metrics stored column-wise in growable NumPy arrays.
+
+    Appends are amortized O(1): each array doubles when it fills up. Rows
+    are never changed in place, so column() and frame() can hand out
+    read-only views of the filled part without copying; a view keeps
+    showing the rows that existed when it was taken.
+    """
+    def __init__(self, capacity=1024):
+        capacity = max(capacity, 1)
+        self._arrays = {name: np.empty(capacity, dtype=dtype) for name, dtype in COLUMNS.items()}
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, developer_id, ticket_id, completion_time, revisions, sentiment_score, timestamp=None):
+        if self.size == len(self._arrays['developer_id']):
+            self._grow(self.size * 2)
+        row = self.size
+        arrays = self._arrays
+        arrays['developer_id'][row] = developer_id
+        arrays['ticket_id'][row] = ticket_id
+        arrays['completion_time'][row] = completion_time
+        arrays['revisions'][row] = revisions
+        arrays['sentiment_score'][row] = sentiment_score
+        arrays['timestamp'][row] = np.nan if timestamp is None else timestamp
+        self.size += 1
+
+    def _grow(self, capacity):
+        for name, array in self._arrays.items():
+            grown = np.empty(capacity, dtype=array.dtype)
+            grown[:self.size] = array[:self.size]
+            self._arrays[name] = grown
+
+    def column(self, name):
+        """Read-only view of one column's filled rows"""
+        view = self._arrays[name][:self.size]
+        view.flags.writeable = False
+        return view
+
+    def frame(self):
+        """DataFrame over the columns, sharing their memory"""
+        return pd.DataFrame({name: self.column(name) for name in COLUMNS}, copy=False)
+
+    def group_sums(self, key='developer_id'):
+        """Row count and sums of VALUE_COLUMNS per distinct key.
+
+        Returns (keys, counts, sums) where keys is sorted and sums maps each
+        value column to an array aligned with keys.
+        """
+        keys, inverse = np.unique(self.column(key), return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(keys))
+        sums = {
+            name: np.bincount(inverse, weights=self.column(name), minlength=len(keys))
+            for name in VALUE_COLUMNS
+        }
+        return keys, counts, sums
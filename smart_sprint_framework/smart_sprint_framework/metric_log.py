@@ -0,0 +1,82 @@
+import csv
+import io
+import os
+import threading
+import pandas as pd
+from atomic_write import resolve_durability, DURABILITY_ALWAYS
+from data_loader import normalize_metrics, to_records
+
+# Columns of performance_data_small.csv
+METRIC_FIELDS = ['developer_id', 'ticket_id', 'completion_time', 'revisions', 'sentiment_score', 'timestamp']
+
+
+def write_metrics(f, metrics, header=True):
+    """Write metrics as CSV rows to an open text file"""
+    writer = csv.DictWriter(f, fieldnames=METRIC_FIELDS, extrasaction='ignore')
+    if header:
+        writer.writeheader()
+    for metric in metrics:
+        writer.writerow({field: metric.get(field) for field in METRIC_FIELDS})
+
+
+class MetricLog:
+    """performance_data_small.csv kept as an append-only log.
+
+    Each completed ticket appends one row, so recording a metric costs the
+    same however long the history is. Saves leave the file alone; the
+    binary snapshot records the byte offset it covers, and a restart only
+    parses the rows appended after it. The file is rewritten as a whole
+    only when existing rows change, e.g. after ticket ids are renumbered;
+    set `stale` and the next save does that.
+    """
+    def __init__(self, path='performance_data_small.csv', durability=None):
+        self.path = path
+        self.fsync = resolve_durability(durability) == DURABILITY_ALWAYS
+        self.lock = threading.Lock()
+        self.stale = False
+
+    def size(self):
+        """Byte offset of the end of the log"""
+        with self.lock:
+            return os.path.getsize(self.path) if os.path.exists(self.path) else 0
+
+    def append(self, metric):
+        """Append one metric row and flush it; only the always policy syncs each row"""
+        with self.lock:
+            with open(self.path, 'a', newline='', encoding='utf-8') as f:
+                write_metrics(f, [metric], header=f.tell() == 0)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+
+    def read_from(self, offset):
+        """Return the metrics appended after byte `offset`, or None if offset is not a row boundary"""
+        with self.lock:
+            with open(self.path, 'rb') as f:
+                header = f.readline()
+                if offset < len(header):
+                    return None
+                f.seek(offset - 1)
+                if f.read(1) != b'\n':
+                    return None
+                tail = f.read()
+
+        if not tail.strip():
+            return []
+        df, invalid_count = normalize_metrics(pd.read_csv(io.BytesIO(header + tail)))
+        if invalid_count:
+            print(f"Warning: Skipped {invalid_count} invalid performance records")
+        return to_records(df)
+
+    def repair(self):
+        """Drop a row left half-written by a crash mid-append; returns True if one was dropped"""
+        with self.lock:
+            if not os.path.exists(self.path):
+                return False
+            with open(self.path, 'r+b') as f:
+                content = f.read()
+                if not content or content.endswith(b'\n'):
+                    return False
+                f.truncate(content.rfind(b'\n') + 1)
+        print(f"Warning: Dropped a partly written performance record at the end of {self.path}")
+        return True
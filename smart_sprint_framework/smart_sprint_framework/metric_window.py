@@ -0,0 +1,79 @@
+class MetricWindow:
+    """Fixed-size ring buffer of metric values with running sums.
+
+    Holds at most `capacity` entries; pushing into a full window evicts the
+    oldest one. With `max_age` (seconds), expire(now) also evicts entries
+    older than that, so the window covers the last `max_age` seconds as long
+    as metrics arrive roughly in time order. Pushes and evictions are O(1)
+    and memory never grows past `capacity` entries.
+    """
+    def __init__(self, capacity, fields, max_age=None):
+        self.capacity = capacity
+        self.fields = fields
+        self.max_age = max_age
+        self._values = [None] * capacity
+        self._times = [None] * capacity
+        self._head = 0
+        self.size = 0
+        self.sums = [0.0] * len(fields)
+        self._evictions = 0
+
+    def push(self, values, timestamp=None):
+        if self.size == self.capacity:
+            self._evict()
+        index = (self._head + self.size) % self.capacity
+        self._values[index] = values
+        self._times[index] = timestamp
+        self.size += 1
+        for i, value in enumerate(values):
+            self.sums[i] += value
+
+    def expire(self, now):
+        """Evict entries older than max_age seconds before now"""
+        if self.max_age is None:
+            return
+        cutoff = now - self.max_age
+        while self.size and self._times[self._head] < cutoff:
+            self._evict()
+
+    def _evict(self):
+        values = self._values[self._head]
+        self._values[self._head] = None
+        self._head = (self._head + 1) % self.capacity
+        self.size -= 1
+        for i, value in enumerate(values):
+            self.sums[i] -= value
+
+        # Re-add the sums from scratch now and then so float error cannot build up
+        self._evictions += 1
+        if self._evictions % self.capacity == 0:
+            self.sums = [0.0] * len(self.fields)
+            for offset in range(self.size):
+                for i, value in enumerate(self._values[(self._head + offset) % self.capacity]):
+                    self.sums[i] += value
+
+    def sum(self, field):
+        return self.sums[self.fields.index(field)]
+
+
+class DecayedStats:
+    """Exponentially decayed sums of metric values.
+
+    Every new entry first scales the existing sums by (1 - alpha), so an
+    entry's weight halves roughly every 0.69 / alpha entries. `weight` is
+    the decayed entry count; sum / weight gives a decayed mean.
+    """
+    def __init__(self, alpha, fields):
+        self.alpha = alpha
+        self.fields = fields
+        self.weight = 0.0
+        self.sums = [0.0] * len(fields)
+
+    def push(self, values):
+        keep = 1.0 - self.alpha
+        self.weight = self.weight * keep + 1.0
+        for i, value in enumerate(values):
+            self.sums[i] = self.sums[i] * keep + value
+
+    def sum(self, field):
+        return self.sums[self.fields.index(field)]
@@ -1,8 +1,28 @@
 # monte_carlo.py
 import numpy as np
 
+# Quantiles reported for every estimate: the confidence interval bounds and p80
+QUANTILES = (0.05, 0.8, 0.95)
+
+# Two-sided 95% normal quantile, for the adaptive mode's error bound
+Z_95 = 1.96
+
+
 class MonteCarloEstimator:
-    def __init__(self):
+    """Simulates task durations by scaling estimated hours with a random complexity factor.
+
+    All samples for a task are drawn in one call from the estimator's own
+    Generator, so a seed makes its estimates reproducible, and a backlog
+    of tasks is simulated as one matrix (batch_rows tasks at a time).
+
+    With a `tolerance`, tasks are instead simulated adaptively: antithetic
+    batches of `adaptive_batch` samples are drawn until the 95% error bound
+    of p80 and of the confidence interval bounds, relative to the estimated
+    hours, is within the tolerance (or `max_simulations` is reached). Such
+    estimates also report the samples used and the achieved error.
+    """
+    def __init__(self, n_simulations=1000, seed=None, batch_rows=1024, tolerance=None,
+                 adaptive_batch=256, min_batches=4, max_simulations=100000):
         self.complexity_factors = {
             1: (0.8, 1.2),
             2: (0.7, 1.3),
@@ -10,26 +30,119 @@ class MonteCarloEstimator:
             4: (0.5, 1.5),
             5: (0.4, 1.6)
         }
-    
-    def estimate_task_duration(self, estimated_hours, complexity):
-        min_factor, max_factor = self.complexity_factors[complexity]
-        
-        simulations = []
-        for _ in range(1000):
-            factor = np.random.uniform(min_factor, max_factor)
-            simulated_hours = estimated_hours * factor
-            simulations.append(simulated_hours)
-        
-        mean_duration = np.mean(simulations)
-        std_duration = np.std(simulations)
-        p80 = np.percentile(simulations, 80)
-        
-        return {
-            'estimated_hours': estimated_hours,
-            'complexity': complexity,
-            'mean_duration': mean_duration,
-            'std_duration': std_duration,
-            'p80_duration': p80,
-            'confidence_interval': (np.percentile(simulations, 5), np.percentile(simulations, 95)),
-            'risk_level': 'low' if p80 < estimated_hours * 1.3 else 'medium' if p80 < estimated_hours * 1.5 else 'high'
-        }
+        self.n_simulations = n_simulations
+        self.batch_rows = batch_rows
+        self.tolerance = tolerance
+        self.adaptive_batch = adaptive_batch
+        self.min_batches = min_batches
+        self.max_simulations = max_simulations
+        self.rng = np.random.default_rng(seed)
+        # Changes when the distributions sampled from change, e.g. as history is recorded
+        self.version = 0
+
+    def estimate_task_duration(self, estimated_hours, complexity, tolerance=None, rng=None, developer_id=None):
+        return self.estimate_task_durations([estimated_hours], [complexity], tolerance, rng,
+                                            None if developer_id is None else [developer_id])[0]
+
+    def estimate_task_durations(self, estimated_hours, complexities, tolerance=None, rng=None, developer_ids=None):
+        """Estimate many tasks at once; returns one estimate per (hours, complexity) pair.
+
+        Samples come from `rng` if given, otherwise from the estimator's
+        Generator. `developer_ids` is only used by engines that model
+        developers separately.
+        """
+        rng = self.rng if rng is None else rng
+        given_hours = list(np.asarray(estimated_hours, dtype=object).reshape(-1))
+        complexities = list(np.asarray(complexities, dtype=object).reshape(-1))
+        hours, params = self._inputs(given_hours, complexities, developer_ids)
+
+        tolerance = self.tolerance if tolerance is None else tolerance
+        if tolerance is not None:
+            return [
+                self._simulate_adaptive(hours[i], params[i:i + 1], given_hours[i], complexities[i], tolerance, rng)
+                for i in range(len(hours))
+            ]
+
+        estimates = []
+        for start in range(0, len(hours), self.batch_rows):
+            end = start + self.batch_rows
+            estimates.extend(self._simulate(hours[start:end], params[start:end], given_hours[start:end], complexities[start:end], rng))
+        return estimates
+
+    def sample_durations(self, estimated_hours, complexities, n_samples=None, rng=None, developer_ids=None):
+        """Simulated durations as a (tasks, n_samples) matrix, drawn from `rng` or the estimator's Generator"""
+        hours, params = self._inputs(estimated_hours, complexities, developer_ids)
+        rng = self.rng if rng is None else rng
+        return hours[:, None] * self._factors(params, rng.random((len(hours), n_samples or self.n_simulations)))
+
+    def rebuild(self, metrics, tickets_by_id):
+        """Recorded history is not used by the uniform ranges"""
+
+    def add(self, metric, ticket):
+        """Recorded history is not used by the uniform ranges"""
+
+    def _inputs(self, estimated_hours, complexities, developer_ids=None):
+        """Hours as floats and the factor parameters of each task"""
+        hours = np.asarray(estimated_hours, dtype=float).reshape(-1)
+        complexities = np.asarray(complexities, dtype=object).reshape(-1)
+        if len(hours) != len(complexities):
+            raise ValueError("estimated_hours and complexities must have the same length")
+        if developer_ids is not None and len(developer_ids) != len(hours):
+            raise ValueError("developer_ids and estimated_hours must have the same length")
+        return hours, self._factor_params(complexities, developer_ids)
+
+    def _factor_params(self, complexities, developer_ids):
+        """The (min, max) factor of each task's complexity"""
+        return np.array([self.complexity_factors[complexity] for complexity in complexities], dtype=float).reshape(-1, 2)
+
+    def _factors(self, params, u):
+        """Complexity factors for a (tasks, samples) matrix of uniform draws u"""
+        return params[:, :1] + (params[:, 1:] - params[:, :1]) * u
+
+    def _simulate(self, hours, params, given_hours, complexities, rng):
+        factors = self._factors(params, rng.random((len(hours), self.n_simulations)))
+        return self._summarize(hours[:, None] * factors, hours, given_hours, complexities)
+
+    def _simulate_adaptive(self, hours, params, given_hours, complexity, tolerance, rng):
+        """Draw antithetic batches for one task until its quantiles are within tolerance"""
+        half = max(self.adaptive_batch // 2, 1)
+        batches, batch_quantiles = [], []
+        while True:
+            # Each uniform draw u is paired with 1 - u, which cancels much of the sampling noise
+            u = rng.random(half)
+            batch = hours * self._factors(params, np.concatenate((u, 1 - u))[None, :])[0]
+            batches.append(batch)
+            batch_quantiles.append(np.quantile(batch, QUANTILES))
+
+            # At least two batches are needed to measure their spread
+            if len(batches) >= max(self.min_batches, 2):
+                # Batch means: the spread of the per-batch quantiles bounds the error of their average
+                spread = np.std(batch_quantiles, axis=0, ddof=1) / np.sqrt(len(batches))
+                error = float(Z_95 * spread.max() / hours) if hours else 0.0
+                if error <= tolerance or len(batches) * 2 * half >= self.max_simulations:
+                    break
+
+        simulations = np.concatenate(batches)
+        estimate = self._summarize(simulations[None, :], np.array([hours]), [given_hours], [complexity])[0]
+        estimate['samples'] = len(simulations)
+        estimate['relative_error'] = error
+        return estimate
+
+    def _summarize(self, simulations, hours, given_hours, complexities):
+        """One estimate per row of a (tasks, samples) matrix"""
+        means = simulations.mean(axis=1)
+        stds = simulations.std(axis=1)
+        low, p80, high = np.quantile(simulations, QUANTILES, axis=1)
+
+        estimates = []
+        for i, estimated_hours in enumerate(hours.tolist()):
+            estimates.append({
+                'estimated_hours': given_hours[i],
+                'complexity': complexities[i],
+                'mean_duration': float(means[i]),
+                'std_duration': float(stds[i]),
+                'p80_duration': float(p80[i]),
+                'confidence_interval': (float(low[i]), float(high[i])),
+                'risk_level': 'low' if p80[i] < estimated_hours * 1.3 else 'medium' if p80[i] < estimated_hours * 1.5 else 'high'
+            })
+        return estimates
@@ -1,50 +1,201 @@
 import datetime
+import time
+from records import PerformanceMetric, as_records
+from metric_window import MetricWindow, DecayedStats
+from metric_columns import MetricColumns, VALUE_COLUMNS
+
+# Views of a developer's performance history:
+#   all          - every metric ever recorded
+#   last_tickets - the developer's last `recent_tickets` metrics
+#   last_days    - metrics from the last `recent_days` days
+#   decayed      - every metric, weighted down exponentially as newer ones arrive
+VIEW_ALL = 'all'
+VIEW_LAST_TICKETS = 'last_tickets'
+VIEW_LAST_DAYS = 'last_days'
+VIEW_DECAYED = 'decayed'
+PERFORMANCE_VIEWS = (VIEW_ALL, VIEW_LAST_TICKETS, VIEW_LAST_DAYS, VIEW_DECAYED)
+
+WINDOW_FIELDS = ('completion_time', 'revisions', 'sentiment_score')
+
+
+def _epoch_seconds(timestamp):
+    """Parse an ISO timestamp, or return None if the metric has none"""
+    if isinstance(timestamp, str):
+        try:
+            return datetime.datetime.fromisoformat(timestamp).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
 class PerformanceTracker:
-    def __init__(self):
-        self.metrics = []
-    
+    """Performance metrics indexed by developer and by ticket.
+
+    Each developer's count and running sums of completion time, revisions
+    and sentiment are updated as metrics arrive, so the per-developer
+    statistics and the historical summary never rescan the metrics list.
+    Replace the whole list through load_metrics so the indexes follow.
+
+    Besides the all-time view, each developer has ring-buffer windows over
+    the last `recent_tickets` metrics and the last `recent_days` days (at
+    most `max_recent_entries` of them), and exponentially decayed sums with
+    factor `decay`; see PERFORMANCE_VIEWS. Metrics without a timestamp are
+    left out of the last_days window.
+
+    Every metric is also appended to a columnar store (MetricColumns) for
+    analytics over the whole history: metrics_frame() is a DataFrame view
+    of it and aggregate() a vectorized group-by.
+    """
+    def __init__(self, recent_tickets=10, recent_days=30, decay=0.2, max_recent_entries=200):
+        self.recent_tickets = recent_tickets
+        self.recent_days = recent_days
+        self.decay = decay
+        self.max_recent_entries = max_recent_entries
+        self.load_metrics([])
+
+    def load_metrics(self, metrics):
+        """Replace every metric, e.g. after loading state, and rebuild the indexes"""
+        self.metrics = as_records(PerformanceMetric, metrics)
+        self._by_developer = {}
+        self._by_ticket = {}
+        self._totals = {}
+        self._last_tickets = {}
+        self._last_days = {}
+        self._decayed = {}
+        self.columns = MetricColumns(max(len(self.metrics), 1024))
+        for metric in self.metrics:
+            self._index(metric)
+
+    def _index(self, metric):
+        developer_id = metric['developer_id']
+        self._by_developer.setdefault(developer_id, []).append(metric)
+        self._by_ticket.setdefault(metric['ticket_id'], []).append(metric)
+        # [count, completion time, revisions, sentiment]
+        totals = self._totals.setdefault(developer_id, [0, 0, 0, 0])
+        totals[0] += 1
+        totals[1] += metric['completion_time']
+        totals[2] += metric['revisions']
+        totals[3] += metric['sentiment_score']
+
+        if developer_id not in self._last_tickets:
+            self._last_tickets[developer_id] = MetricWindow(self.recent_tickets, WINDOW_FIELDS)
+            self._last_days[developer_id] = MetricWindow(self.max_recent_entries, WINDOW_FIELDS, self.recent_days * 86400)
+            self._decayed[developer_id] = DecayedStats(self.decay, WINDOW_FIELDS)
+        values = (metric['completion_time'], metric['revisions'], metric['sentiment_score'])
+        self._last_tickets[developer_id].push(values)
+        self._decayed[developer_id].push(values)
+        timestamp = _epoch_seconds(metric.get('timestamp'))
+        self.columns.append(developer_id, metric['ticket_id'], *values, timestamp)
+        if timestamp is not None:
+            self._last_days[developer_id].push(values, timestamp)
+
+    def add_metric(self, metric):
+        """Record an existing metric, e.g. one replayed from the change journal"""
+        metric = PerformanceMetric.from_mapping(metric)
+        self.metrics.append(metric)
+        self._index(metric)
+        return metric
+
     def track_performance(self, developer_id, ticket_id, completion_time, revisions, sentiment_score):
-        metric = {
+        return self.add_metric({
             'developer_id': developer_id,
             'ticket_id': ticket_id,
             'completion_time': completion_time,
             'revisions': revisions,
             'sentiment_score': sentiment_score,
             'timestamp': datetime.datetime.now().isoformat()
-        }
-        self.metrics.append(metric)
-        return metric
-    
+        })
+
+    def remap_ticket_ids(self, id_mapping):
+        """Point metrics at renumbered tickets"""
+        for metric in self.metrics:
+            if metric['ticket_id'] in id_mapping:
+                metric['ticket_id'] = id_mapping[metric['ticket_id']]
+        # Renumbering is rare; rebuilding keeps the columns free of in-place changes
+        self.load_metrics(self.metrics)
+
+    def metrics_frame(self):
+        """DataFrame of every metric sharing the columnar store's memory; timestamps are epoch seconds"""
+        return self.columns.frame()
+
+    def aggregate(self, key='developer_id'):
+        """Metric count and completion time, revisions and sentiment sums per developer_id or ticket_id"""
+        keys, counts, sums = self.columns.group_sums(key)
+        summary = {}
+        for i, key_value in enumerate(keys.tolist()):
+            totals = {'count': int(counts[i])}
+            for field in VALUE_COLUMNS:
+                totals[field] = float(sums[field][i])
+            summary[key_value] = totals
+        return summary
+
     def get_developer_metrics(self, developer_id):
-        return [m for m in self.metrics if m['developer_id'] == developer_id]
-    
+        return list(self._by_developer.get(developer_id, ()))
+
+    def get_ticket_metrics(self, ticket_id):
+        return list(self._by_ticket.get(ticket_id, ()))
+
     def calculate_velocity(self, developer_id):
-        metrics = self.get_developer_metrics(developer_id)
-        if not metrics:
+        totals = self._totals.get(developer_id)
+        if not totals:
             return 0
-        
-        total_time = sum(m['completion_time'] for m in metrics)
-        return total_time / len(metrics)
-    
+
+        return totals[1] / totals[0]
+
     def calculate_accuracy(self, developer_id):
-        metrics = self.get_developer_metrics(developer_id)
-        if not metrics:
+        totals = self._totals.get(developer_id)
+        if not totals:
+            return 0
+
+        return 1.0 / (1.0 + totals[2] * 0.1)
+
+    def calculate_sentiment(self, developer_id):
+        totals = self._totals.get(developer_id)
+        if not totals:
             return 0
-        
-        total_revisions = sum(m['revisions'] for m in metrics)
-        return 1.0 / (1.0 + total_revisions * 0.1)
-    
-    def get_historical_performance_data(self):
-        performance_summary = {}
-        
-        for dev_id in set(m['developer_id'] for m in self.metrics):
-            metrics = self.get_developer_metrics(dev_id)
-            if metrics:
-                performance_summary[dev_id] = {
-                    'velocity': self.calculate_velocity(dev_id),
-                    'accuracy': self.calculate_accuracy(dev_id),
-                    'sentiment': sum(m['sentiment_score'] for m in metrics) / len(metrics),
-                    'tickets_completed': len(metrics)
-                }
-        
-        return performance_summary
\ No newline at end of file
+
+        return totals[3] / totals[0]
+
+    def get_developer_summary(self, developer_id, view=VIEW_ALL):
+        """Velocity, accuracy, sentiment and completed ticket count, or None without metrics in the view"""
+        if developer_id not in self._totals:
+            return None
+        if view == VIEW_ALL:
+            return {
+                'velocity': self.calculate_velocity(developer_id),
+                'accuracy': self.calculate_accuracy(developer_id),
+                'sentiment': self.calculate_sentiment(developer_id),
+                'tickets_completed': self._totals[developer_id][0]
+            }
+
+        if view == VIEW_DECAYED:
+            # Decayed means use the decayed entry count; every ticket still counts as completed
+            stats = self._decayed[developer_id]
+            count, tickets_completed = stats.weight, self._totals[developer_id][0]
+        elif view == VIEW_LAST_TICKETS:
+            stats = self._last_tickets[developer_id]
+            count = tickets_completed = stats.size
+        elif view == VIEW_LAST_DAYS:
+            stats = self._last_days[developer_id]
+            stats.expire(time.time())
+            count = tickets_completed = stats.size
+        else:
+            raise ValueError(f"Unknown performance view: {view}")
+
+        if not count:
+            return None
+        return {
+            'velocity': stats.sum('completion_time') / count,
+            'accuracy': 1.0 / (1.0 + stats.sum('revisions') * 0.1),
+            'sentiment': stats.sum('sentiment_score') / count,
+            'tickets_completed': tickets_completed
+        }
+
+    def get_historical_performance_data(self, view=VIEW_ALL):
+        """Summary per developer in the given view; developers with nothing in the view are left out"""
+        summary = {}
+        for dev_id in self._totals:
+            dev_summary = self.get_developer_summary(dev_id, view)
+            if dev_summary:
+                summary[dev_id] = dev_summary
+        return summary
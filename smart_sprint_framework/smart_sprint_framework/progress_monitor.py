@@ -1,26 +1,41 @@
 import datetime
 from collections import defaultdict
 import numpy as np
+from ticket_index import summarize
+from dependency_graph import DependencyGraph
 
 class ProgressMonitor:
     def __init__(self):
         self.bottleneck_threshold = 0.8  # 80% utilization considered bottleneck
         self.slow_task_threshold = 1.5  # 50% over estimated time considered slow
     
-    def generate_progress_report(self, tickets, developers, performance_data):
-        """Generate a comprehensive progress report"""
+    def generate_progress_report(self, tickets, developers, performance_data, ticket_index=None, dependency_graph=None):
+        """Generate a comprehensive progress report.
+        
+        With a TicketIndex over `tickets`, counts and per-developer tickets
+        come from its buckets instead of scanning the ticket list; a
+        DependencyGraph over them supplies the blocking counts.
+        """
         # Calculate overall metrics
-        total_tickets = len(tickets)
-        completed_tickets = len([t for t in tickets if t['status'] == 'completed'])
-        in_progress_tickets = len([t for t in tickets if t['status'] == 'in_progress'])
-        backlog_tickets = len([t for t in tickets if t['status'] == 'backlog'])
+        if ticket_index is not None:
+            total_tickets = len(ticket_index)
+            status_counts = ticket_index.counts('status')
+        else:
+            total_tickets = len(tickets)
+            status_counts = summarize(tickets, [])['status_counts']
+        completed_tickets = status_counts.get('completed', 0)
+        in_progress_tickets = status_counts.get('in_progress', 0)
+        backlog_tickets = status_counts.get('backlog', 0)
         
         completion_rate = completed_tickets / total_tickets if total_tickets > 0 else 0
         
         # Calculate developer metrics
         developer_metrics = []
         for dev in developers:
-            dev_tickets = [t for t in tickets if t.get('assigned_to') == dev['id']]
+            if ticket_index is not None:
+                dev_tickets = ticket_index.tickets('assigned_to', dev['id'])
+            else:
+                dev_tickets = [t for t in tickets if t.get('assigned_to') == dev['id']]
             completed_dev_tickets = [t for t in dev_tickets if t['status'] == 'completed']
             
             utilization = dev['current_workload'] / dev['availability'] if dev['availability'] > 0 else 0
@@ -41,7 +56,7 @@ class ProgressMonitor:
             })
         
         # Identify bottlenecks
-        bottlenecks = self._identify_bottlenecks(developers, tickets)
+        bottlenecks = self._identify_bottlenecks(developers, tickets, dependency_graph)
         
         # Identify slow tasks
         slow_tasks = self._identify_slow_tasks(tickets)
@@ -64,9 +79,11 @@ class ProgressMonitor:
             'generated_at': datetime.datetime.now().isoformat()
         }
     
-    def _identify_bottlenecks(self, developers, tickets):
+    def _identify_bottlenecks(self, developers, tickets, dependency_graph=None):
         """Identify bottleneck developers and tasks"""
         bottlenecks = []
+        if dependency_graph is None:
+            dependency_graph = DependencyGraph(tickets)
         
         # Identify overutilized developers
         for dev in developers:
@@ -90,11 +107,8 @@ class ProgressMonitor:
         # Identify tasks with many dependencies
         for ticket in tickets:
             if ticket['status'] == 'backlog':
-                # Count how many tasks depend on this one
-                dependencies = 0
-                for other_ticket in tickets:
-                    if ticket['id'] in other_ticket.get('dependencies', []):
-                        dependencies += 1
+                # Count how many tasks depend on this one, directly or transitively
+                dependencies = dependency_graph.blocked_count(ticket['id'])
                 
                 if dependencies >= 3:  # If 3 or more tasks depend on this one
                     bottlenecks.append({
@@ -181,23 +195,28 @@ class ProgressMonitor:
         
         return insights
     
-    def get_real_time_metrics(self, tickets, developers):
-        """Get real-time metrics for dashboard"""
+    def get_real_time_metrics(self, tickets, developers, summary_counts=None):
+        """Get real-time metrics for dashboard.
+        
+        `summary_counts` (see SmartSprintSystem.get_summary_counts) replaces
+        the scan over tickets and developers when given.
+        """
+        counts = summary_counts or summarize(tickets, developers)
+        
         # Calculate current metrics
-        total_tickets = len(tickets)
-        completed_tickets = len([t for t in tickets if t['status'] == 'completed'])
-        in_progress_tickets = len([t for t in tickets if t['status'] == 'in_progress'])
-        backlog_tickets = len([t for t in tickets if t['status'] == 'backlog'])
+        total_tickets = counts['total_tickets']
+        completed_tickets = counts['status_counts'].get('completed', 0)
+        in_progress_tickets = counts['status_counts'].get('in_progress', 0)
+        backlog_tickets = counts['status_counts'].get('backlog', 0)
         
         # Calculate workload metrics
-        total_workload = sum(dev['current_workload'] for dev in developers)
-        total_availability = sum(dev['availability'] for dev in developers)
+        total_workload = counts['total_workload']
+        total_availability = counts['total_availability']
         utilization_rate = total_workload / total_availability if total_availability > 0 else 0
         
         # Calculate velocity metrics
-        completed_tickets_with_time = [t for t in tickets if t['status'] == 'completed' and t.get('completion_time')]
-        if completed_tickets_with_time:
-            avg_completion_time = sum(t['completion_time'] for t in completed_tickets_with_time) / len(completed_tickets_with_time)
+        if counts['completed_with_time']:
+            avg_completion_time = counts['completion_time_total'] / counts['completed_with_time']
         else:
             avg_completion_time = 0
         
@@ -0,0 +1,145 @@
+import math
+import numpy as np
+from records import complexity_key
+
+# Percentiles reported by CompletionSketches.percentiles
+PERCENTILES = (50, 80, 95)
+
+
+class TDigest:
+    """Mergeable sketch of a distribution that answers quantile queries.
+
+    Values are buffered and periodically merged into at most about
+    `compression` weighted centroids, kept small near the tails so extreme
+    quantiles stay accurate. Memory does not grow with the number of
+    values, and two digests merge into one describing both inputs.
+    """
+    def __init__(self, compression=100):
+        self.compression = compression
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._means = np.empty(0)
+        self._weights = np.empty(0)
+        self._buffer_means = []
+        self._buffer_weights = []
+        self._buffer_limit = 5 * compression
+
+    def add(self, value, weight=1):
+        value = float(value)
+        self._buffer_means.append(value)
+        self._buffer_weights.append(weight)
+        self.count += weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer_means) >= self._buffer_limit:
+            self._compress()
+
+    def merge(self, other):
+        """Fold another digest's values into this one"""
+        other._compress()
+        self._buffer_means.extend(other._means.tolist())
+        self._buffer_weights.extend(other._weights.tolist())
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+
+    def _q_limit(self, q):
+        """Highest quantile the centroid starting at q may reach: one unit further on the arcsine scale"""
+        k = self.compression / (2 * math.pi) * math.asin(2 * q - 1) + 1
+        if k >= self.compression / 4:
+            return 1.0
+        return (math.sin(2 * math.pi * k / self.compression) + 1) / 2
+
+    def _compress(self):
+        if not self._buffer_means:
+            return
+        means = np.concatenate((self._means, self._buffer_means))
+        weights = np.concatenate((self._weights, self._buffer_weights))
+        self._buffer_means, self._buffer_weights = [], []
+
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order].tolist(), weights[order].tolist()
+        total = sum(weights)
+
+        merged_means, merged_weights = [], []
+        current_mean, current_weight = means[0], weights[0]
+        so_far = 0.0
+        limit = total * self._q_limit(0.0)
+        for mean, weight in zip(means[1:], weights[1:]):
+            if so_far + current_weight + weight <= limit:
+                current_weight += weight
+                current_mean += (mean - current_mean) * weight / current_weight
+            else:
+                merged_means.append(current_mean)
+                merged_weights.append(current_weight)
+                so_far += current_weight
+                limit = total * self._q_limit(so_far / total)
+                current_mean, current_weight = mean, weight
+        merged_means.append(current_mean)
+        merged_weights.append(current_weight)
+
+        self._means = np.array(merged_means)
+        self._weights = np.array(merged_weights)
+
+    def quantiles(self, qs):
+        """Estimates of the quantiles qs (each between 0 and 1), or None while empty"""
+        if not self.count:
+            return None
+        self._compress()
+        # Each centroid's mean sits at the middle of its weight; the ends are pinned to min and max
+        centers = np.cumsum(self._weights) - self._weights / 2
+        positions = np.concatenate(([0.0], centers, [self.count]))
+        values = np.concatenate(([self.min], self._means, [self.max]))
+        return np.interp(np.asarray(qs, dtype=float) * self.count, positions, values).tolist()
+
+    def quantile(self, q):
+        result = self.quantiles([q])
+        return None if result is None else result[0]
+
+
+class CompletionSketches:
+    """Completion time digests per developer and per ticket complexity.
+
+    Updated as metrics arrive, so p50/p80/p95 completion times never need
+    the raw history. Complexity comes from the completed ticket.
+    """
+    def __init__(self, compression=100):
+        self.compression = compression
+        self.by_developer = {}
+        self.by_complexity = {}
+
+    def rebuild(self, metrics, tickets_by_id):
+        self.by_developer = {}
+        self.by_complexity = {}
+        for metric in metrics:
+            ticket = tickets_by_id.get(metric['ticket_id'])
+            self.add(metric, ticket.get('complexity') if ticket else None)
+
+    def add(self, metric, complexity=None):
+        completion_time = metric['completion_time']
+        developer_id = metric['developer_id']
+        if developer_id not in self.by_developer:
+            self.by_developer[developer_id] = TDigest(self.compression)
+        self.by_developer[developer_id].add(completion_time)
+
+        if complexity is not None:
+            key = complexity_key(complexity)
+            if key not in self.by_complexity:
+                self.by_complexity[key] = TDigest(self.compression)
+            self.by_complexity[key].add(completion_time)
+
+    def percentiles(self, developer_id=None, complexity=None):
+        """{'p50', 'p80', 'p95', 'count'} completion times for a developer or a complexity level, or None without data"""
+        if developer_id is not None:
+            digest = self.by_developer.get(developer_id)
+        else:
+            digest = self.by_complexity.get(complexity_key(complexity))
+        if digest is None or not digest.count:
+            return None
+
+        values = digest.quantiles([p / 100 for p in PERCENTILES])
+        result = {f'p{p}': value for p, value in zip(PERCENTILES, values)}
+        result['count'] = digest.count
+        return result
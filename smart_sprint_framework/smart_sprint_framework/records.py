@@ -0,0 +1,211 @@
+import sys
+from collections.abc import MutableMapping
+
+# Marks an unset field
+_MISSING = object()
+
+# Task lists shared between tickets, keyed by their contents. Bounded: once
+# full it starts over, so tuples no ticket uses any more are not kept alive
+_shared_tasks = {}
+SHARED_TASKS_LIMIT = 4096
+
+# The entities every CSV ticket gets when the file has no entities column
+DEFAULT_ENTITIES = {'priorities': ['medium'], 'dependencies': [], 'deadlines': [], 'tasks': []}
+
+
+class FrozenDict(dict):
+    """Read-only dict for a value shared between records; copy it with dict() to change it"""
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is shared between records and cannot be changed in place")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+_default_entities = FrozenDict((key, tuple(value)) for key, value in DEFAULT_ENTITIES.items())
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+def _share_tasks(value):
+    """Store task lists as one shared tuple per distinct list of tasks"""
+    if not isinstance(value, (list, tuple)):
+        return value
+    tasks = tuple(_intern(task) for task in value)
+    shared = _shared_tasks.get(tasks)
+    if shared is None:
+        if len(_shared_tasks) >= SHARED_TASKS_LIMIT:
+            _shared_tasks.clear()
+        shared = _shared_tasks[tasks] = tasks
+    return shared
+
+
+def _share_entities(value):
+    # Tickets with the default entities, as lists or tuples, share one read-only copy of them
+    if value == DEFAULT_ENTITIES or value == _default_entities:
+        return _default_entities
+    return value
+
+
+class Record(MutableMapping):
+    """Dict-compatible record that keeps known fields in slots.
+
+    A slotted record takes a fraction of the memory of the equivalent dict.
+    Unset fields behave like missing keys, and keys outside FIELDS go into
+    a small overflow dict so any ticket or metric shape still round-trips.
+    Iteration follows FIELDS order, then the extra keys. Field values listed
+    in SHARED are stored in a shared form (interned strings, task tuples,
+    read-only default entities); assign a new value to change one.
+    """
+    __slots__ = ('_extra',)
+    FIELDS = ()
+    SHARED = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.FIELDS)
+
+    def __init__(self, *args, **kwargs):
+        self._extra = None
+        self.update(*args, **kwargs)
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        """Return `mapping` as a record of this type, converting it if needed"""
+        if type(mapping) is cls:
+            return mapping
+        return cls(mapping.items())
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in self._field_set:
+            return getattr(self, key, default)
+        return self._extra.get(key, default) if self._extra is not None else default
+
+    def __contains__(self, key):
+        if key in self._field_set:
+            return getattr(self, key, _MISSING) is not _MISSING
+        return self._extra is not None and key in self._extra
+
+    def __setitem__(self, key, value):
+        if key in self._field_set:
+            share = self.SHARED.get(key)
+            setattr(self, key, share(value) if share else value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._field_set:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        for field in self.FIELDS:
+            if getattr(self, field, _MISSING) is not _MISSING:
+                yield field
+        if self._extra is not None:
+            yield from list(self._extra)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __eq__(self, other):
+        if isinstance(other, (Record, dict)):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __reduce__(self):
+        return (type(self), (self.to_dict(),))
+
+    def to_dict(self):
+        """A plain dict copy, for JSON encoding and callers that need a real dict"""
+        data = {}
+        for field in self.FIELDS:
+            value = getattr(self, field, _MISSING)
+            if value is not _MISSING:
+                data[field] = value
+        if self._extra is not None:
+            data.update(self._extra)
+        return data
+
+    def copy(self):
+        return self.to_dict()
+
+
+class Ticket(Record):
+    FIELDS = (
+        'id', 'title', 'description', 'priority', 'complexity', 'estimated_hours', 'status', 'tasks',
+        'assigned_to', 'entities', 'dependencies', 'deadline', 'completion_time', 'jira_id',
+        'created_at', 'updated_at'
+    )
+    __slots__ = FIELDS
+    SHARED = {
+        'priority': _intern,
+        'status': _intern,
+        'complexity': _intern,
+        'tasks': _share_tasks,
+        'entities': _share_entities
+    }
+
+
+class Developer(Record):
+    FIELDS = ('id', 'name', 'skills', 'availability', 'current_workload', 'experience_level')
+    __slots__ = FIELDS
+
+
+class PerformanceMetric(Record):
+    FIELDS = ('id', 'developer_id', 'ticket_id', 'completion_time', 'revisions', 'sentiment_score', 'timestamp')
+    __slots__ = FIELDS
+
+
+def complexity_key(complexity):
+    """Complexity levels come as ints or numeric text; normalize to ints so both group together"""
+    try:
+        return int(float(complexity))
+    except (TypeError, ValueError):
+        return complexity
+
+
+def as_records(record_type, rows):
+    """Convert a list of dict rows to records, reusing rows that already are records"""
+    return [record_type.from_mapping(row) for row in rows]
+
+
+def json_default(value):
+    """`default` hook for json.dumps: records as objects, numpy scalars as numbers, anything else as text"""
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
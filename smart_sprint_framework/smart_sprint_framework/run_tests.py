@@ -9,6 +9,26 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from tests.test_smart_sprint_system import TestSmartSprintSystem
 from tests.test_nlp_pipeline import TestNLPPipeline
 from tests.test_developer_recommendation import TestDeveloperRecommendationEngine
+from tests.test_change_journal import TestChangeJournal
+from tests.test_save_scheduler import TestSaveScheduler
+from tests.test_backup_store import TestBackupStore
+from tests.test_storage import TestDatabaseStorage
+from tests.test_database import TestDatabaseManager
+from tests.test_data_loader import TestDataLoader
+from tests.test_state_snapshot import TestStateSnapshot
+from tests.test_atomic_write import TestAtomicWrite
+from tests.test_ticket_index import TestTicketIndex
+from tests.test_dependency_graph import TestDependencyGraph
+from tests.test_records import TestRecords
+from tests.test_ticket_ids import TestTicketIdSequence
+from tests.test_performance_tracker import TestPerformanceTracker
+from tests.test_metric_log import TestMetricLog
+from tests.test_metric_columns import TestMetricColumns
+from tests.test_quantile_sketch import TestQuantileSketch
+from tests.test_monte_carlo import TestMonteCarloEstimator
+from tests.test_sprint_forecast import TestSprintForecaster
+from tests.test_estimate_cache import TestEstimateCache
+from tests.test_bootstrap_estimator import TestBootstrapEstimator
 
 def run_tests():
     """Run all tests"""
@@ -20,6 +40,26 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestSmartSprintSystem))
     suite.addTests(loader.loadTestsFromTestCase(TestNLPPipeline))
     suite.addTests(loader.loadTestsFromTestCase(TestDeveloperRecommendationEngine))
+    suite.addTests(loader.loadTestsFromTestCase(TestChangeJournal))
+    suite.addTests(loader.loadTestsFromTestCase(TestSaveScheduler))
+    suite.addTests(loader.loadTestsFromTestCase(TestBackupStore))
+    suite.addTests(loader.loadTestsFromTestCase(TestDatabaseStorage))
+    suite.addTests(loader.loadTestsFromTestCase(TestDatabaseManager))
+    suite.addTests(loader.loadTestsFromTestCase(TestDataLoader))
+    suite.addTests(loader.loadTestsFromTestCase(TestStateSnapshot))
+    suite.addTests(loader.loadTestsFromTestCase(TestAtomicWrite))
+    suite.addTests(loader.loadTestsFromTestCase(TestTicketIndex))
+    suite.addTests(loader.loadTestsFromTestCase(TestDependencyGraph))
+    suite.addTests(loader.loadTestsFromTestCase(TestRecords))
+    suite.addTests(loader.loadTestsFromTestCase(TestTicketIdSequence))
+    suite.addTests(loader.loadTestsFromTestCase(TestPerformanceTracker))
+    suite.addTests(loader.loadTestsFromTestCase(TestMetricLog))
+    suite.addTests(loader.loadTestsFromTestCase(TestMetricColumns))
+    suite.addTests(loader.loadTestsFromTestCase(TestQuantileSketch))
+    suite.addTests(loader.loadTestsFromTestCase(TestMonteCarloEstimator))
+    suite.addTests(loader.loadTestsFromTestCase(TestSprintForecaster))
+    suite.addTests(loader.loadTestsFromTestCase(TestEstimateCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestBootstrapEstimator))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
@@ -0,0 +1,96 @@
+import atexit
+import threading
+import time
+
+
+class SaveScheduler:
+    """Write-behind persistence: coalesces save requests and flushes on a background thread.
+
+    A flush runs once changes have been quiet for `quiet_period` seconds, or
+    `max_delay` seconds after the first unsaved change, whichever comes first.
+    Pending changes are also flushed on shutdown.
+    """
+    def __init__(self, flush, quiet_period=2.0, max_delay=30.0):
+        self.flush = flush
+        self.quiet_period = quiet_period
+        self.max_delay = max_delay
+        self.flush_count = 0
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._dirty_since = None
+        self._last_change = None
+        self._stopped = False
+
+        self._thread = threading.Thread(target=self._run, name='save-scheduler', daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    @property
+    def dirty(self):
+        return self._dirty_since is not None
+
+    def mark_dirty(self):
+        """Record that in-memory state has changed and needs to be saved"""
+        with self._condition:
+            now = time.monotonic()
+            if self._dirty_since is None:
+                self._dirty_since = now
+            self._last_change = now
+            self._condition.notify()
+
+    def _next_flush_at(self):
+        return min(self._last_change + self.quiet_period, self._dirty_since + self.max_delay)
+
+    def _run(self):
+        with self._condition:
+            while not self._stopped:
+                if self._dirty_since is None:
+                    self._condition.wait()
+                    continue
+
+                remaining = self._next_flush_at() - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+
+                # Flush without holding the condition so new changes can keep arriving
+                self._condition.release()
+                try:
+                    self.flush_now()
+                finally:
+                    self._condition.acquire()
+
+    def flush_now(self):
+        """Flush pending changes immediately on the calling thread"""
+        with self._flush_lock:
+            with self._condition:
+                if self._dirty_since is None:
+                    return False
+                self._dirty_since = None
+                self._last_change = None
+
+            try:
+                saved = self.flush()
+            except Exception as e:
+                print(f"Error flushing pending changes: {e}")
+                saved = False
+
+            if saved is False:
+                # Keep the changes pending so the next flush retries them
+                self.mark_dirty()
+                return False
+
+            self.flush_count += 1
+            return True
+
+    def shutdown(self):
+        """Stop the background thread and flush anything still pending"""
+        with self._condition:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._condition.notify()
+
+        self._thread.join(timeout=5)
+        self.flush_now()
+        atexit.unregister(self.shutdown)
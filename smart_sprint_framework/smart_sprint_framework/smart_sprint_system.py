@@ -2,11 +2,11 @@ import sqlite3
 import os
 import json
 import random
-import ast  # For parsing string representations of lists
 from nlp_pipeline import NLPPipeline
 from ticket_generator import TicketGenerator 
 from developer_recommendation import DeveloperRecommendationEngine
-from monte_carlo import MonteCarloEstimator
+from bootstrap_estimator import create_estimator
+from sprint_forecast import SprintForecaster
 from performance_tracker import PerformanceTracker
 from training_module import TrainingModule
 from jira_integration import JiraIntegration
@@ -15,24 +15,69 @@ from gpt_simulation import GPTSimulation
 from workload_balancer import WorkloadBalancer
 from progress_monitor import ProgressMonitor
 from dashboard_data import DashboardDataGenerator
+from change_journal import (
+    TICKET_CREATED, TICKET_ASSIGNED, TICKET_COMPLETED,
+    TICKET_UPDATED, METRIC_RECORDED
+)
+from storage import create_storage, data_file_signature, DATA_FILES, SNAPSHOT_FILES
+from metric_log import write_metrics
+from state_snapshot import StateSnapshot
+from ticket_index import TicketIndex, WorkloadTotals
+from dependency_graph import DependencyGraph
+from quantile_sketch import CompletionSketches
+from estimate_cache import EstimateCache, StatsVersions, input_seed
+from records import Ticket, Developer, as_records
+from ticket_ids import TicketIdSequence
+from data_loader import normalize_developers, normalize_tickets, normalize_metrics, to_records, check_data_file
+from atomic_write import AtomicWriteBatch, atomic_write, remove_stale_temp_files, resolve_durability
+import numpy as np
 import pandas as pd
-import shutil
+import copy
 import datetime
-import csv
+import functools
+import threading
+import time
+from save_scheduler import SaveScheduler
+from backup_store import BackupStore
 from error_handler import (
     ValidationError, NotFoundError, ConflictError,
     safe_execute, retry_operation
 )
 
+def synchronized(method):
+    """Run a SmartSprintSystem method while holding the state lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.state_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class SmartSprintSystem:
-    def __init__(self):
+    def __init__(self, storage_backend=None, journal_path='change_journal.jsonl', db_path='smart_sprint.db',
+                 save_quiet_period=2.0, save_max_delay=30.0, snapshot_path='state_snapshot.npz', durability=None,
+                 ticket_id_path='ticket_id_sequence.json', estimation_engine=None, journal_compaction_threshold=200):
+        # Flush anything pending from a previous run of __init__ (system reset)
+        if getattr(self, 'save_scheduler', None):
+            self.shutdown()
+        
+        self.state_lock = threading.RLock()
+        self.save_lock = threading.Lock()
         self.tickets = []
         self.developers = []
+        self._tickets_by_id = {}
+        self._developers_by_id = {}
+        self.ticket_index = TicketIndex()
+        self.workload_totals = WorkloadTotals()
+        self.dependency_graph = DependencyGraph()
+        self.completion_sketches = CompletionSketches()
+        self.stats_versions = StatsVersions()
+        self.estimate_cache = EstimateCache()
         self.nlp = NLPPipeline()
         self.ticket_gen = TicketGenerator(self.nlp)
         self.recommendation_engine = DeveloperRecommendationEngine()
         self.performance_tracker = PerformanceTracker()
-        self.monte_carlo = MonteCarloEstimator()
+        self.monte_carlo = create_estimator(estimation_engine)
+        self.sprint_forecaster = SprintForecaster(self.monte_carlo)
         self.training_module = TrainingModule()
         self.jira_integration = None
         self.jira_config = {}
@@ -40,10 +85,23 @@ class SmartSprintSystem:
         self.gpt_simulation = GPTSimulation()
         self.workload_balancer = WorkloadBalancer()
         self.progress_monitor = ProgressMonitor()
+        self.durability = resolve_durability(durability)
+        self.storage = create_storage(storage_backend, journal_path, db_path, self.durability, journal_compaction_threshold)
+        self._last_compaction = time.monotonic()
+        self.backup_store = BackupStore('backups', durability=self.durability)
+        self.state_snapshot = StateSnapshot(snapshot_path, self.durability)
+        self.ticket_ids = TicketIdSequence(ticket_id_path, self.durability)
+        
+        # Repair anything an interrupted save left behind before reading the files
+        self._recover_data_files([journal_path, snapshot_path, self.state_snapshot.metrics_path, ticket_id_path,
+                                  self.backup_store.manifest_path])
         
         # Generate data files if they don't exist
         self._generate_data_files_if_missing()
         
+        # Saves replace files atomically, so one checkpoint per start is enough of a backup
+        self._backup_data_files()
+        
         # Try to load Jira configuration
         try:
             with open('jira_config.json', 'r') as f:
@@ -57,8 +115,11 @@ class SmartSprintSystem:
         except Exception as e:
             print(f"Jira integration not available: {e}")
         
-        # Load data from small CSV files
-        self._load_data_from_csv()
+        # Load data from the storage backend
+        self._load_data()
+        
+        # Save changes in the background, coalescing bursts into a single write
+        self.save_scheduler = SaveScheduler(self.auto_save, save_quiet_period, save_max_delay)
         
         # Try to load trained models if they exist
         self.training_module.load_models()
@@ -90,104 +151,66 @@ class SmartSprintSystem:
             return False
         return True
     
+    def _recover_data_files(self, other_paths=()):
+        """Remove temporary files from interrupted saves and restore damaged data files from backup"""
+        stale = remove_stale_temp_files(DATA_FILES + list(other_paths))
+        if stale:
+            print(f"Removed {len(stale)} temporary files left by an interrupted save")
+        
+        # A crash mid-append can only cut the last metrics row short; drop it rather than restore a backup
+        if self.storage.metrics_log is not None:
+            self.storage.metrics_log.repair()
+        
+        for path in DATA_FILES:
+            if not os.path.exists(path):
+                continue
+            problem = check_data_file(path)
+            if problem:
+                print(f"Warning: {path} is damaged ({problem})")
+                self._restore_data_file(path)
+    
+    def _restore_data_file(self, path):
+        """Restore a data file from the newest backup that passes validation"""
+        name = os.path.basename(path)
+        for snapshot_id in self.backup_store.file_versions(name):
+            try:
+                content = self.backup_store.read_file(snapshot_id, name)
+            except (KeyError, ValueError, OSError) as e:
+                print(f"Warning: Skipping backup {snapshot_id} of {name}: {e}")
+                continue
+            
+            if check_data_file(path, content) is None:
+                with atomic_write(path, 'wb', self.durability) as f:
+                    f.write(content)
+                print(f"Restored {path} from backup {snapshot_id}")
+                return True
+        
+        # Keep the damaged file for inspection; loading then falls back to sample data
+        os.replace(path, path + '.damaged')
+        print(f"Warning: No usable backup of {path}, moved it to {path}.damaged")
+        return False
+    
     def _load_data_from_csv(self):
+        """Load developers, tickets and performance data from the small CSV files"""
+        start_time = time.perf_counter()
+        
         # Load developers from small dataset
         try:
-            developers_df = pd.read_csv('developers_small.csv')
-            self.developers = []
-            for index, row in developers_df.iterrows():
-                dev = row.to_dict()
-                
-                # Handle skills - try to parse as list or string representation of list
-                if isinstance(dev['skills'], str):
-                    try:
-                        # Try to parse as string representation of list
-                        dev['skills'] = ast.literal_eval(dev['skills'])
-                    except (ValueError, SyntaxError):
-                        # If that fails, try splitting by comma
-                        dev['skills'] = [skill.strip() for skill in dev['skills'].split(',')]
-                
-                # Ensure current_workload is a number
-                if pd.isna(dev['current_workload']) or dev['current_workload'] == 'nan':
-                    dev['current_workload'] = 0
-                else:
-                    try:
-                        dev['current_workload'] = float(dev['current_workload'])
-                    except (ValueError, TypeError):
-                        dev['current_workload'] = 0
-                
-                # Ensure availability is a number
-                if pd.isna(dev['availability']) or dev['availability'] == 'nan':
-                    dev['availability'] = 40  # Default availability
-                else:
-                    try:
-                        dev['availability'] = float(dev['availability'])
-                    except (ValueError, TypeError):
-                        dev['availability'] = 40  # Default availability
-                
-                # Ensure experience_level is a number
-                if pd.isna(dev['experience_level']) or dev['experience_level'] == 'nan':
-                    dev['experience_level'] = 3  # Default level
-                else:
-                    try:
-                        dev['experience_level'] = int(dev['experience_level'])
-                    except (ValueError, TypeError):
-                        dev['experience_level'] = 3  # Default level
-                
-                # Validate required fields
-                if not dev.get('name') or not dev.get('skills'):
-                    print(f"Warning: Invalid developer data at index {index}, skipping")
-                    continue
-                    
-                self.developers.append(dev)
-            
+            developers_df, invalid_rows = normalize_developers(pd.read_csv('developers_small.csv'))
+            for index in invalid_rows:
+                print(f"Warning: Invalid developer data at index {index}, skipping")
+            self.developers = to_records(developers_df)
             print(f"Loaded {len(self.developers)} developers from developers_small.csv")
         except Exception as e:
             print(f"Warning: Could not load developers_small.csv: {e}")
             self._generate_sample_developers()
-    
+        
         # Load tickets from small dataset
         try:
-            tickets_df = pd.read_csv('sprint_documents_small.csv')
-            self.tickets = []
-            for index, row in tickets_df.iterrows():
-                ticket = row.to_dict()
-                
-                # Convert tasks from string to list
-                if isinstance(ticket['tasks'], str):
-                    ticket['tasks'] = [task.strip() for task in ticket['tasks'].split(',')]
-                
-                # Handle assigned_to field properly
-                if pd.isna(ticket['assigned_to']) or ticket['assigned_to'] == 'nan':
-                    ticket['assigned_to'] = None
-                else:
-                    try:
-                        ticket['assigned_to'] = int(ticket['assigned_to'])
-                    except (ValueError, TypeError):
-                        ticket['assigned_to'] = None
-                
-                # Ensure status is properly set
-                if pd.isna(ticket['status']) or ticket['status'] == 'nan':
-                    ticket['status'] = 'backlog'
-                else:
-                    ticket['status'] = str(ticket['status'])
-                
-                # FIX: Ensure logical flow - if ticket is assigned but status is backlog, set to in_progress
-                if ticket['assigned_to'] is not None and ticket['status'] == 'backlog':
-                    ticket['status'] = 'in_progress'
-                    print(f"Fixed ticket {ticket['id']} status: assigned but marked as backlog, changed to in_progress")
-                
-                # Add entities field if missing
-                if 'entities' not in ticket:
-                    ticket['entities'] = {
-                        'priorities': ['medium'],
-                        'dependencies': [],
-                        'deadlines': [],
-                        'tasks': []
-                    }
-                
-                self.tickets.append(ticket)
-            
+            tickets_df, fixed_ids = normalize_tickets(pd.read_csv('sprint_documents_small.csv'))
+            if fixed_ids:
+                print(f"Fixed status of {len(fixed_ids)} tickets: assigned but marked as backlog, changed to in_progress")
+            self.tickets = to_records(tickets_df)
             print(f"Loaded {len(self.tickets)} tickets from sprint_documents_small.csv")
         except Exception as e:
             print(f"Warning: Could not load sprint_documents_small.csv: {e}")
@@ -195,26 +218,214 @@ class SmartSprintSystem:
         
         # Load performance data from small dataset
         try:
-            performance_df = pd.read_csv('performance_data_small.csv')
-            self.performance_tracker.metrics = []
-            for index, row in performance_df.iterrows():
-                metric = row.to_dict()
-                
-                # Ensure all fields are properly typed
-                try:
-                    metric['developer_id'] = int(metric['developer_id'])
-                    metric['ticket_id'] = int(metric['ticket_id'])
-                    metric['completion_time'] = float(metric['completion_time'])
-                    metric['revisions'] = int(metric['revisions'])
-                    metric['sentiment_score'] = float(metric['sentiment_score'])
-                    self.performance_tracker.metrics.append(metric)
-                except (ValueError, TypeError) as e:
-                    print(f"Warning: Invalid performance data at index {index}: {e}")
-        
+            performance_df, invalid_count = normalize_metrics(pd.read_csv('performance_data_small.csv'))
+            if invalid_count:
+                print(f"Warning: Skipped {invalid_count} invalid performance records")
+            self.performance_tracker.load_metrics(to_records(performance_df))
             print(f"Loaded {len(self.performance_tracker.metrics)} performance records from performance_data_small.csv")
         except Exception as e:
             print(f"Warning: Could not load performance_data_small.csv: {e}")
-            self.performance_tracker.metrics = []
+            self.performance_tracker.load_metrics([])
+        
+        self.load_stats = {
+            'source': 'csv',
+            'developers': len(self.developers),
+            'tickets': len(self.tickets),
+            'performance_records': len(self.performance_tracker.metrics),
+            'load_seconds': time.perf_counter() - start_time
+        }
+        print(f"Loaded CSV data in {self.load_stats['load_seconds']:.3f}s")
+    
+    def _load_data(self):
+        """Load state from the storage backend, falling back to the small CSV files"""
+        start_time = time.perf_counter()
+        state = self.storage.load()
+        if state is None:
+            if not self._load_data_from_snapshot():
+                self._load_data_from_csv()
+                # Cache the parsed CSV data so the next start can skip parsing
+                metrics_log = self.storage.metrics_log
+                self._write_snapshot(self.developers, self.tickets, self.performance_tracker.metrics,
+                                     metrics_log.size() if metrics_log is not None else None)
+            # Seed a new database backend from the CSV data
+            self.storage.replace_state(self.developers, self.tickets, self.performance_tracker.metrics)
+        else:
+            self.developers, self.tickets, metrics = state
+            self.performance_tracker.load_metrics(metrics)
+            self.load_stats = {
+                'source': self.storage.backend,
+                'developers': len(self.developers),
+                'tickets': len(self.tickets),
+                'performance_records': len(self.performance_tracker.metrics),
+                'load_seconds': time.perf_counter() - start_time
+            }
+        
+        # Keep the state as compact slotted records rather than one dict per row
+        self.developers = as_records(Developer, self.developers)
+        self.tickets = as_records(Ticket, self.tickets)
+        
+        self._rebuild_indexes()
+        
+        # Apply changes made since the last snapshot
+        for record in self.storage.pending_changes():
+            self._apply_change(record)
+        
+        # Never hand out an id that is already in use, even if the sequence file was lost
+        self.ticket_ids.ensure_above(max((t['id'] for t in self.tickets), default=0))
+    
+    def _rebuild_indexes(self):
+        """Rebuild the id lookups and summary counters after the ticket or developer lists are replaced"""
+        # Built in reverse so the first record wins if an id is duplicated, as a linear search would
+        self._tickets_by_id = {t['id']: t for t in reversed(self.tickets)}
+        self._developers_by_id = {d['id']: d for d in reversed(self.developers)}
+        self.ticket_index.rebuild(self.tickets)
+        self.workload_totals.rebuild(self.developers)
+        self.dependency_graph.rebuild(self.tickets)
+        self.completion_sketches.rebuild(self.performance_tracker.metrics, self._tickets_by_id)
+        self.monte_carlo.rebuild(self.performance_tracker.metrics, self._tickets_by_id)
+        self.stats_versions.reset()
+    
+    def _add_ticket(self, ticket):
+        """Append a ticket as a Ticket record, index it by id and by its field values, and return it"""
+        ticket = Ticket.from_mapping(ticket)
+        self.tickets.append(ticket)
+        self._tickets_by_id.setdefault(ticket['id'], ticket)
+        self.ticket_index.add(ticket)
+        self.dependency_graph.add_ticket(ticket['id'], ticket.get('dependencies'))
+        return ticket
+    
+    def _tickets_changed(self, *tickets):
+        """Re-bucket tickets whose status, priority, complexity or assignee changed in place"""
+        for ticket in tickets:
+            self.ticket_index.refresh(ticket)
+    
+    def _workloads_changed(self, *developers):
+        """Fold changed developer workloads into the running totals and invalidate their cached estimates"""
+        for developer in developers:
+            self.workload_totals.refresh(developer)
+            self.stats_versions.bump(developer['id'])
+    
+    def get_ticket(self, ticket_id):
+        """Return the ticket with the given id, or None"""
+        return self._tickets_by_id.get(ticket_id)
+    
+    def get_developer(self, developer_id):
+        """Return the developer with the given id, or None"""
+        return self._developers_by_id.get(developer_id)
+    
+    def _load_data_from_snapshot(self):
+        """Load state from the binary snapshot if it still matches the CSV files"""
+        start_time = time.perf_counter()
+        state = self.state_snapshot.read(self._snapshot_signature())
+        if state is None:
+            return False
+        
+        metrics = state['metrics']
+        metrics_log = self.storage.metrics_log
+        if metrics_log is not None:
+            # The snapshot covers the metrics log up to the size it recorded; parse only the rows after that
+            offset = state['meta'].get('metrics_log_size')
+            try:
+                appended = None if offset is None or offset > metrics_log.size() else metrics_log.read_from(offset)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not read new rows of {metrics_log.path}: {e}")
+                appended = None
+            if appended is None:
+                return False
+            metrics = metrics + appended
+        
+        self.developers = state['developers']
+        self.tickets = state['tickets']
+        self.performance_tracker.load_metrics(metrics)
+        self.load_stats = {
+            'source': 'snapshot',
+            'developers': len(self.developers),
+            'tickets': len(self.tickets),
+            'performance_records': len(self.performance_tracker.metrics),
+            'load_seconds': time.perf_counter() - start_time
+        }
+        print(f"Loaded {len(self.developers)} developers, {len(self.tickets)} tickets and "
+              f"{len(self.performance_tracker.metrics)} performance records from {self.state_snapshot.path} "
+              f"in {self.load_stats['load_seconds']:.3f}s")
+        return True
+    
+    def _snapshot_signature(self):
+        """Signature of the data files a snapshot mirrors; an append-only metrics log is tracked by size instead"""
+        return data_file_signature(SNAPSHOT_FILES if self.storage.metrics_log is not None else DATA_FILES)
+    
+    def _write_snapshot(self, developers, tickets, metrics=None, metrics_log_size=None):
+        """Write the binary snapshot for the CSV files as they are now, keeping its metrics archive if metrics is None"""
+        try:
+            self.state_snapshot.write(developers, tickets, metrics, self._snapshot_signature(), metrics_log_size)
+        except Exception as e:
+            # The CSV files are still complete; the next start just parses them
+            print(f"Warning: Could not write snapshot {self.state_snapshot.path}: {e}")
+    
+    def _apply_change(self, record):
+        """Apply a single journal record to the in-memory state"""
+        record_type = record['type']
+        data = record['data']
+        
+        if record_type == TICKET_CREATED:
+            ticket = data['ticket']
+            existing = self.get_ticket(ticket['id'])
+            if existing:
+                existing.clear()
+                existing.update(ticket)
+                self._tickets_changed(existing)
+                self.dependency_graph.set_dependencies(existing['id'], existing.get('dependencies'))
+            else:
+                self._add_ticket(ticket)
+        
+        elif record_type in (TICKET_ASSIGNED, TICKET_COMPLETED, TICKET_UPDATED):
+            ticket = self.get_ticket(data['ticket_id'])
+            if ticket:
+                ticket.update(data['fields'])
+                self._tickets_changed(ticket)
+                if 'dependencies' in data['fields']:
+                    self.dependency_graph.set_dependencies(ticket['id'], ticket.get('dependencies'))
+            
+            # Workloads are journaled as absolute values so replay is idempotent
+            for developer_id, workload in data.get('workloads', []):
+                developer = self.get_developer(developer_id)
+                if developer:
+                    developer['current_workload'] = workload
+                    self._workloads_changed(developer)
+        
+        elif record_type == METRIC_RECORDED:
+            metric = self.performance_tracker.add_metric(data['metric'])
+            ticket = self.get_ticket(metric['ticket_id'])
+            self.completion_sketches.add(metric, ticket.get('complexity') if ticket else None)
+            self.monte_carlo.add(metric, ticket)
+            self.stats_versions.bump(metric['developer_id'])
+        
+        else:
+            print(f"Warning: Unknown journal record type: {record_type}")
+    
+    def _record_change(self, record_type, data):
+        """Persist a change, scheduling a background save if the backend needs a snapshot"""
+        if self.storage.record_change(record_type, data):
+            self.save_scheduler.mark_dirty()
+    
+    def shutdown(self):
+        """Flush pending changes, stop the background save thread and release storage"""
+        self.save_scheduler.shutdown()
+        # Leave the CSV files complete rather than behind a journal
+        if getattr(self.storage, 'journal', None) is not None and self.storage.journal.record_count:
+            try:
+                self._write_data_files()
+            except Exception as e:
+                # The journal still holds the changes; they are replayed on the next start
+                print(f"Error saving data on shutdown: {e}")
+        self.storage.close()
+    
+    def _ticket_change(self, ticket, fields, developers=()):
+        """Build a journal payload for updated ticket fields and developer workloads"""
+        return {
+            'ticket_id': ticket['id'],
+            'fields': {field: ticket.get(field) for field in fields},
+            'workloads': [[dev['id'], dev['current_workload']] for dev in developers]
+        }
     
     def _generate_sample_developers(self):
         # Fallback sample data
@@ -252,6 +463,7 @@ class SmartSprintSystem:
             ticket['id'] = i
             self.tickets.append(ticket)
     
+    @synchronized
     def process_feature_story(self, feature_story):
         """Process a feature story and create a ticket."""
         # Use GPT simulation to generate detailed ticket
@@ -271,45 +483,50 @@ class SmartSprintSystem:
                 'tasks': []
             }
         
-        # Find the highest existing ticket ID and increment by 1
-        max_id = max([t['id'] for t in self.tickets], default=0)
-        ticket_data['id'] = max_id + 1
+        # Take the next id from the shared sequence
+        ticket_data['id'] = self.ticket_ids.allocate()
         ticket_data['status'] = 'backlog'
         
-        self.tickets.append(ticket_data)
-        self.auto_save()
+        ticket_data = self._add_ticket(ticket_data)
+        self._record_change(TICKET_CREATED, {'ticket': ticket_data})
         return ticket_data
     
     def reset_ticket_ids(self):
         """Reset ticket IDs to start from 1 and update performance data"""
-        # Sort tickets by current ID
-        sorted_tickets = sorted(self.tickets, key=lambda x: x['id'])
-        
-        # Create a mapping from old ID to new ID
-        id_mapping = {}
-        for new_id, ticket in enumerate(sorted_tickets, 1):
-            old_id = ticket['id']
-            id_mapping[old_id] = new_id
-            ticket['id'] = new_id
-        
-        # Update performance data
-        for metric in self.performance_tracker.metrics:
-            if metric['ticket_id'] in id_mapping:
-                metric['ticket_id'] = id_mapping[metric['ticket_id']]
-        
-        # Save the updated data
+        with self.state_lock:
+            # Sort tickets by current ID
+            sorted_tickets = sorted(self.tickets, key=lambda x: x['id'])
+            
+            # Create a mapping from old ID to new ID
+            id_mapping = {}
+            for new_id, ticket in enumerate(sorted_tickets, 1):
+                old_id = ticket['id']
+                id_mapping[old_id] = new_id
+                ticket['id'] = new_id
+            
+            # Update performance data
+            self.performance_tracker.remap_ticket_ids(id_mapping)
+            if self.storage.metrics_log is not None:
+                # Existing rows changed, so the save below rewrites the metrics log
+                self.storage.metrics_log.stale = True
+            
+            self._rebuild_indexes()
+            self.storage.replace_state(self.developers, self.tickets, self.performance_tracker.metrics)
+            self.ticket_ids.reset(len(sorted_tickets) + 1)
+        
+        # Save the updated data (never while holding the state lock, see _write_data_files)
         self.manual_save()
         
         return True
     
     def get_ticket_recommendations(self, ticket_id):
         """Get ticket recommendations with error handling"""
-        ticket = next((t for t in self.tickets if t['id'] == ticket_id), None)
+        ticket = self.get_ticket(ticket_id)
         if not ticket:
             raise NotFoundError("Ticket", ticket_id)
         
-        # Get historical data
-        historical_data = self.performance_tracker.get_historical_performance_data()
+        # Get historical data in the view the recommendation engine scores against
+        historical_data = self.performance_tracker.get_historical_performance_data(self.recommendation_engine.performance_view)
         
         # Try RL recommendation first
         rl_recommendation = self.rl_assignment.recommend_developer(ticket, self.developers)
@@ -347,28 +564,69 @@ class SmartSprintSystem:
         recommendations.sort(key=lambda x: x['match_score'], reverse=True)
         return recommendations[:3]  # Return top 3
     
-    def estimate_ticket_timeline(self, ticket_id):
-        ticket = next((t for t in self.tickets if t['id'] == ticket_id), None)
+    @synchronized
+    def estimate_ticket_timeline(self, ticket_id, tolerance=None):
+        """Timeline estimate for a ticket; a tolerance makes the Monte Carlo fallback adaptive.
+        
+        Estimates are cached by the inputs they depend on (hours, complexity,
+        ticket text, the chosen developer's stats version and the model
+        version), and Monte Carlo runs are seeded from those inputs, so a
+        cached estimate is the same as a fresh one.
+        """
+        ticket = self.get_ticket(ticket_id)
         if not ticket:
             return None
+        inputs = (ticket['estimated_hours'], ticket['complexity'], ticket.get('title'), ticket.get('description'))
         
         # If ML models are trained, use them
         if self.training_module.is_trained:
+            model_version = self.training_module.model_version
             # We need a developer for ML estimation, so we'll use the first available or the one with the best match
-            historical_data = self.performance_tracker.get_historical_performance_data()
-            recommendations = self.recommendation_engine.recommend_developers(ticket, self.developers, historical_data)
+            def choose_developer():
+                historical_data = self.performance_tracker.get_historical_performance_data()
+                recommendations = self.recommendation_engine.recommend_developers(ticket, self.developers, historical_data)
+                return recommendations[0]['developer_id'] if recommendations else None
             
-            if recommendations:
-                developer = next((d for d in self.developers if d['id'] == recommendations[0]['developer_id']), None)
+            choice_key = ('developer', ticket_id, inputs, self.stats_versions.team, model_version)
+            developer_id = self.estimate_cache.get_or_compute(choice_key, choose_developer)
+            
+            if developer_id is not None:
+                developer = self.get_developer(developer_id)
                 if developer:
-                    return self.training_module.estimate_timeline(ticket, developer, historical_data)
+                    key = ('ml', inputs, developer_id, self.stats_versions.version(developer_id), model_version)
+                    estimate = copy.deepcopy(self.estimate_cache.get_or_compute(key, lambda: self.training_module.estimate_timeline(
+                        ticket, developer, self.performance_tracker.get_historical_performance_data()
+                    )))
+                    if estimate:
+                        estimate['historical_percentiles'] = self.get_completion_percentiles(developer_id=developer['id'])
+                    return estimate
         
         # Fall back to Monte Carlo estimation
-        return self.monte_carlo.estimate_task_duration(ticket['estimated_hours'], ticket['complexity'])
+        developer_id = ticket.get('assigned_to')
+        key = ('monte_carlo', ticket['estimated_hours'], ticket['complexity'], tolerance, developer_id, self.monte_carlo.version)
+        estimate = copy.deepcopy(self.estimate_cache.get_or_compute(key, lambda: self.monte_carlo.estimate_task_duration(
+            ticket['estimated_hours'], ticket['complexity'], tolerance, np.random.default_rng(input_seed(*key)), developer_id
+        )))
+        estimate['historical_percentiles'] = self.get_completion_percentiles(complexity=ticket['complexity'])
+        return estimate
+    
+    def get_completion_percentiles(self, developer_id=None, complexity=None):
+        """Recorded p50/p80/p95 completion time of a developer or a complexity level, or None without history"""
+        with self.state_lock:
+            return self.completion_sketches.percentiles(developer_id, complexity)
     
+    def get_developer_completion_percentiles(self):
+        """Recorded completion time percentiles of every developer with history, by developer id"""
+        with self.state_lock:
+            return {
+                developer_id: self.completion_sketches.percentiles(developer_id=developer_id)
+                for developer_id in self.completion_sketches.by_developer
+            }
+    
+    @synchronized
     def assign_developer_to_ticket(self, ticket_id, developer_id=None):
         """Assign developer to ticket with error handling"""
-        ticket = next((t for t in self.tickets if t['id'] == ticket_id), None)
+        ticket = self.get_ticket(ticket_id)
         if not ticket:
             raise NotFoundError("Ticket", ticket_id)
         
@@ -380,7 +638,7 @@ class SmartSprintSystem:
             recommendations = self.get_ticket_recommendations(ticket_id)
             return recommendations
         
-        developer = next((d for d in self.developers if d['id'] == developer_id), None)
+        developer = self.get_developer(developer_id)
         if not developer:
             raise NotFoundError("Developer", developer_id)
         
@@ -390,24 +648,30 @@ class SmartSprintSystem:
         
         # Use retry_operation for the assignment
         def perform_assignment():
+            changed_developers = [developer]
+            
             # If the ticket was previously assigned to someone else, reduce their workload
             if ticket.get('assigned_to') is not None and ticket['assigned_to'] != developer_id:
-                prev_dev = next((d for d in self.developers if d['id'] == ticket['assigned_to']), None)
+                prev_dev = self.get_developer(ticket['assigned_to'])
                 if prev_dev:
                     prev_dev['current_workload'] -= ticket['estimated_hours']
+                    changed_developers.append(prev_dev)
             
             # Update ticket status to 'in_progress' when assigned
             ticket['status'] = 'in_progress'
             ticket['assigned_to'] = developer_id
             developer['current_workload'] += ticket['estimated_hours']
-            self.auto_save()
+            self._tickets_changed(ticket)
+            self._workloads_changed(*changed_developers)
+            self._record_change(TICKET_ASSIGNED, self._ticket_change(ticket, ['status', 'assigned_to'], changed_developers))
             return True
         
         return retry_operation(perform_assignment, max_attempts=3)
     
+    @synchronized
     def complete_ticket(self, ticket_id, completion_time, revisions, sentiment_score):
         """Complete a ticket and update developer workload"""
-        ticket = next((t for t in self.tickets if t['id'] == ticket_id), None)
+        ticket = self.get_ticket(ticket_id)
         if not ticket:
             return False
         
@@ -425,58 +689,64 @@ class SmartSprintSystem:
         ticket['completion_time'] = completion_time
         
         # Track performance
-        self.performance_tracker.track_performance(developer_id, ticket_id, completion_time, revisions, sentiment_score)
+        metric = self.performance_tracker.track_performance(developer_id, ticket_id, completion_time, revisions, sentiment_score)
+        self.completion_sketches.add(metric, ticket.get('complexity'))
+        self.monte_carlo.add(metric, ticket)
+        self.stats_versions.bump(developer_id)
         
-        # Save performance data to CSV
-        self._save_performance_data_to_csv()
-        
-        developer = next((d for d in self.developers if d['id'] == developer_id), None)
+        developer = self.get_developer(developer_id)
         if developer:
             developer['current_workload'] -= ticket['estimated_hours']
+            self._workloads_changed(developer)
+        self._tickets_changed(ticket)
         
-        self.auto_save()
+        self._record_change(METRIC_RECORDED, {'metric': metric})
+        self._record_change(TICKET_COMPLETED, self._ticket_change(
+            ticket, ['status', 'completion_time'], [developer] if developer else []
+        ))
         return True
     
-    def _save_performance_data_to_csv(self):
-        """Save performance data to CSV file"""
+    def _save_performance_data_to_csv(self, metrics=None, batch=None):
+        """Save performance data to CSV file, as part of `batch` if one is given"""
+        if metrics is None:
+            metrics = self.performance_tracker.metrics
+        
         try:
-            # Always write the entire performance data to the CSV
-            with open('performance_data_small.csv', 'w', newline='') as csvfile:
-                fieldnames = ['developer_id', 'ticket_id', 'completion_time', 'revisions', 'sentiment_score', 'timestamp']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                # Write header
-                writer.writeheader()
-                
-                # Write all performance metrics
-                for metric in self.performance_tracker.metrics:
-                    writer.writerow({
-                        'developer_id': metric['developer_id'],
-                        'ticket_id': metric['ticket_id'],
-                        'completion_time': metric['completion_time'],
-                        'revisions': metric['revisions'],
-                        'sentiment_score': metric['sentiment_score'],
-                        'timestamp': metric['timestamp']
-                    })
+            writer_batch = batch or AtomicWriteBatch(self.durability)
+            # Write the entire performance data to the CSV
+            with writer_batch.open('performance_data_small.csv', 'w', newline='') as csvfile:
+                write_metrics(csvfile, metrics)
+            if batch is None:
+                writer_batch.commit()
             
-            print(f"Saved {len(self.performance_tracker.metrics)} performance records to CSV")
+            print(f"Saved {len(metrics)} performance records to CSV")
         except Exception as e:
             print(f"Error saving performance data to CSV: {e}")
+            raise
+    
+    def get_summary_counts(self):
+        """Ticket counts and workload totals kept up to date by the ticket index"""
+        with self.state_lock:
+            return {
+                'total_tickets': len(self.ticket_index),
+                'status_counts': self.ticket_index.counts('status'),
+                'completion_time_total': self.ticket_index.completion_time_total,
+                'completed_with_time': self.ticket_index.completed_with_time,
+                'total_workload': self.workload_totals.total_workload,
+                'total_availability': self.workload_totals.total_availability
+            }
     
     def get_system_status(self):
-        total_tickets = len(self.tickets)
-        completed_tickets = len([t for t in self.tickets if t['status'] == 'completed'])
-        in_progress_tickets = len([t for t in self.tickets if t['status'] == 'in_progress'])
-        backlog_tickets = len([t for t in self.tickets if t['status'] == 'backlog'])
-        
-        total_workload = sum(d['current_workload'] for d in self.developers)
-        total_availability = sum(d['availability'] for d in self.developers)
+        counts = self.get_summary_counts()
+        status_counts = counts['status_counts']
+        total_workload = counts['total_workload']
+        total_availability = counts['total_availability']
         
         return {
-            'total_tickets': total_tickets,
-            'completed_tickets': completed_tickets,
-            'in_progress_tickets': in_progress_tickets,
-            'backlog_tickets': backlog_tickets,
+            'total_tickets': counts['total_tickets'],
+            'completed_tickets': status_counts.get('completed', 0),
+            'in_progress_tickets': status_counts.get('in_progress', 0),
+            'backlog_tickets': status_counts.get('backlog', 0),
             'total_workload': total_workload,
             'total_availability': total_availability,
             'utilization_rate': (total_workload / total_availability) * 100 if total_availability > 0 else 0
@@ -484,31 +754,19 @@ class SmartSprintSystem:
     
     def get_developer_performance(self, developer_id):
         # Get performance data for this developer
-        developer_metrics = [m for m in self.performance_tracker.metrics if m['developer_id'] == developer_id]
+        summary = self.performance_tracker.get_developer_summary(developer_id)
         
-        if not developer_metrics:
+        if not summary:
             return None
         
-        # Calculate metrics
-        velocity = sum(m['completion_time'] for m in developer_metrics) / len(developer_metrics)
-        
-        total_revisions = sum(m['revisions'] for m in developer_metrics)
-        accuracy = 1.0 / (1.0 + total_revisions * 0.1)
-        
-        avg_sentiment = sum(m['sentiment_score'] for m in developer_metrics) / len(developer_metrics)
-        
         return {
-            'metrics': developer_metrics,
-            'average_completion_time': velocity,
-            'accuracy': accuracy,
-            'total_completed_tickets': len(developer_metrics),
-            'average_sentiment': avg_sentiment,
-            'historical_performance': {
-                'velocity': velocity,
-                'accuracy': accuracy,
-                'sentiment': avg_sentiment,
-                'tickets_completed': len(developer_metrics)
-            }
+            'metrics': self.performance_tracker.get_developer_metrics(developer_id),
+            'average_completion_time': summary['velocity'],
+            'accuracy': summary['accuracy'],
+            'total_completed_tickets': summary['tickets_completed'],
+            'average_sentiment': summary['sentiment'],
+            'completion_time_percentiles': self.get_completion_percentiles(developer_id=developer_id),
+            'historical_performance': summary
         }
     
     def check_ml_status(self):
@@ -521,119 +779,122 @@ class SmartSprintSystem:
             return False
     
     def auto_save(self):
-        """Auto-save current system state to CSV files"""
+        """Background save: sync the change journal, compacting it into the CSV files when it is due.
+        
+        Compaction is due once the journal reaches the backend's threshold or
+        save_max_delay seconds have passed since the last one, so a small
+        burst of changes costs an fsync rather than a rewrite of every file.
+        """
         try:
-            # Create backup of current files
-            self._backup_data_files()
-            
-            # Save developers
-            developers_data = []
-            for dev in self.developers:
-                dev_data = {
-                    'id': dev['id'],
-                    'name': dev['name'],
-                    'skills': json.dumps(dev['skills']),  # Save as JSON string
-                    'availability': dev['availability'],
-                    'current_workload': dev['current_workload'],
-                    'experience_level': dev['experience_level']
-                }
-                developers_data.append(dev_data)
-            
-            developers_df = pd.DataFrame(developers_data)
-            developers_df.to_csv('developers_small.csv', index=False)
-            
-            # Save tickets
-            tickets_data = []
-            for ticket in self.tickets:
-                ticket_data = {
-                    'id': ticket['id'],
-                    'title': ticket['title'],
-                    'description': ticket['description'],
-                    'priority': ticket['priority'],
-                    'complexity': ticket['complexity'],
-                    'estimated_hours': ticket['estimated_hours'],
-                    'status': ticket['status'],
-                    'tasks': ', '.join(ticket['tasks']),
-                    'assigned_to': ticket.get('assigned_to', None)
-                }
-                tickets_data.append(ticket_data)
-            
-            tickets_df = pd.DataFrame(tickets_data)
-            tickets_df.to_csv('sprint_documents_small.csv', index=False)
-            
-            # Save performance data
-            self._save_performance_data_to_csv()
-            
+            overdue = time.monotonic() - self._last_compaction >= self.save_scheduler.max_delay
+            if not (overdue or self.storage.needs_compaction()):
+                self.storage.sync()
+                return True
+            self._write_data_files()
             print("Auto-saved data successfully.")
+            return True
         except Exception as e:
             print(f"Error auto-saving data: {e}")
+            return False
     
     def manual_save(self):
         """Manually save current system state to CSV files"""
         try:
-            # Save developers
-            developers_data = []
-            for dev in self.developers:
-                dev_data = {
-                    'id': dev['id'],
-                    'name': dev['name'],
-                    'skills': json.dumps(dev['skills']),  # Save as JSON string
-                    'availability': dev['availability'],
-                    'current_workload': dev['current_workload'],
-                    'experience_level': dev['experience_level']
-                }
-                developers_data.append(dev_data)
+            self._write_data_files()
+            print("Data saved successfully.")
+            return True
+        except Exception as e:
+            print(f"Error saving data: {e}")
+            return False
+    
+    def _write_data_files(self):
+        """Rewrite the CSV files from memory; the journal then restarts from them.
+        
+        An append-only metrics log already holds every metric, so it is left
+        alone unless it is stale.
+        """
+        # Saves are serialized; callers must not hold the state lock, which is taken below
+        with self.save_lock:
+            # Capture a consistent copy of the state, then write it without blocking requests
+            with self.state_lock:
+                developers_data = []
+                for dev in self.developers:
+                    dev_data = {
+                        'id': dev['id'],
+                        'name': dev['name'],
+                        'skills': json.dumps(dev['skills']),  # Save as JSON string
+                        'availability': dev['availability'],
+                        'current_workload': dev['current_workload'],
+                        'experience_level': dev['experience_level']
+                    }
+                    developers_data.append(dev_data)
+                
+                tickets_data = []
+                for ticket in self.tickets:
+                    ticket_data = {
+                        'id': ticket['id'],
+                        'title': ticket['title'],
+                        'description': ticket['description'],
+                        'priority': ticket['priority'],
+                        'complexity': ticket['complexity'],
+                        'estimated_hours': ticket['estimated_hours'],
+                        'status': ticket['status'],
+                        'tasks': ', '.join(ticket['tasks']),
+                        'assigned_to': ticket.get('assigned_to', None)
+                    }
+                    tickets_data.append(ticket_data)
+                
+                snapshot_rows = ([dev.to_dict() for dev in self.developers], [ticket.to_dict() for ticket in self.tickets])
+                snapshot_position = self.storage.snapshot_position()
+                
+                metrics_log = self.storage.metrics_log
+                # The snapshot's metrics archive covers the metrics log up to an offset, so it is
+                # only re-encoded with the log or once the rows appended after it outgrow it
+                metrics = None
+                if (metrics_log is None or metrics_log.stale
+                        or self.state_snapshot.metrics_due(len(self.performance_tracker.metrics))):
+                    metrics = list(self.performance_tracker.metrics)
+                written = False
+                if metrics_log is not None and metrics_log.stale:
+                    # Rewrite it before releasing the lock, so no completion appends to the file being replaced
+                    self._write_csv_files(developers_data, tickets_data, metrics)
+                    metrics_log.stale = False
+                    written = True
+                metrics_log_size = metrics_log.size() if metrics_log is not None else None
+            
+            if not written:
+                # Without a metrics log the performance CSV is exported with the other files
+                self._write_csv_files(developers_data, tickets_data, metrics if metrics_log is None else None)
+            
+            # Keep the binary snapshot in step with the CSV files it was written alongside
+            self._write_snapshot(*snapshot_rows, metrics, metrics_log_size)
             
+            # Everything recorded up to the capture is now part of the CSV snapshot
+            self.storage.snapshot_written(snapshot_position)
+            self._last_compaction = time.monotonic()
+    
+    def _write_csv_files(self, developers_data, tickets_data, metrics=None):
+        """Write the developer and ticket rows, and the metrics if given, as one batch"""
+        # The files are replaced together once they are completely written
+        with AtomicWriteBatch(self.durability) as batch:
+            # Save developers
             developers_df = pd.DataFrame(developers_data)
-            developers_df.to_csv('developers_small.csv', index=False)
+            with batch.open('developers_small.csv', 'w', newline='') as f:
+                developers_df.to_csv(f, index=False)
             
             # Save tickets
-            tickets_data = []
-            for ticket in self.tickets:
-                ticket_data = {
-                    'id': ticket['id'],
-                    'title': ticket['title'],
-                    'description': ticket['description'],
-                    'priority': ticket['priority'],
-                    'complexity': ticket['complexity'],
-                    'estimated_hours': ticket['estimated_hours'],
-                    'status': ticket['status'],
-                    'tasks': ', '.join(ticket['tasks']),
-                    'assigned_to': ticket.get('assigned_to', None)
-                }
-                tickets_data.append(ticket_data)
-            
             tickets_df = pd.DataFrame(tickets_data)
-            tickets_df.to_csv('sprint_documents_small.csv', index=False)
+            with batch.open('sprint_documents_small.csv', 'w', newline='') as f:
+                tickets_df.to_csv(f, index=False)
             
             # Save performance data
-            self._save_performance_data_to_csv()
-            
-            print("Data saved successfully.")
-        except Exception as e:
-            print(f"Error saving data: {e}")
+            if metrics is not None:
+                self._save_performance_data_to_csv(metrics, batch)
     
     def _backup_data_files(self):
-        """Create backup of current data files"""
+        """Back up the current data files, storing only chunks that changed"""
         try:
-            backup_dir = "backups"
-            if not os.path.exists(backup_dir):
-                os.makedirs(backup_dir)
-            
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            
-            # Backup developers file
-            if os.path.exists('developers_small.csv'):
-                shutil.copy('developers_small.csv', f'{backup_dir}/developers_small_{timestamp}.csv')
-            
-            # Backup tickets file
-            if os.path.exists('sprint_documents_small.csv'):
-                shutil.copy('sprint_documents_small.csv', f'{backup_dir}/sprint_documents_small_{timestamp}.csv')
-            
-            # Backup performance file
-            if os.path.exists('performance_data_small.csv'):
-                shutil.copy('performance_data_small.csv', f'{backup_dir}/performance_data_small_{timestamp}.csv')
-            
+            self.backup_store.backup(DATA_FILES)
         except Exception as e:
             print(f"Error creating backup: {e}")
     
@@ -643,7 +904,7 @@ class SmartSprintSystem:
     
     def add_comment_to_ticket(self, ticket_id, developer_id, comment_text):
         """Add a comment to a ticket and analyze its sentiment"""
-        ticket = next((t for t in self.tickets if t['id'] == ticket_id), None)
+        ticket = self.get_ticket(ticket_id)
         if not ticket:
             return False
         
@@ -656,9 +917,10 @@ class SmartSprintSystem:
         
         return True
     
+    @synchronized
     def export_ticket_to_jira(self, ticket_id):
         """Export a ticket to Jira"""
-        ticket = next((t for t in self.tickets if t['id'] == ticket_id), None)
+        ticket = self.get_ticket(ticket_id)
         if not ticket:
             return False
         
@@ -669,7 +931,7 @@ class SmartSprintSystem:
         # Get assigned developer name
         assigned_to = None
         if ticket.get('assigned_to'):
-            developer = next((d for d in self.developers if d['id'] == ticket['assigned_to']), None)
+            developer = self.get_developer(ticket['assigned_to'])
             if developer:
                 assigned_to = developer['name'].lower().replace(' ', '.')
         
@@ -687,7 +949,7 @@ class SmartSprintSystem:
         if 'error' not in result:
             # Store Jira ID in ticket
             ticket['jira_id'] = result['key']
-            self.auto_save()
+            self._record_change(TICKET_UPDATED, self._ticket_change(ticket, ['jira_id']))
             return True
         else:
             print(f"Error exporting to Jira: {result['error']}")
@@ -695,53 +957,74 @@ class SmartSprintSystem:
     
     def update_jira_ticket_status(self, ticket_id, status):
         """Update Jira ticket status"""
-        ticket = next((t for t in self.tickets if t['id'] == ticket_id), None)
+        ticket = self.get_ticket(ticket_id)
         if not ticket or not self.jira_integration or not ticket.get('jira_id'):
             return False
         
         return self.jira_integration.update_ticket_status(ticket['jira_id'], status)
     
+    @synchronized
     def optimize_workload(self):
         """Optimize workload distribution across developers"""
-        historical_data = self.performance_tracker.get_historical_performance_data()
+        historical_data = self.performance_tracker.get_historical_performance_data(self.workload_balancer.performance_view)
         assignments = self.workload_balancer.optimize_workload(self.tickets, self.developers, historical_data)
         
         # Apply assignments
         for assignment in assignments:
-            ticket = next((t for t in self.tickets if t['id'] == assignment['ticket_id']), None)
-            developer = next((d for d in self.developers if d['id'] == assignment['developer_id']), None)
+            ticket = self.get_ticket(assignment['ticket_id'])
+            developer = self.get_developer(assignment['developer_id'])
             
             if ticket and developer:
                 # Check if developer has enough availability
                 if developer['current_workload'] + ticket['estimated_hours'] <= developer['availability']:
+                    changed_developers = [developer]
+                    
                     # Assign ticket to developer
                     if ticket.get('assigned_to') is not None and ticket['assigned_to'] != developer['id']:
                         # Reduce workload of previous developer
-                        prev_dev = next((d for d in self.developers if d['id'] == ticket['assigned_to']), None)
+                        prev_dev = self.get_developer(ticket['assigned_to'])
                         if prev_dev:
                             prev_dev['current_workload'] -= ticket['estimated_hours']
+                            changed_developers.append(prev_dev)
                 
                     ticket['assigned_to'] = developer['id']
                     ticket['status'] = 'in_progress'
                     developer['current_workload'] += ticket['estimated_hours']
+                    self._tickets_changed(ticket)
+                    self._workloads_changed(*changed_developers)
+                    self._record_change(TICKET_ASSIGNED, self._ticket_change(ticket, ['status', 'assigned_to'], changed_developers))
         
-        self.auto_save()
         return assignments
     
     def balance_workload(self):
         """Balance workload among developers"""
-        historical_data = self.performance_tracker.get_historical_performance_data()
+        historical_data = self.performance_tracker.get_historical_performance_data(self.workload_balancer.performance_view)
         return self.workload_balancer.balance_workload(self.developers, historical_data)
     
     def generate_progress_report(self):
         """Generate a comprehensive progress report"""
         historical_data = self.performance_tracker.get_historical_performance_data()
-        return self.progress_monitor.generate_progress_report(self.tickets, self.developers, historical_data)
+        return self.progress_monitor.generate_progress_report(
+            self.tickets, self.developers, historical_data,
+            ticket_index=self.ticket_index, dependency_graph=self.dependency_graph
+        )
+    
+    def forecast_sprint(self, n_samples=10000, workers=None, seed=None):
+        """Monte Carlo forecast of when the open tickets are all done, with per-ticket criticality"""
+        # Only the plan is built under the lock; the simulation runs without blocking requests,
+        # on a copy of the estimator that keeps the history recorded so far
+        with self.state_lock:
+            plan = self.sprint_forecaster.plan(self.tickets, self.developers, self.dependency_graph)
+            estimator = copy.copy(self.monte_carlo)
+        return self.sprint_forecaster.forecast(plan, n_samples, workers=workers, seed=seed, estimator=estimator)
     
     def get_real_time_metrics(self):
         """Get real-time metrics for dashboard"""
-        return self.progress_monitor.get_real_time_metrics(self.tickets, self.developers)
+        return self.progress_monitor.get_real_time_metrics(
+            self.tickets, self.developers, summary_counts=self.get_summary_counts()
+        )
     
+    @synchronized
     def adjust_priorities_dynamically(self):
         """Adjust ticket priorities based on various factors"""
         adjustments = []
@@ -782,23 +1065,18 @@ class SmartSprintSystem:
                     })
         
         # Factor 3: Adjust based on dependency chain
-        # Find tickets that are blocking many others
-        for ticket in self.tickets:
-            if ticket['status'] == 'backlog':
-                blocking_count = 0
-                for other_ticket in self.tickets:
-                    if ticket['id'] in other_ticket.get('dependencies', []):
-                        blocking_count += 1
-                
-                if blocking_count >= 3:  # If 3 or more tasks depend on this one
-                    old_priority = ticket['priority']
-                    ticket['priority'] = 'high' if old_priority != 'critical' else 'critical'
-                    adjustments.append({
-                        'ticket_id': ticket['id'],
-                        'old_priority': old_priority,
-                        'new_priority': ticket['priority'],
-                        'reason': f'Blocking {blocking_count} other tasks'
-                    })
+        # Find tickets that are blocking many others, directly or through other tickets
+        for ticket in self.ticket_index.tickets('status', 'backlog'):
+            blocking_count = self.dependency_graph.blocked_count(ticket['id'])
+            if blocking_count >= 3:  # If 3 or more tasks depend on this one
+                old_priority = ticket['priority']
+                ticket['priority'] = 'high' if old_priority != 'critical' else 'critical'
+                adjustments.append({
+                    'ticket_id': ticket['id'],
+                    'old_priority': old_priority,
+                    'new_priority': ticket['priority'],
+                    'reason': f'Blocking {blocking_count} other tasks'
+                })
         
         # Factor 4: Adjust based on developer availability
         for dev in self.developers:
@@ -823,8 +1101,12 @@ class SmartSprintSystem:
                             'reason': f'Matches underutilized developer: {dev["name"]}'
                         })
         
-        if adjustments:
-            self.auto_save()
+        # Journal the final priority of each adjusted ticket
+        for ticket_id in dict.fromkeys(adjustment['ticket_id'] for adjustment in adjustments):
+            ticket = self.get_ticket(ticket_id)
+            if ticket:
+                self._tickets_changed(ticket)
+                self._record_change(TICKET_UPDATED, self._ticket_change(ticket, ['priority']))
         
         return adjustments
     
@@ -0,0 +1,199 @@
+import datetime
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from dependency_graph import DependencyGraph
+from monte_carlo import MonteCarloEstimator
+
+# Percentiles of the sprint completion reported by forecast()
+FORECAST_PERCENTILES = (50, 80, 95)
+
+# Tickets with no other constraint are started in this order
+PRIORITY_RANK = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+
+WORKDAYS_PER_WEEK = 5
+DEFAULT_AVAILABILITY = 40
+
+
+class SprintPlan:
+    """The open tickets of a sprint in schedule order, with what each one waits for.
+
+    `predecessors[i]` holds the indices of the tickets ticket i cannot start
+    before: its open dependencies and the ticket its developer works on
+    just before it. `hours_per_day` is the assignee's daily capacity, or the
+    team average for unassigned tickets, which are not serialized.
+    `assignees` holds each ticket's developer id, or None.
+    """
+    def __init__(self, ticket_ids, hours, complexities, hours_per_day, order, predecessors, assignees=None):
+        self.ticket_ids = ticket_ids
+        self.hours = hours
+        self.complexities = complexities
+        self.hours_per_day = hours_per_day
+        self.order = order
+        self.predecessors = predecessors
+        self.assignees = assignees
+
+    def __len__(self):
+        return len(self.ticket_ids)
+
+
+def _schedule_order(depends_on, rank):
+    """Ticket indices with every dependency before its dependents, ties broken by rank"""
+    waiting = [len(deps) for deps in depends_on]
+    dependents = [[] for _ in depends_on]
+    for index, deps in enumerate(depends_on):
+        for dependency in deps:
+            dependents[dependency].append(index)
+
+    ready = [(rank[index], index) for index, count in enumerate(waiting) if count == 0]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        _, index = heapq.heappop(ready)
+        order.append(index)
+        for dependent in dependents[index]:
+            waiting[dependent] -= 1
+            if waiting[dependent] == 0:
+                heapq.heappush(ready, (rank[dependent], dependent))
+    return order
+
+
+def _simulate_shard(plan, estimator, n_samples, seed):
+    """Simulate n_samples sprint runs; returns each run's length in working days and per-ticket critical path counts"""
+    durations = estimator.sample_durations(plan.hours, plan.complexities, n_samples, np.random.default_rng(seed), plan.assignees)
+    days = durations / plan.hours_per_day[:, None]
+
+    # One row per ticket, one column per sample; tickets are filled in schedule order
+    finish = np.zeros_like(days)
+    binding = np.full(days.shape, -1, dtype=np.int64)
+    columns = np.arange(n_samples)
+    for index in plan.order:
+        predecessors = plan.predecessors[index]
+        if len(predecessors):
+            predecessor_finish = finish[predecessors]
+            latest = predecessor_finish.argmax(axis=0)
+            finish[index] = predecessor_finish[latest, columns] + days[index]
+            binding[index] = predecessors[latest]
+        else:
+            finish[index] = days[index]
+
+    # Follow each run's critical path back from the ticket that finished last
+    critical_counts = np.zeros(len(plan), dtype=np.int64)
+    current = finish.argmax(axis=0)
+    samples = columns
+    while samples.size:
+        np.add.at(critical_counts, current, 1)
+        previous = binding[current, samples]
+        keep = previous >= 0
+        current, samples = previous[keep], samples[keep]
+
+    return finish.max(axis=0), critical_counts
+
+
+class SprintForecaster:
+    """Monte Carlo forecast of when every open ticket of the sprint is done.
+
+    Each run draws every ticket's duration from the estimator (uniform or bootstrap),
+    converts it to working days at the assignee's daily capacity
+    (availability / 5), and schedules the tickets so none starts before
+    its dependencies and each developer works one ticket at a time. Runs
+    are simulated as a tickets x samples matrix in shards of `shard_size`
+    samples, optionally spread over worker processes; with a seed the
+    result does not depend on the number of workers.
+    """
+    def __init__(self, estimator=None, shard_size=5000):
+        self.estimator = estimator or MonteCarloEstimator()
+        self.shard_size = shard_size
+
+    def plan(self, tickets, developers, dependency_graph=None):
+        """Build the SprintPlan for the tickets that are not completed yet"""
+        if dependency_graph is None:
+            dependency_graph = DependencyGraph(tickets)
+
+        open_tickets = [ticket for ticket in tickets if ticket.get('status') != 'completed']
+        positions = {ticket['id']: index for index, ticket in enumerate(open_tickets)}
+
+        daily_capacity = {
+            dev['id']: (dev.get('availability') or DEFAULT_AVAILABILITY) / WORKDAYS_PER_WEEK
+            for dev in developers
+        }
+        team_capacity = np.mean(list(daily_capacity.values())) if daily_capacity else DEFAULT_AVAILABILITY / WORKDAYS_PER_WEEK
+
+        # Dependencies on completed or unknown tickets are already satisfied
+        depends_on = [
+            [positions[dep] for dep in dependency_graph.depends_on.get(ticket['id'], ()) if dep in positions]
+            for ticket in open_tickets
+        ]
+        # Work in progress first, then by priority and age
+        rank = [
+            (ticket.get('status') != 'in_progress', PRIORITY_RANK.get(ticket.get('priority'), 2), index)
+            for index, ticket in enumerate(open_tickets)
+        ]
+        order = _schedule_order(depends_on, rank)
+
+        predecessors = [list(deps) for deps in depends_on]
+        last_by_developer = {}
+        for index in order:
+            assignee = open_tickets[index].get('assigned_to')
+            if assignee in daily_capacity:
+                if assignee in last_by_developer:
+                    predecessors[index].append(last_by_developer[assignee])
+                last_by_developer[assignee] = index
+
+        return SprintPlan(
+            ticket_ids=[ticket['id'] for ticket in open_tickets],
+            hours=np.array([ticket['estimated_hours'] for ticket in open_tickets], dtype=float),
+            complexities=[ticket['complexity'] for ticket in open_tickets],
+            hours_per_day=np.array([
+                daily_capacity.get(ticket.get('assigned_to'), team_capacity) for ticket in open_tickets
+            ], dtype=float),
+            order=order,
+            predecessors=[np.array(sorted(set(preds)), dtype=np.int64) for preds in predecessors],
+            assignees=[ticket.get('assigned_to') for ticket in open_tickets]
+        )
+
+    def forecast(self, plan, n_samples=10000, workers=None, seed=None, start_date=None, estimator=None):
+        """Completion quantiles in working days and dates, and how often each ticket is on the critical path.
+
+        Durations come from `estimator` if given, otherwise from the forecaster's own.
+        """
+        start_date = start_date or datetime.date.today()
+        if not len(plan):
+            return self._report(plan, np.zeros(1), np.zeros(0), 0, start_date)
+
+        shard_sizes = [min(self.shard_size, n_samples - start) for start in range(0, n_samples, self.shard_size)]
+        seeds = np.random.SeedSequence(seed).spawn(len(shard_sizes))
+        estimator = estimator or self.estimator
+        arguments = ([plan] * len(shard_sizes), [estimator] * len(shard_sizes), shard_sizes, seeds)
+
+        if workers and workers > 1 and len(shard_sizes) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_simulate_shard, *arguments))
+        else:
+            results = list(map(_simulate_shard, *arguments))
+
+        makespans = np.concatenate([result[0] for result in results])
+        critical_counts = np.sum([result[1] for result in results], axis=0)
+        return self._report(plan, makespans, critical_counts, n_samples, start_date)
+
+    def _report(self, plan, makespans, critical_counts, n_samples, start_date):
+        quantiles = np.quantile(makespans, [p / 100 for p in FORECAST_PERCENTILES])
+        # Work finishing within the first working day is done on the start date
+        offsets = np.maximum(np.ceil(quantiles) - 1, 0).astype(np.int64)
+        dates = np.busday_offset(np.datetime64(start_date, 'D'), offsets, roll='forward')
+
+        criticality = [
+            {'ticket_id': ticket_id, 'criticality': round(count / n_samples, 4)}
+            for ticket_id, count in zip(plan.ticket_ids, critical_counts.tolist())
+            if count
+        ]
+        criticality.sort(key=lambda item: item['criticality'], reverse=True)
+
+        return {
+            'open_tickets': len(plan),
+            'samples': n_samples,
+            'start_date': start_date.isoformat(),
+            'completion_days': {f'p{p}': round(float(value), 2) for p, value in zip(FORECAST_PERCENTILES, quantiles)},
+            'completion_dates': {f'p{p}': str(date) for p, date in zip(FORECAST_PERCENTILES, dates)},
+            'criticality': criticality
+        }
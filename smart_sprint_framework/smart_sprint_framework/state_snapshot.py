@@ -0,0 +1,259 @@
+import datetime
+import gc
+import json
+import os
+import uuid
+import zipfile
+import numpy as np
+from atomic_write import atomic_write
+from records import json_default
+
+# Bump whenever the column encoding or the set of tables changes; older
+# snapshots are then ignored and rebuilt from the CSV files
+SNAPSHOT_VERSION = 2
+
+# Metrics appended since the metrics archive was written are read from the
+# metrics log on load; past this many (or as many as it holds) it is rewritten
+METRICS_REWRITE_ROWS = 1000
+
+# Column kinds
+INT = 'int'
+FLOAT = 'float'
+STR = 'str'
+STR_LIST = 'str_list'
+JSON = 'json'
+
+
+def _is_int(value):
+    return isinstance(value, (int, np.integer)) and not isinstance(value, (bool, np.bool_))
+
+
+def _is_float(value):
+    return _is_int(value) or isinstance(value, (float, np.floating))
+
+
+def _column_kind(values):
+    """Pick the narrowest encoding that holds every non-null value of a column"""
+    present = [value for value in values if value is not None]
+    if all(_is_int(value) for value in present):
+        return INT
+    if all(_is_float(value) for value in present):
+        return FLOAT
+    if all(isinstance(value, str) for value in present):
+        return STR
+    if all(isinstance(value, (list, tuple)) and all(isinstance(item, str) for item in value) for value in present):
+        return STR_LIST
+    return JSON
+
+
+class _StringTable:
+    """Dictionary-encodes strings shared by every column of a snapshot"""
+    def __init__(self):
+        self.codes = {}
+
+    def code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.codes)
+        return code
+
+    def arrays(self):
+        strings = list(self.codes)
+        lengths = np.fromiter((len(s) for s in strings), dtype=np.int64, count=len(strings))
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        text = np.frombuffer(''.join(strings).encode('utf-8'), dtype=np.uint8)
+        return text, offsets
+
+    @staticmethod
+    def decode(text, offsets):
+        joined = text.tobytes().decode('utf-8')
+        bounds = offsets.tolist()
+        # Null values are stored as code -1, which picks the trailing None
+        return np.array([joined[start:end] for start, end in zip(bounds[:-1], bounds[1:])] + [None], dtype=object)
+
+
+class StateSnapshot:
+    """Versioned binary snapshot of developers, tickets and performance metrics.
+
+    Each table is stored column by column in a NumPy .npz archive: numbers as
+    typed arrays with a null mask, and strings as codes into one shared string
+    table. Loading it skips CSV parsing and type inference, so a restart only
+    has to rebuild the row dicts. The CSV files stay the export format; the
+    snapshot records their signature so it is never used once they change.
+
+    The metrics table lives in its own archive next to the snapshot, which
+    a save only rewrites when asked to, so saves do not re-encode the whole
+    metrics history. The snapshot names the metrics archive it goes with.
+    """
+    def __init__(self, path='state_snapshot.npz', durability=None):
+        self.path = path
+        self.metrics_path = os.path.splitext(path)[0] + '.metrics.npz'
+        self.durability = durability
+        # Meta of the metrics archive last written or read
+        self.metrics_meta = None
+
+    def metrics_due(self, metric_count):
+        """True if a save with `metric_count` metrics should rewrite the metrics archive"""
+        if self.metrics_meta is None:
+            return True
+        archived = self.metrics_meta['tables']['metrics']['rows']
+        return metric_count - archived > max(archived, METRICS_REWRITE_ROWS)
+
+    def write(self, developers, tickets, metrics=None, data_files=None, metrics_log_size=None):
+        """Write the snapshot atomically, tagged with the data file signature it matches.
+
+        `metrics_log_size` is the byte size of an append-only metrics file
+        the metrics came from; rows appended after it are not in the snapshot.
+        With `metrics` None the metrics archive already written is kept.
+        """
+        if metrics is not None:
+            self.metrics_meta = self._write_archive(self.metrics_path, {'metrics': metrics}, {
+                'generation': uuid.uuid4().hex,
+                'metrics_log_size': metrics_log_size
+            })
+        elif self.metrics_meta is None:
+            raise ValueError(f"{self.metrics_path} has not been written yet")
+
+        return self._write_archive(self.path, {'developers': developers, 'tickets': tickets}, {
+            'data_files': data_files,
+            'metrics_generation': self.metrics_meta['generation']
+        })
+
+    def _write_archive(self, path, tables, fields):
+        strings = _StringTable()
+        arrays = {}
+        meta = {
+            'version': SNAPSHOT_VERSION,
+            'created_at': datetime.datetime.now().isoformat(),
+            **fields,
+            'tables': {}
+        }
+
+        for table, rows in tables.items():
+            meta['tables'][table] = self._encode_table(table, rows, strings, arrays)
+
+        arrays['strings.text'], arrays['strings.offsets'] = strings.arrays()
+        arrays['meta'] = np.frombuffer(json.dumps(meta).encode('utf-8'), dtype=np.uint8)
+
+        with atomic_write(path, 'wb', self.durability) as f:
+            np.savez(f, **arrays)
+        return meta
+
+    def _encode_table(self, table, rows, strings, arrays):
+        columns = list(dict.fromkeys(column for row in rows for column in row))
+
+        kinds = {}
+        for column in columns:
+            prefix = f"{table}.{column}"
+            missing = np.fromiter((column not in row for row in rows), dtype=bool, count=len(rows))
+            values = [row.get(column) for row in rows]
+            null = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+            kind = kinds[column] = _column_kind(values)
+
+            if kind == INT:
+                arrays[prefix] = np.array([0 if value is None else int(value) for value in values], dtype=np.int64)
+            elif kind == FLOAT:
+                arrays[prefix] = np.array([np.nan if value is None else float(value) for value in values], dtype=np.float64)
+            elif kind == STR:
+                arrays[prefix] = np.array([-1 if value is None else strings.code(value) for value in values], dtype=np.int32)
+            elif kind == STR_LIST:
+                arrays[prefix + '.lengths'] = np.array([0 if value is None else len(value) for value in values], dtype=np.int32)
+                arrays[prefix] = np.array([strings.code(item) for value in values if value is not None for item in value], dtype=np.int32)
+            else:
+                arrays[prefix] = np.array([
+                    -1 if value is None else strings.code(json.dumps(value, default=json_default))
+                    for value in values
+                ], dtype=np.int32)
+
+            if null.any():
+                arrays[prefix + '.null'] = null
+            if missing.any():
+                arrays[prefix + '.missing'] = missing
+
+        return {'rows': len(rows), 'columns': columns, 'kinds': kinds}
+
+    def read(self, data_files=None):
+        """Return {'meta', 'developers', 'tickets', 'metrics'}, or None if the snapshot is missing or unusable.
+
+        When `data_files` is given, a snapshot written for a different data
+        file signature is treated as stale. meta['metrics_log_size'] is the
+        one recorded with the metrics archive.
+        """
+        if not os.path.exists(self.path) or not os.path.exists(self.metrics_path):
+            return None
+
+        # Rebuilding the rows allocates millions of objects; the cyclic
+        # collector would otherwise rescan them all several times over
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            state = self._read_archive(self.path, data_files)
+            if state is None:
+                return None
+            metrics_state = self._read_archive(self.metrics_path)
+            if metrics_state is None or metrics_state['meta'].get('generation') != state['meta'].get('metrics_generation'):
+                # The snapshot was not written after the metrics archive it names
+                return None
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            print(f"Warning: Could not read snapshot {self.path}: {e}")
+            return None
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        self.metrics_meta = metrics_state['meta']
+        state['meta']['metrics_log_size'] = self.metrics_meta.get('metrics_log_size')
+        state['metrics'] = metrics_state['metrics']
+        return state
+
+    def _read_archive(self, path, data_files=None):
+        with np.load(path, allow_pickle=False) as archive:
+            meta = json.loads(archive['meta'].tobytes().decode('utf-8'))
+            if meta.get('version') != SNAPSHOT_VERSION:
+                print(f"Warning: {path} has snapshot version {meta.get('version')}, expected {SNAPSHOT_VERSION}; ignoring it")
+                return None
+            if data_files is not None and meta.get('data_files') != data_files:
+                return None
+
+            strings = _StringTable.decode(archive['strings.text'], archive['strings.offsets'])
+            state = {'meta': meta}
+            for table, info in meta['tables'].items():
+                state[table] = self._decode_table(table, info, archive, strings)
+            return state
+
+    def _decode_table(self, table, info, archive, strings):
+        row_count = info['rows']
+        column_values = []
+        for column in info['columns']:
+            prefix = f"{table}.{column}"
+            kind = info['kinds'][column]
+            data = archive[prefix]
+
+            if kind in (INT, FLOAT):
+                values = data.tolist()
+            elif kind == STR:
+                values = strings[data].tolist()
+            elif kind == STR_LIST:
+                items = strings[data].tolist()
+                bounds = np.concatenate(([0], np.cumsum(archive[prefix + '.lengths']))).tolist()
+                values = [items[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+            else:
+                # One parse for the whole column still gives every row its own objects
+                texts = strings[data].tolist()
+                values = json.loads('[' + ','.join('null' if text is None else text for text in texts) + ']')
+
+            null_key = prefix + '.null'
+            if null_key in archive.files:
+                for index in np.flatnonzero(archive[null_key]).tolist():
+                    values[index] = None
+            column_values.append(values)
+
+        rows = [dict(zip(info['columns'], values)) for values in zip(*column_values)] if column_values else [{} for _ in range(row_count)]
+
+        for column in info['columns']:
+            missing_key = f"{table}.{column}.missing"
+            if missing_key in archive.files:
+                for index in np.flatnonzero(archive[missing_key]).tolist():
+                    del rows[index][column]
+
+        return rows
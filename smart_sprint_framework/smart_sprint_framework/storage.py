@@ -0,0 +1,208 @@
+import os
+from change_journal import (
+    ChangeJournal, TICKET_CREATED, TICKET_ASSIGNED, TICKET_COMPLETED,
+    TICKET_UPDATED, METRIC_RECORDED
+)
+from database import DatabaseManager
+from metric_log import MetricLog
+from atomic_write import resolve_durability, DURABILITY_ALWAYS
+
+DATA_FILES = ['developers_small.csv', 'sprint_documents_small.csv', 'performance_data_small.csv']
+METRICS_FILE = 'performance_data_small.csv'
+# Data files rewritten by each save; the metrics file is only ever appended to
+SNAPSHOT_FILES = [path for path in DATA_FILES if path != METRICS_FILE]
+
+# Ticket fields that have a column in the tickets table
+TICKET_COLUMNS = {
+    'title', 'description', 'priority', 'complexity', 'estimated_hours', 'status',
+    'tasks', 'assigned_to', 'entities', 'dependencies', 'deadline',
+    'completion_time', 'jira_id'
+}
+
+# Ticket columns that are NULL for tickets without the field; the CSV and
+# snapshot loaders leave such fields out, so database rows do too
+OPTIONAL_TICKET_COLUMNS = ('deadline', 'completion_time', 'jira_id')
+
+
+def data_file_signature(paths=None):
+    """Size and modification time of each existing data file"""
+    signature = {}
+    for path in paths or DATA_FILES:
+        if os.path.exists(path):
+            stat = os.stat(path)
+            signature[path] = [stat.st_size, stat.st_mtime_ns]
+    return signature
+
+
+class CsvStorage:
+    """State kept in the CSV data files plus an append-only change journal.
+
+    SmartSprintSystem reads and writes the CSV files itself; this backend
+    journals each change between snapshots and replays them on startup.
+    The journal is compacted into the CSV files once it holds
+    `journal_compaction_threshold` records; smaller bursts are only synced.
+    Performance metrics skip the journal and are appended straight to the
+    metrics file (see MetricLog), which saves never rewrite.
+    """
+    backend = 'csv'
+
+    def __init__(self, journal_path='change_journal.jsonl', data_files=None, durability=None,
+                 metrics_path=METRICS_FILE, journal_compaction_threshold=200):
+        self.data_files = data_files or SNAPSHOT_FILES
+        self.journal_compaction_threshold = journal_compaction_threshold
+        self.metrics_log = MetricLog(metrics_path, durability)
+        # Only the always policy syncs each record; otherwise changes are durable from the next save
+        self.journal = ChangeJournal(journal_path, fsync=resolve_durability(durability) == DURABILITY_ALWAYS)
+
+    def load(self):
+        """The CSV files are the primary copy, so there is nothing to load here"""
+        return None
+
+    def data_file_signature(self):
+        """Identify the current CSV files so a stale journal is never replayed onto them"""
+        return data_file_signature(self.data_files)
+
+    def pending_changes(self):
+        """Yield journaled changes made since the CSV files were last written"""
+        signature = self.data_file_signature()
+        # Journals from before the metrics log also signed the metrics file
+        base = {path: value for path, value in (self.journal.base or {}).items() if path in self.data_files}
+        if self.journal.base is None or base != signature:
+            # The CSV files were rewritten or regenerated outside this journal
+            if self.journal.record_count:
+                print(f"Warning: {self.journal.path} does not match the data files, discarding {self.journal.record_count} changes")
+            self.journal.truncate(base=signature)
+            return
+
+        replayed = 0
+        for record in self.journal.records():
+            if record['type'] == METRIC_RECORDED:
+                # Journaled before metrics had their own log; the next save writes them there
+                self.metrics_log.stale = True
+            yield record
+            replayed += 1
+
+        if replayed:
+            print(f"Replayed {replayed} changes from {self.journal.path}")
+
+    def record_change(self, record_type, data):
+        """Journal a change; returns True if the CSV snapshot is now behind"""
+        if record_type == METRIC_RECORDED:
+            self.metrics_log.append(data['metric'])
+            return False
+        self.journal.append(record_type, data)
+        return True
+
+    def replace_state(self, developers, tickets, metrics):
+        """Whole-state rewrites go through the CSV snapshot written by SmartSprintSystem"""
+        pass
+
+    def needs_compaction(self):
+        """True once the journal is long enough, or the metrics log stale, to rewrite the CSV files"""
+        return self.journal.record_count >= self.journal_compaction_threshold or self.metrics_log.stale
+
+    def sync(self):
+        """Make journaled changes durable without rewriting the CSV files"""
+        self.journal.sync()
+
+    def snapshot_position(self):
+        return self.journal.position()
+
+    def snapshot_written(self, position):
+        """Everything journaled up to position is now part of the CSV snapshot"""
+        self.journal.truncate(base=self.data_file_signature(), keep_from=position)
+
+    def close(self):
+        pass
+
+
+class DatabaseStorage:
+    """State kept in SQLite through DatabaseManager, one row-level write per change.
+
+    The CSV files are only written as an export (manual save).
+    """
+    backend = 'sqlite'
+    metrics_log = None
+
+    def __init__(self, db_path='smart_sprint.db'):
+        self.db = DatabaseManager(db_path)
+
+    def load(self):
+        """Return (developers, tickets, metrics) from the database, or None if it is empty"""
+        developers = self.db.get_developers()
+        if not developers:
+            return None
+
+        tickets = sorted(self.db.get_tickets(), key=lambda t: t['id'])
+        for ticket in tickets:
+            for column in OPTIONAL_TICKET_COLUMNS:
+                if ticket.get(column) is None:
+                    ticket.pop(column, None)
+        metrics = sorted(self.db.get_performance_metrics(), key=lambda m: m['id'])
+        print(f"Loaded {len(developers)} developers, {len(tickets)} tickets and {len(metrics)} performance records from {self.db.db_path}")
+        return developers, tickets, metrics
+
+    def pending_changes(self):
+        """Every change is written through immediately, so nothing is pending"""
+        return []
+
+    def record_change(self, record_type, data):
+        """Apply a change as row-level writes; returns False as no snapshot is needed"""
+        if record_type == TICKET_CREATED:
+            self.db.add_ticket(data['ticket'])
+
+        elif record_type in (TICKET_ASSIGNED, TICKET_COMPLETED, TICKET_UPDATED):
+            fields = {field: value for field, value in data['fields'].items() if field in TICKET_COLUMNS}
+            # The ticket and the workloads it moved are one change
+            with self.db.transaction():
+                if fields:
+                    self.db.update_ticket(data['ticket_id'], fields)
+                for developer_id, workload in data.get('workloads', []):
+                    self.db.update_developer(developer_id, {'current_workload': workload})
+
+        elif record_type == METRIC_RECORDED:
+            self.db.add_performance_metric(data['metric'])
+
+        else:
+            print(f"Warning: Unknown change type for database storage: {record_type}")
+
+        return False
+
+    def replace_state(self, developers, tickets, metrics):
+        """Replace every row in one transaction, used for the initial CSV import and ticket id resets"""
+        with self.db.transaction() as conn:
+            conn.execute('DELETE FROM performance_metrics')
+            conn.execute('DELETE FROM tickets')
+            conn.execute('DELETE FROM developers')
+
+            self.db.add_developers(developers)
+            self.db.add_tickets(tickets)
+            self.db.add_performance_metrics(metrics)
+
+    def snapshot_position(self):
+        return None
+
+    def snapshot_written(self, position):
+        pass
+
+    def needs_compaction(self):
+        return False
+
+    def sync(self):
+        """Every change is committed as it is made"""
+        pass
+
+    def close(self):
+        self.db.close()
+
+
+def create_storage(backend=None, journal_path='change_journal.jsonl', db_path='smart_sprint.db', durability=None,
+                   journal_compaction_threshold=200):
+    """Create the storage backend named by `backend` or the SMART_SPRINT_STORAGE variable"""
+    backend = backend or os.environ.get('SMART_SPRINT_STORAGE', 'csv')
+
+    if backend == 'csv':
+        return CsvStorage(journal_path, durability=durability, journal_compaction_threshold=journal_compaction_threshold)
+    if backend == 'sqlite':
+        return DatabaseStorage(db_path)
+    raise ValueError(f"Unknown storage backend: {backend}")
@@ -0,0 +1,89 @@
+import unittest
+import sys
+import os
+import tempfile
+import time
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from atomic_write import (
+    AtomicWriteBatch, atomic_write, remove_stale_temp_files, resolve_durability, TEMP_FILE_GRACE_SECONDS
+)
+from data_loader import check_data_file
+
+class TestAtomicWrite(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'developers_small.csv')
+        with open(self.path, 'w') as f:
+            f.write('old\n')
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def _read(self, path=None):
+        with open(path or self.path) as f:
+            return f.read()
+    
+    def test_write_replaces_file(self):
+        """Test that a completed write replaces the file and leaves no temporary file"""
+        for durability in ['none', 'batch', 'always']:
+            with atomic_write(self.path, durability=durability) as f:
+                f.write(f'{durability}\n')
+            self.assertEqual(self._read(), f'{durability}\n')
+        self.assertEqual(os.listdir(self.temp_dir.name), ['developers_small.csv'])
+    
+    def test_failed_write_keeps_old_file(self):
+        """Test that an exception mid-write leaves the previous content untouched"""
+        with self.assertRaises(RuntimeError):
+            with atomic_write(self.path) as f:
+                f.write('partial')
+                raise RuntimeError("crash")
+        
+        self.assertEqual(self._read(), 'old\n')
+        self.assertEqual(os.listdir(self.temp_dir.name), ['developers_small.csv'])
+    
+    def test_batch_replaces_files_together(self):
+        """Test that a batch renames nothing until every file is written"""
+        other = os.path.join(self.temp_dir.name, 'tickets.csv')
+        with self.assertRaises(RuntimeError):
+            with AtomicWriteBatch('batch') as batch:
+                with batch.open(self.path) as f:
+                    f.write('new\n')
+                raise RuntimeError("crash before the second file")
+        self.assertEqual(self._read(), 'old\n')
+        
+        with AtomicWriteBatch('batch') as batch:
+            with batch.open(self.path) as f:
+                f.write('new\n')
+            with batch.open(other) as f:
+                f.write('tickets\n')
+            self.assertEqual(self._read(), 'old\n')
+        self.assertEqual(self._read(), 'new\n')
+        self.assertEqual(self._read(other), 'tickets\n')
+    
+    def test_recovery_helpers(self):
+        """Test stale temporary file cleanup, data file validation and policy names"""
+        stale = os.path.join(self.temp_dir.name, '.developers_small.csv.0123456789ab.tmp')
+        live = os.path.join(self.temp_dir.name, '.developers_small.csv.ba9876543210.tmp')
+        for temp_path in (stale, live):
+            with open(temp_path, 'w') as f:
+                f.write('half a fi')
+        # Only the old one is left over; the new one may be another process's save in progress
+        old_time = time.time() - TEMP_FILE_GRACE_SECONDS - 60
+        os.utime(stale, (old_time, old_time))
+        self.assertEqual(remove_stale_temp_files([self.path]), [stale])
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(live))
+        
+        header = b'id,name,skills,availability,current_workload,experience_level\n'
+        self.assertIsNone(check_data_file(self.path, header + b'1,John,[],40,0,3\n'))
+        self.assertIn('incomplete', check_data_file(self.path, header + b'1,John,[],4'))
+        self.assertIn('missing columns', check_data_file(self.path, b'skills,availability\n[],40\n'))
+        
+        with self.assertRaises(ValueError):
+            resolve_durability('sometimes')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import sys
+import os
+import tempfile
+import datetime
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backup_store import BackupStore
+
+class TestBackupStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path = os.path.join(self.temp_dir.name, 'tickets.csv')
+        self.store = BackupStore(os.path.join(self.temp_dir.name, 'backups'))
+        self._write_rows(200)
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def _write_rows(self, count, changed_row=None):
+        with open(self.data_path, 'w') as f:
+            f.write('id,title\n')
+            for i in range(count):
+                title = 'changed' if i == changed_row else f'ticket {i}'
+                f.write(f'{i},{title}\n')
+    
+    def _object_count(self):
+        return sum(len(files) for _, _, files in os.walk(self.store.objects_dir))
+    
+    def test_unchanged_files_are_skipped(self):
+        """Test that backing up unchanged files creates no new snapshot"""
+        self.assertIsNotNone(self.store.backup([self.data_path]))
+        self.assertIsNone(self.store.backup([self.data_path]))
+        self.assertEqual(len(self.store.manifest['snapshots']), 1)
+    
+    def test_small_change_reuses_chunks(self):
+        """Test that editing one row only stores the chunks that changed"""
+        now = datetime.datetime.now()
+        self.store.backup([self.data_path], now=now)
+        objects_before = self._object_count()
+        
+        self._write_rows(200, changed_row=150)
+        self.store.backup([self.data_path], now=now + datetime.timedelta(seconds=1))
+        
+        self.assertLessEqual(self._object_count() - objects_before, 2)
+    
+    def test_restore_round_trip(self):
+        """Test that a restored file matches the backed up content"""
+        snapshot = self.store.backup([self.data_path])
+        with open(self.data_path, 'rb') as f:
+            original = f.read()
+        
+        self._write_rows(10)
+        self.store.restore(snapshot['id'], self.temp_dir.name)
+        
+        with open(self.data_path, 'rb') as f:
+            self.assertEqual(f.read(), original)
+    
+    def test_retention_keeps_one_per_hour(self):
+        """Test that retention thins snapshots within the same hour"""
+        start = datetime.datetime.now().replace(minute=0, second=0, microsecond=0)
+        for i in range(5):
+            self._write_rows(200, changed_row=i)
+            self.store.backup([self.data_path], now=start + datetime.timedelta(minutes=i))
+        
+        self.assertEqual(len(self.store.manifest['snapshots']), 1)
+        self.assertEqual(self.store.manifest['snapshots'][0]['created_at'],
+                         (start + datetime.timedelta(minutes=4)).isoformat())
+    
+    def test_manifest_saved_before_garbage_collection(self):
+        """Test that a failure while deleting chunks leaves a manifest whose snapshots all restore"""
+        start = datetime.datetime.now().replace(minute=0, second=0, microsecond=0)
+        self.store.backup([self.data_path], now=start)
+        self._write_rows(50)
+        
+        def fail():
+            raise OSError("disk error")
+        self.store._collect_garbage = fail
+        with self.assertRaises(OSError):
+            self.store.backup([self.data_path], now=start + datetime.timedelta(minutes=1))
+        
+        reopened = BackupStore(self.store.root)
+        self.assertEqual(len(reopened.manifest['snapshots']), 1)
+        for snapshot in reopened.manifest['snapshots']:
+            reopened.restore(snapshot['id'], self.temp_dir.name)
+        with open(self.data_path) as f:
+            self.assertEqual(len(f.readlines()), 51)
+
+if __name__ == '__main__':
+    unittest.main()
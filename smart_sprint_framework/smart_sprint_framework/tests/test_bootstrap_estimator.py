@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+import copy
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bootstrap_estimator import BootstrapEstimator, create_estimator
+from monte_carlo import MonteCarloEstimator
+
+class TestBootstrapEstimator(unittest.TestCase):
+    def setUp(self):
+        self.tickets = {
+            1: {'id': 1, 'estimated_hours': 10, 'complexity': 3},
+            2: {'id': 2, 'estimated_hours': 4, 'complexity': '3'},
+            3: {'id': 3, 'estimated_hours': 0, 'complexity': 3}
+        }
+        self.metrics = [
+            {'developer_id': 1, 'ticket_id': 1, 'completion_time': 20},
+            {'developer_id': 2, 'ticket_id': 2, 'completion_time': 2},
+            {'developer_id': 2, 'ticket_id': 3, 'completion_time': 5},
+            {'developer_id': 2, 'ticket_id': 9, 'completion_time': 5}
+        ]
+    
+    def test_sorted_ratios(self):
+        """Test that ratios are sorted per complexity, skip unusable metrics and merge new ones in order"""
+        estimator = BootstrapEstimator(per_developer=True)
+        estimator.rebuild(self.metrics, self.tickets)
+        np.testing.assert_array_equal(estimator.ratios(3), [0.5, 2.0])
+        np.testing.assert_array_equal(estimator.ratios(3, developer_id=2), [0.5])
+        
+        version = estimator.version
+        snapshot = copy.copy(estimator)
+        estimator.add({'developer_id': 2, 'ticket_id': 1, 'completion_time': 12}, self.tickets[1])
+        np.testing.assert_array_equal(estimator.ratios(3), [0.5, 1.2, 2.0])
+        np.testing.assert_array_equal(estimator.ratios(3, developer_id=2), [0.5, 1.2])
+        np.testing.assert_array_equal(snapshot.ratios(3), [0.5, 2.0])
+        self.assertGreater(estimator.version, version)
+    
+    def test_resamples_recorded_ratios(self):
+        """Test that durations are drawn from the recorded ratios, falling back to the uniform ranges"""
+        estimator = BootstrapEstimator(seed=4, min_samples=2)
+        estimator.rebuild(self.metrics, self.tickets)
+        
+        durations = estimator.sample_durations([8, 8], [3, 1], 2000)
+        self.assertEqual(set(np.unique(durations[0])), {4.0, 16.0})
+        self.assertAlmostEqual((durations[0] == 16.0).mean(), 0.5, delta=0.05)
+        self.assertTrue(((durations[1] >= 8 * 0.8) & (durations[1] <= 8 * 1.2)).all())
+        
+        estimate = estimator.estimate_task_duration(8, 3, tolerance=0.5)
+        self.assertEqual(estimate['confidence_interval'], (4.0, 16.0))
+    
+    def test_create_estimator(self):
+        """Test that engines are selected by name"""
+        self.assertIs(type(create_estimator('uniform')), MonteCarloEstimator)
+        self.assertIsInstance(create_estimator('bootstrap', seed=1), BootstrapEstimator)
+        with self.assertRaises(ValueError):
+            create_estimator('gaussian')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from change_journal import ChangeJournal, TICKET_CREATED, TICKET_ASSIGNED
+
+class TestChangeJournal(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'journal.jsonl')
+        self.journal = ChangeJournal(self.path)
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_append_and_read_records(self):
+        """Test that records are read back in append order"""
+        self.journal.append(TICKET_CREATED, {'ticket': {'id': 1}})
+        self.journal.append(TICKET_ASSIGNED, {'ticket_id': 1, 'fields': {'assigned_to': 2}})
+        
+        records = list(self.journal.records())
+        self.assertEqual([r['type'] for r in records], [TICKET_CREATED, TICKET_ASSIGNED])
+        self.assertEqual(self.journal.record_count, 2)
+        
+        # A reopened journal sees the same records
+        reopened = ChangeJournal(self.path)
+        self.assertEqual(reopened.record_count, 2)
+    
+    def test_truncate_keeps_base(self):
+        """Test that truncation drops records and records the snapshot base"""
+        self.journal.append(TICKET_CREATED, {'ticket': {'id': 1}})
+        self.journal.truncate(base={'tickets.csv': [10, 20]})
+        
+        reopened = ChangeJournal(self.path)
+        self.assertEqual(list(reopened.records()), [])
+        self.assertEqual(reopened.base, {'tickets.csv': [10, 20]})
+    
+    def test_torn_record_is_skipped(self):
+        """Test that a partially written last line does not break replay"""
+        self.journal.append(TICKET_CREATED, {'ticket': {'id': 1}})
+        with open(self.path, 'a') as f:
+            f.write('{"type": "ticket_cre')
+        
+        records = list(ChangeJournal(self.path).records())
+        self.assertEqual(len(records), 1)
+    
+    def test_append_after_torn_record(self):
+        """Test that a record appended after a torn tail is replayed"""
+        self.journal.append(TICKET_CREATED, {'ticket': {'id': 1}})
+        with open(self.path, 'a') as f:
+            f.write('{"type": "ticket_cre')
+        
+        reopened = ChangeJournal(self.path)
+        reopened.append(TICKET_CREATED, {'ticket': {'id': 2}})
+        records = list(ChangeJournal(self.path).records())
+        self.assertEqual([r['data']['ticket']['id'] for r in records], [1, 2])
+        self.assertEqual(reopened.record_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
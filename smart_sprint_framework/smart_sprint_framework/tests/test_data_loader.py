@@ -0,0 +1,72 @@
+import unittest
+import sys
+import os
+import pandas as pd
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_loader import normalize_developers, normalize_tickets, normalize_metrics, to_records
+
+class TestDataLoader(unittest.TestCase):
+    def test_normalize_developers(self):
+        """Test skill parsing, numeric defaults and invalid row removal"""
+        df = pd.DataFrame([
+            {'id': 1, 'name': 'John', 'skills': "['python', 'django']", 'current_workload': 'nan', 'availability': 35, 'experience_level': 4},
+            {'id': 2, 'name': 'Mary', 'skills': 'react, css', 'current_workload': 5, 'availability': None, 'experience_level': 'senior'},
+            {'id': 3, 'name': None, 'skills': "['java']", 'current_workload': 0, 'availability': 40, 'experience_level': 2},
+            {'id': 4, 'name': 'Sam', 'skills': "['python', 'django']", 'current_workload': 1, 'availability': 40, 'experience_level': 2}
+        ])
+        
+        df, invalid_rows = normalize_developers(df)
+        developers = to_records(df)
+        
+        self.assertEqual(invalid_rows, [2])
+        self.assertEqual([d['id'] for d in developers], [1, 2, 4])
+        self.assertEqual(developers[0]['skills'], ['python', 'django'])
+        self.assertEqual(developers[0]['current_workload'], 0)
+        self.assertEqual(developers[1]['skills'], ['react', 'css'])
+        self.assertEqual(developers[1]['availability'], 40)
+        self.assertEqual(developers[1]['experience_level'], 3)
+        # Rows with the same skills cell must not share a list
+        self.assertIsNot(developers[0]['skills'], developers[2]['skills'])
+    
+    def test_normalize_tickets(self):
+        """Test task splitting, assignee coercion and status fixes"""
+        df = pd.DataFrame([
+            {'id': 1, 'title': 'API', 'tasks': 'Design, Build,Test', 'assigned_to': 2.0, 'status': 'backlog'},
+            {'id': 2, 'title': 'UI', 'tasks': None, 'assigned_to': None, 'status': None},
+            {'id': 3, 'title': 'DB', 'tasks': 'Migrate', 'assigned_to': 1.0, 'status': 'completed'}
+        ])
+        
+        df, fixed_ids = normalize_tickets(df)
+        tickets = to_records(df)
+        
+        self.assertEqual(fixed_ids, [1])
+        self.assertEqual(tickets[0]['tasks'], ['Design', 'Build', 'Test'])
+        self.assertEqual(tickets[0]['status'], 'in_progress')
+        self.assertIs(type(tickets[0]['assigned_to']), int)
+        self.assertEqual(tickets[1]['tasks'], [])
+        self.assertIsNone(tickets[1]['assigned_to'])
+        self.assertEqual(tickets[1]['status'], 'backlog')
+        self.assertEqual(tickets[2]['status'], 'completed')
+        self.assertIsNot(tickets[0]['entities'], tickets[1]['entities'])
+    
+    def test_normalize_metrics(self):
+        """Test that metric rows with invalid numbers are dropped"""
+        df = pd.DataFrame([
+            {'developer_id': 1, 'ticket_id': 1, 'completion_time': 4.5, 'revisions': 1, 'sentiment_score': 0.2},
+            {'developer_id': 'x', 'ticket_id': 2, 'completion_time': 3, 'revisions': 0, 'sentiment_score': 0.1},
+            {'developer_id': 2, 'ticket_id': 3, 'completion_time': None, 'revisions': 0, 'sentiment_score': 0.1}
+        ])
+        
+        df, invalid_count = normalize_metrics(df)
+        metrics = to_records(df)
+        
+        self.assertEqual(invalid_count, 2)
+        self.assertEqual(len(metrics), 1)
+        self.assertIs(type(metrics[0]['developer_id']), int)
+        self.assertIs(type(metrics[0]['completion_time']), float)
+
+if __name__ == '__main__':
+    unittest.main()
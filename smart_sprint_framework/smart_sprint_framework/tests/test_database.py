@@ -0,0 +1,158 @@
+import unittest
+import sys
+import os
+import tempfile
+import json
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import DatabaseManager, TicketRow
+
+class TestDatabaseManager(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.temp_dir.name, 'test.db'))
+        self.db.add_developers([
+            {'id': 1, 'name': 'John', 'skills': ['python'], 'availability': 40, 'current_workload': 0},
+            {'id': 2, 'name': 'Mary', 'skills': ['react'], 'availability': 40, 'current_workload': 0}
+        ])
+    
+    def tearDown(self):
+        self.db.close()
+        self.temp_dir.cleanup()
+    
+    def _metric(self, ticket_id):
+        return {'developer_id': 1, 'ticket_id': ticket_id, 'completion_time': 4.0,
+                'revisions': 0, 'sentiment_score': 0.5}
+    
+    def test_bulk_inserts(self):
+        """Test that bulk inserts write every row"""
+        count = self.db.add_performance_metrics([self._metric(i) for i in range(1, 301)])
+        self.db.add_tickets([
+            {'id': 1, 'title': 'API', 'description': 'Build API', 'priority': 'high', 'complexity': 3,
+             'estimated_hours': 8, 'status': 'completed', 'tasks': ['Design'], 'completion_time': 7.5}
+        ])
+        self.db.add_comments([{'ticket_id': 1, 'developer_id': 1, 'comment': 'Done'}])
+        
+        self.assertEqual(count, 300)
+        self.assertEqual(len(self.db.get_performance_metrics()), 300)
+        self.assertEqual(len(self.db.get_developers()), 2)
+        self.assertEqual(self.db.get_tickets()[0]['completion_time'], 7.5)
+        self.assertEqual(len(self.db.get_comments(1)), 1)
+    
+    def test_failed_bulk_insert_leaves_no_rows(self):
+        """Test that a bulk insert failing midway rolls back every row"""
+        metrics = [self._metric(i) for i in range(1, 11)]
+        del metrics[5]['revisions']
+        
+        with self.assertRaises(KeyError):
+            self.db.add_performance_metrics(metrics)
+        with self.assertRaises(Exception):
+            self.db.add_developers([
+                {'id': 3, 'name': 'Sam', 'skills': [], 'availability': 40, 'current_workload': 0},
+                {'id': 1, 'name': 'Duplicate', 'skills': [], 'availability': 40, 'current_workload': 0}
+            ])
+        
+        self.assertEqual(self.db.get_performance_metrics(), [])
+        self.assertEqual(len(self.db.get_developers()), 2)
+    
+    def test_transaction_is_atomic(self):
+        """Test that single-row writes inside a unit of work commit together"""
+        with self.assertRaises(RuntimeError):
+            with self.db.transaction():
+                self.db.add_performance_metric(self._metric(1))
+                self.db.update_developer(1, {'current_workload': 8})
+                raise RuntimeError("abort")
+        
+        self.assertEqual(self.db.get_performance_metrics(), [])
+        self.assertEqual(self.db.get_developers()[0]['current_workload'], 0)
+        
+        with self.db.transaction():
+            self.db.add_performance_metric(self._metric(1))
+            with self.db.transaction():
+                self.db.update_developer(1, {'current_workload': 8})
+        
+        self.assertEqual(len(self.db.get_performance_metrics()), 1)
+        self.assertEqual(self.db.get_developers()[0]['current_workload'], 8)
+    
+    def test_keyset_pagination(self):
+        """Test that paging through filtered tickets returns each match exactly once"""
+        self.db.add_tickets([
+            {'id': i, 'title': f'Ticket {i}', 'description': '', 'priority': 'high' if i % 2 else 'low',
+             'complexity': 2, 'estimated_hours': 4, 'status': 'backlog' if i % 3 else 'in_progress',
+             'assigned_to': 1 if i % 3 == 0 else None}
+            for i in range(1, 121)
+        ])
+        
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = self.db.get_tickets_page(status='backlog', priority='high', cursor=cursor, limit=7)
+            self.assertLessEqual(len(page), 7)
+            seen.extend(t['id'] for t in page)
+            if cursor is None:
+                break
+        
+        expected = [i for i in range(120, 0, -1) if i % 3 and i % 2]
+        self.assertEqual(seen, expected)
+        
+        assigned, cursor = self.db.get_tickets_page(assigned_to=1, limit=100)
+        self.assertEqual(len(assigned), 40)
+        self.assertIsNone(cursor)
+        
+        with self.assertRaises(ValueError):
+            self.db.get_tickets_page(cursor='not a cursor')
+    
+    def test_filtered_queries_use_indexes(self):
+        """Test that filtered lookups search an index instead of scanning the table"""
+        conn = self.db.get_connection()
+        queries = [
+            ("SELECT * FROM tickets WHERE status = ? ORDER BY created_at DESC", ('backlog',)),
+            ("SELECT * FROM tickets WHERE assigned_to = ?", (1,)),
+            ("SELECT * FROM performance_metrics WHERE developer_id = ? ORDER BY timestamp DESC", (1,)),
+            ("SELECT * FROM comments WHERE ticket_id = ? ORDER BY timestamp DESC", (1,))
+        ]
+        for query, params in queries:
+            plan = ' '.join(row[3] for row in conn.execute('EXPLAIN QUERY PLAN ' + query, params))
+            self.assertIn('USING INDEX', plan)
+            self.assertNotIn('TEMP B-TREE', plan)
+    
+    def test_ticket_rows_decode_lazily(self):
+        """Test that JSON columns are decoded on first access and behave like a plain dict"""
+        self.db.add_tickets([
+            {'id': 1, 'title': 'API', 'description': 'Build API', 'priority': 'high', 'complexity': 3,
+             'estimated_hours': 8, 'status': 'backlog', 'tasks': ['Design', 'Build'],
+             'entities': {'priorities': ['high']}}
+        ])
+        
+        ticket = self.db.get_tickets()[0]
+        self.assertIsInstance(ticket, TicketRow)
+        self.assertIsInstance(dict.get(ticket, 'tasks'), str)
+        self.assertEqual(ticket['tasks'], ['Design', 'Build'])
+        self.assertIs(ticket['tasks'], ticket['tasks'])
+        self.assertIsInstance(dict.get(ticket, 'entities'), str)
+        
+        # Copies and JSON encoding never see the raw column text
+        self.assertEqual(dict(ticket)['entities'], {'priorities': ['high']})
+        self.assertEqual(json.loads(json.dumps(ticket))['dependencies'], [])
+    
+    def test_ticket_projection(self):
+        """Test that a column projection only fetches the requested fields"""
+        self.db.add_tickets([
+            {'id': i, 'title': f'Ticket {i}', 'description': '', 'priority': 'low', 'complexity': 1,
+             'estimated_hours': i, 'status': 'backlog', 'tasks': ['Build']}
+            for i in range(1, 4)
+        ])
+        
+        tickets = self.db.get_tickets(columns=['id', 'status', 'estimated_hours'])
+        self.assertEqual(set(tickets[0]), {'id', 'status', 'estimated_hours'})
+        
+        page, _ = self.db.get_tickets_page(columns=['status'], limit=2)
+        self.assertEqual(set(page[0]), {'status', 'id', 'created_at'})
+        
+        with self.assertRaises(ValueError):
+            self.db.get_tickets(columns=['id; DROP TABLE tickets'])
+
+if __name__ == '__main__':
+    unittest.main()
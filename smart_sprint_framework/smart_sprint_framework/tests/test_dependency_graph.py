@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dependency_graph import DependencyGraph, parse_dependencies
+from error_handler import ConflictError
+
+class TestDependencyGraph(unittest.TestCase):
+    def setUp(self):
+        # 2 and 3 wait for 1, 4 waits for both 2 and 3
+        self.graph = DependencyGraph([
+            {'id': 1},
+            {'id': 2, 'dependencies': [1]},
+            {'id': 3, 'dependencies': '1'},
+            {'id': 4, 'dependencies': '2,3'}
+        ])
+    
+    def test_parse_dependencies(self):
+        """Test the dependency formats found in tickets"""
+        self.assertEqual(parse_dependencies('4, 5'), [4, 5])
+        self.assertEqual(parse_dependencies(7.0), [7])
+        self.assertEqual(parse_dependencies(float('nan')), [])
+        self.assertEqual(parse_dependencies(['2', 3, None, 'auth']), [2, 3, 'auth'])
+    
+    def test_transitive_blocked_counts(self):
+        """Test that counts are transitive and follow inserted and removed edges"""
+        self.assertEqual(self.graph.blocked_count(1), 3)
+        self.assertEqual(self.graph.blocked_count(2), 1)
+        self.assertEqual(self.graph.blocked_count(4), 0)
+        self.assertEqual(self.graph.dependents(1), {2, 3})
+        
+        self.graph.add_ticket(5, [4])
+        self.assertEqual(self.graph.blocked_count(1), 4)
+        self.assertEqual(self.graph.blocked_count(3), 2)
+        
+        self.graph.remove_dependency(4, 3)
+        self.assertEqual(self.graph.blocked_count(3), 0)
+        self.assertEqual(self.graph.blocked_count(1), 4)
+        
+        self.graph.set_dependencies(2, [])
+        self.assertEqual(self.graph.blocked_count(1), 1)
+    
+    def test_cycles_rejected(self):
+        """Test that edges closing a cycle are refused on insert and dropped on rebuild"""
+        with self.assertRaises(ConflictError):
+            self.graph.add_dependency(1, 4)
+        with self.assertRaises(ConflictError):
+            self.graph.add_dependency(2, 2)
+        self.assertEqual(self.graph.add_ticket(1, [4, 5]), [4])
+        
+        graph = DependencyGraph([
+            {'id': 1, 'dependencies': [3]},
+            {'id': 2, 'dependencies': [1]},
+            {'id': 3, 'dependencies': [2]}
+        ])
+        self.assertEqual(sum(len(deps) for deps in graph.depends_on.values()), 2)
+        self.assertEqual(sorted(graph.blocked_count(i) for i in (1, 2, 3)), [0, 1, 2])
+
+if __name__ == '__main__':
+    unittest.main()
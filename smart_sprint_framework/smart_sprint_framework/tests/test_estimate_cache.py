@@ -0,0 +1,47 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from estimate_cache import EstimateCache, StatsVersions, input_seed
+
+class TestEstimateCache(unittest.TestCase):
+    def test_least_recently_used_evicted(self):
+        """Test that the cache keeps its most recently used entries up to its bound"""
+        cache = EstimateCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.get_or_compute('c', lambda: 0), 3)
+        self.assertEqual(cache.get_or_compute('d', lambda: 4), 4)
+        self.assertNotIn('a', cache)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+    
+    def test_stats_versions(self):
+        """Test that versions move with their developer and never repeat after a reset"""
+        versions = StatsVersions()
+        first, team = versions.version(1), versions.team
+        versions.bump(2)
+        self.assertEqual(versions.version(1), first)
+        self.assertNotEqual(versions.team, team)
+        
+        versions.bump(1)
+        bumped = versions.version(1)
+        self.assertNotEqual(bumped, first)
+        versions.reset()
+        versions.bump(1)
+        self.assertNotEqual(versions.version(1), bumped)
+    
+    def test_input_seed(self):
+        """Test that seeds depend only on the inputs"""
+        self.assertEqual(input_seed(8, 3, None), input_seed(8, 3, None))
+        self.assertNotEqual(input_seed(8, 3, None), input_seed(8, 4, None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import sys
+import os
+import random
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metric_columns import MetricColumns
+
+class TestMetricColumns(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(3)
+        self.rows = [
+            (rng.randint(1, 5), i, rng.uniform(1, 30), rng.randint(0, 4), rng.random(), None if i % 7 == 0 else 1.7e9 + i)
+            for i in range(1, 301)
+        ]
+        # Start small so appends have to grow the arrays
+        self.columns = MetricColumns(capacity=4)
+        for row in self.rows:
+            self.columns.append(*row)
+    
+    def test_append_grows(self):
+        """Test that every appended row is kept in order across growth"""
+        self.assertEqual(len(self.columns), len(self.rows))
+        self.assertEqual(self.columns.column('ticket_id').tolist(), [row[1] for row in self.rows])
+        self.assertTrue(np.isnan(self.columns.column('timestamp')[6]))
+        with self.assertRaises(ValueError):
+            self.columns.column('completion_time')[0] = 0
+    
+    def test_frame_shares_memory(self):
+        """Test that the DataFrame view does not copy and keeps its rows after later appends"""
+        frame = self.columns.frame()
+        self.assertTrue(np.shares_memory(frame['completion_time'].to_numpy(), self.columns.column('completion_time')))
+        self.assertEqual(list(frame.columns), ['developer_id', 'ticket_id', 'completion_time', 'revisions', 'sentiment_score', 'timestamp'])
+        
+        self.columns.append(1, 999, 2.0, 0, 0.5)
+        self.assertEqual(len(frame), len(self.rows))
+        self.assertEqual(len(self.columns.frame()), len(self.rows) + 1)
+    
+    def test_group_sums(self):
+        """Test that the vectorized group-by matches a Python loop"""
+        keys, counts, sums = self.columns.group_sums('developer_id')
+        for i, dev_id in enumerate(keys.tolist()):
+            dev_rows = [row for row in self.rows if row[0] == dev_id]
+            self.assertEqual(counts[i], len(dev_rows))
+            self.assertAlmostEqual(sums['completion_time'][i], sum(row[2] for row in dev_rows))
+            self.assertAlmostEqual(sums['revisions'][i], sum(row[3] for row in dev_rows))
+            self.assertAlmostEqual(sums['sentiment_score'][i], sum(row[4] for row in dev_rows))
+        self.assertEqual(sorted(keys.tolist()), sorted({row[0] for row in self.rows}))
+        
+        empty_keys, empty_counts, _ = MetricColumns().group_sums()
+        self.assertEqual(len(empty_keys), 0)
+        self.assertEqual(len(empty_counts), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metric_log import MetricLog
+from storage import CsvStorage
+from change_journal import METRIC_RECORDED, TICKET_COMPLETED
+
+def make_metric(ticket_id, completion_time=5.0):
+    return {
+        'developer_id': 1, 'ticket_id': ticket_id, 'completion_time': completion_time,
+        'revisions': 1, 'sentiment_score': 0.5, 'timestamp': '2025-07-30T16:00:00'
+    }
+
+class TestMetricLog(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'performance_data_small.csv')
+        self.log = MetricLog(self.path)
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_append_and_read_from(self):
+        """Test that appended rows are read back from a byte offset"""
+        self.log.append(make_metric(1))
+        offset = self.log.size()
+        self.log.append(make_metric(2, 7.5))
+        self.log.append(make_metric(3))
+        
+        with open(self.path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], 'developer_id,ticket_id,completion_time,revisions,sentiment_score,timestamp')
+        self.assertEqual(len(lines), 4)
+        
+        appended = self.log.read_from(offset)
+        self.assertEqual([m['ticket_id'] for m in appended], [2, 3])
+        self.assertEqual(appended[0]['completion_time'], 7.5)
+        self.assertEqual(self.log.read_from(self.log.size()), [])
+        # An offset inside a row cannot be trusted
+        self.assertIsNone(self.log.read_from(offset + 1))
+    
+    def test_repair_torn_row(self):
+        """Test that a row cut short by a crash is dropped"""
+        self.log.append(make_metric(1))
+        size = self.log.size()
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('1,2,3.')
+        
+        self.assertTrue(self.log.repair())
+        self.assertEqual(self.log.size(), size)
+        self.assertFalse(self.log.repair())
+    
+    def test_csv_storage_appends_metrics(self):
+        """Test that the CSV backend appends metrics to the log instead of the journal"""
+        storage = CsvStorage(os.path.join(self.temp_dir.name, 'journal.jsonl'), metrics_path=self.path)
+        self.assertFalse(storage.record_change(METRIC_RECORDED, {'metric': make_metric(4)}))
+        self.assertTrue(storage.record_change(TICKET_COMPLETED, {'ticket_id': 4, 'fields': {'status': 'completed'}}))
+        
+        self.assertEqual(storage.journal.record_count, 1)
+        with open(self.path, 'rb') as f:
+            header_size = len(f.readline())
+        self.assertEqual([m['ticket_id'] for m in storage.metrics_log.read_from(header_size)], [4])
+
+if __name__ == '__main__':
+    unittest.main()
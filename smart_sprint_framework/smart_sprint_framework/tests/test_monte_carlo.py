@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from monte_carlo import MonteCarloEstimator
+
+class TestMonteCarloEstimator(unittest.TestCase):
+    def test_seeded_estimates_repeat(self):
+        """Test that estimators with the same seed give the same estimates"""
+        first = MonteCarloEstimator(seed=11).estimate_task_duration(8, 3)
+        second = MonteCarloEstimator(seed=11).estimate_task_duration(8, 3)
+        self.assertEqual(first, second)
+        
+        self.assertEqual(first['estimated_hours'], 8)
+        self.assertEqual(first['complexity'], 3)
+        low, high = first['confidence_interval']
+        self.assertTrue(8 * 0.6 <= low < first['p80_duration'] < high <= 8 * 1.4)
+        self.assertAlmostEqual(first['mean_duration'], 8, delta=0.3)
+    
+    def test_batch_estimates(self):
+        """Test that a batch is estimated per task, across several matrix chunks"""
+        estimator = MonteCarloEstimator(seed=2, batch_rows=3)
+        hours = np.array([2, 4, 8, 16, 32, 1, 5])
+        complexities = np.array([1, 2, 3, 4, 5, 1, 5])
+        estimates = estimator.estimate_task_durations(hours, complexities)
+        
+        self.assertEqual(len(estimates), len(hours))
+        for estimate, task_hours, complexity in zip(estimates, hours, complexities):
+            min_factor, max_factor = estimator.complexity_factors[complexity]
+            self.assertEqual(estimate['complexity'], complexity)
+            self.assertGreaterEqual(estimate['confidence_interval'][0], task_hours * min_factor)
+            self.assertLessEqual(estimate['confidence_interval'][1], task_hours * max_factor)
+        
+        # Wide complexity-5 ranges push p80 past 1.3x the estimate
+        self.assertEqual(estimates[0]['risk_level'], 'low')
+        self.assertEqual(estimates[4]['risk_level'], 'medium')
+        
+        with self.assertRaises(ValueError):
+            estimator.estimate_task_durations([1, 2], [3])
+    
+    def test_adaptive_estimates(self):
+        """Test that adaptive estimates stop within the tolerance and report their samples"""
+        loose = MonteCarloEstimator(seed=5).estimate_task_duration(8, 5, tolerance=0.05)
+        tight = MonteCarloEstimator(seed=5).estimate_task_duration(8, 5, tolerance=0.003)
+        
+        for estimate, tolerance in ((loose, 0.05), (tight, 0.003)):
+            self.assertLessEqual(estimate['relative_error'], tolerance)
+            self.assertEqual(estimate['samples'] % 256, 0)
+        self.assertGreater(tight['samples'], loose['samples'])
+        # p80 of a uniform 0.4-1.6 factor is 1.36
+        self.assertAlmostEqual(tight['p80_duration'], 8 * 1.36, delta=8 * 0.01)
+        
+        capped = MonteCarloEstimator(seed=5, max_simulations=2048).estimate_task_duration(8, 5, tolerance=1e-6)
+        self.assertEqual(capped['samples'], 2048)
+        self.assertGreater(capped['relative_error'], 1e-6)
+        self.assertNotIn('samples', MonteCarloEstimator(seed=5).estimate_task_duration(8, 5))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import sys
+import os
+import random
+import datetime
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from performance_tracker import PerformanceTracker
+from metric_window import MetricWindow
+
+class TestPerformanceTracker(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.metrics = [
+            {'developer_id': rng.randint(1, 4), 'ticket_id': i, 'completion_time': rng.uniform(2, 20),
+             'revisions': rng.randint(0, 3), 'sentiment_score': rng.random(), 'timestamp': None}
+            for i in range(1, 41)
+        ]
+        self.tracker = PerformanceTracker()
+        self.tracker.load_metrics(self.metrics[:30])
+    
+    def test_aggregates_match_full_scan(self):
+        """Test that the running sums agree with recomputing from every metric"""
+        for metric in self.metrics[30:]:
+            self.tracker.track_performance(metric['developer_id'], metric['ticket_id'], metric['completion_time'],
+                                           metric['revisions'], metric['sentiment_score'])
+        
+        summary = self.tracker.get_historical_performance_data()
+        self.assertEqual(set(summary), {m['developer_id'] for m in self.metrics})
+        for dev_id, stats in summary.items():
+            dev_metrics = [m for m in self.metrics if m['developer_id'] == dev_id]
+            self.assertEqual(stats['tickets_completed'], len(dev_metrics))
+            self.assertAlmostEqual(stats['velocity'], sum(m['completion_time'] for m in dev_metrics) / len(dev_metrics))
+            self.assertAlmostEqual(stats['accuracy'], 1.0 / (1.0 + sum(m['revisions'] for m in dev_metrics) * 0.1))
+            self.assertAlmostEqual(stats['sentiment'], sum(m['sentiment_score'] for m in dev_metrics) / len(dev_metrics))
+        
+        self.assertIsNone(self.tracker.get_developer_summary(99))
+        self.assertEqual(self.tracker.calculate_velocity(99), 0)
+    
+    def test_ticket_index(self):
+        """Test per-ticket lookups, including after ticket ids are renumbered"""
+        self.assertEqual(self.tracker.get_ticket_metrics(5)[0]['ticket_id'], 5)
+        self.tracker.remap_ticket_ids({5: 105})
+        self.assertEqual(self.tracker.get_ticket_metrics(5), [])
+        self.assertEqual(len(self.tracker.get_ticket_metrics(105)), 1)
+        self.assertIn(105, self.tracker.aggregate('ticket_id'))
+        self.assertNotIn(5, self.tracker.metrics_frame()['ticket_id'].tolist())
+    
+    def test_aggregate_matches_summary(self):
+        """Test that the columnar group-by agrees with the running sums"""
+        aggregate = self.tracker.aggregate()
+        self.assertEqual(len(self.tracker.metrics_frame()), 30)
+        for dev_id, stats in self.tracker.get_historical_performance_data().items():
+            self.assertEqual(aggregate[dev_id]['count'], stats['tickets_completed'])
+            self.assertAlmostEqual(aggregate[dev_id]['completion_time'] / aggregate[dev_id]['count'], stats['velocity'])
+
+    def test_windowed_views(self):
+        """Test the last-tickets, last-days and decayed views against their definitions"""
+        tracker = PerformanceTracker(recent_tickets=3, recent_days=7, decay=0.5)
+        now = datetime.datetime.now()
+        for age_days, completion_time in [(30, 100), (20, 100), (5, 4), (3, 6), (1, 8)]:
+            timestamp = (now - datetime.timedelta(days=age_days)).isoformat()
+            tracker.add_metric({'developer_id': 1, 'ticket_id': age_days, 'completion_time': completion_time,
+                                'revisions': 1, 'sentiment_score': 0.5, 'timestamp': timestamp})
+        tracker.add_metric({'developer_id': 2, 'ticket_id': 99, 'completion_time': 10,
+                            'revisions': 0, 'sentiment_score': 1.0, 'timestamp': None})
+        
+        last_tickets = tracker.get_historical_performance_data('last_tickets')[1]
+        self.assertAlmostEqual(last_tickets['velocity'], 6)
+        self.assertEqual(last_tickets['tickets_completed'], 3)
+        self.assertAlmostEqual(last_tickets['accuracy'], 1 / 1.3)
+        
+        last_days = tracker.get_historical_performance_data('last_days')
+        self.assertAlmostEqual(last_days[1]['velocity'], 6)
+        self.assertNotIn(2, last_days)
+        
+        decayed = tracker.get_developer_summary(1, 'decayed')
+        weights = [0.5 ** 4, 0.5 ** 3, 0.5 ** 2, 0.5, 1]
+        expected = sum(w * t for w, t in zip(weights, [100, 100, 4, 6, 8])) / sum(weights)
+        self.assertAlmostEqual(decayed['velocity'], expected)
+        self.assertEqual(tracker.get_developer_summary(1)['tickets_completed'], 5)
+        with self.assertRaises(ValueError):
+            tracker.get_developer_summary(1, 'weekly')
+        
+        # Memory stays bounded and the running sums stay exact across many evictions
+        window = MetricWindow(4, ('x',))
+        for value in range(1000):
+            window.push((value * 0.1,))
+        self.assertEqual(window.size, 4)
+        self.assertAlmostEqual(window.sum('x'), sum(v * 0.1 for v in range(996, 1000)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quantile_sketch import TDigest, CompletionSketches
+
+class TestQuantileSketch(unittest.TestCase):
+    def setUp(self):
+        self.values = np.random.default_rng(5).lognormal(2, 0.6, 20000)
+    
+    def test_quantiles_close_to_exact(self):
+        """Test that the digest stays within 1% of the exact quantiles in bounded memory"""
+        digest = TDigest()
+        for value in self.values:
+            digest.add(value)
+        
+        estimates = digest.quantiles([0.5, 0.8, 0.95])
+        for estimate, exact in zip(estimates, np.quantile(self.values, [0.5, 0.8, 0.95])):
+            self.assertAlmostEqual(estimate, exact, delta=exact * 0.01)
+        self.assertEqual(digest.quantile(0), self.values.min())
+        self.assertEqual(digest.quantile(1), self.values.max())
+        self.assertLess(len(digest._means), digest.compression)
+        self.assertIsNone(TDigest().quantile(0.5))
+    
+    def test_merge(self):
+        """Test that merged digests describe both inputs"""
+        left, right = TDigest(), TDigest()
+        for value in self.values[:5000]:
+            left.add(value)
+        for value in self.values[5000:]:
+            right.add(value)
+        left.merge(right)
+        
+        self.assertEqual(left.count, len(self.values))
+        exact = np.quantile(self.values, 0.8)
+        self.assertAlmostEqual(left.quantile(0.8), exact, delta=exact * 0.01)
+    
+    def test_completion_sketches(self):
+        """Test percentiles per developer and per complexity level"""
+        tickets_by_id = {1: {'complexity': 2}, 2: {'complexity': '2'}, 3: {'complexity': 5}}
+        metrics = [
+            {'developer_id': 7, 'ticket_id': 1, 'completion_time': 4.0},
+            {'developer_id': 7, 'ticket_id': 2, 'completion_time': 6.0},
+            {'developer_id': 8, 'ticket_id': 3, 'completion_time': 20.0}
+        ]
+        sketches = CompletionSketches()
+        sketches.rebuild(metrics, tickets_by_id)
+        
+        self.assertEqual(sketches.percentiles(complexity=2)['count'], 2)
+        self.assertEqual(sketches.percentiles(complexity='5')['p50'], 20.0)
+        self.assertEqual(sketches.percentiles(developer_id=7)['p50'], 5.0)
+        self.assertIsNone(sketches.percentiles(developer_id=9))
+        
+        sketches.add({'developer_id': 9, 'ticket_id': 4, 'completion_time': 3.0}, complexity=1)
+        self.assertEqual(sketches.percentiles(developer_id=9)['p95'], 3.0)
+        self.assertEqual(sketches.percentiles(complexity=1)['count'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
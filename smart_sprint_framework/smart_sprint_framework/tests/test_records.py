@@ -0,0 +1,60 @@
+import unittest
+import sys
+import os
+import json
+import pickle
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import records
+from records import Ticket, PerformanceMetric, json_default
+
+class TestRecords(unittest.TestCase):
+    def test_dict_compatibility(self):
+        """Test that records behave like the dicts they replace"""
+        ticket = Ticket({'id': 1, 'title': 'Login', 'status': 'backlog', 'jira': 'SS-1'})
+        
+        self.assertEqual(ticket['title'], 'Login')
+        self.assertNotIn('completion_time', ticket)
+        self.assertIsNone(ticket.get('completion_time'))
+        with self.assertRaises(KeyError):
+            ticket['completion_time']
+        
+        ticket.update({'status': 'completed', 'completion_time': 5})
+        del ticket['title']
+        self.assertEqual(list(ticket), ['id', 'status', 'completion_time', 'jira'])
+        self.assertEqual(ticket, {'id': 1, 'status': 'completed', 'completion_time': 5, 'jira': 'SS-1'})
+        self.assertEqual(pickle.loads(pickle.dumps(ticket)), ticket)
+        self.assertEqual(json.loads(json.dumps([ticket], default=json_default))[0]['jira'], 'SS-1')
+        
+        ticket.clear()
+        self.assertEqual(len(ticket), 0)
+        self.assertFalse(hasattr(ticket, '__dict__'))
+    
+    def test_shared_values(self):
+        """Test that repeated tasks lists and default entities are stored once"""
+        entities = {'priorities': ['medium'], 'dependencies': [], 'deadlines': [], 'tasks': []}
+        first = Ticket({'id': 1, 'tasks': ['Design', 'Test'], 'entities': dict(entities)})
+        second = Ticket({'id': 2, 'tasks': ['Design', 'Test'], 'entities': dict(entities)})
+        
+        self.assertEqual(first['tasks'], ('Design', 'Test'))
+        self.assertIs(first['tasks'], second['tasks'])
+        self.assertIs(first['entities'], second['entities'])
+        # The shared entities cannot be changed through one ticket, only replaced
+        with self.assertRaises(TypeError):
+            first['entities']['priorities'] = ['high']
+        self.assertEqual(second['entities']['priorities'], ('medium',))
+        self.assertEqual(json.loads(json.dumps(first['entities'])), entities)
+        self.assertIs(pickle.loads(pickle.dumps(first))['entities'], first['entities'])
+        
+        # The shared tasks cache stays bounded however many distinct lists are seen
+        for i in range(records.SHARED_TASKS_LIMIT + 10):
+            Ticket({'id': i, 'tasks': [f'task {i}']})
+        self.assertLessEqual(len(records._shared_tasks), records.SHARED_TASKS_LIMIT)
+        
+        metric = PerformanceMetric({'developer_id': 1, 'ticket_id': 2})
+        self.assertIs(PerformanceMetric.from_mapping(metric), metric)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import sys
+import os
+import time
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from save_scheduler import SaveScheduler
+
+class TestSaveScheduler(unittest.TestCase):
+    def setUp(self):
+        self.flushes = []
+        self.scheduler = SaveScheduler(lambda: self.flushes.append(time.monotonic()),
+                                       quiet_period=0.1, max_delay=1.0)
+    
+    def tearDown(self):
+        self.scheduler.shutdown()
+    
+    def test_burst_is_coalesced(self):
+        """Test that a burst of changes produces a single flush"""
+        for _ in range(50):
+            self.scheduler.mark_dirty()
+        
+        time.sleep(0.5)
+        self.assertEqual(len(self.flushes), 1)
+        self.assertFalse(self.scheduler.dirty)
+    
+    def test_max_delay_bounds_flush(self):
+        """Test that continuous changes still flush after the maximum delay"""
+        self.scheduler.quiet_period = 0.5
+        self.scheduler.max_delay = 0.2
+        
+        start = time.monotonic()
+        while time.monotonic() - start < 0.6:
+            self.scheduler.mark_dirty()
+            time.sleep(0.02)
+        
+        self.assertGreaterEqual(len(self.flushes), 1)
+    
+    def test_shutdown_flushes_pending_changes(self):
+        """Test that pending changes are flushed on shutdown"""
+        self.scheduler.quiet_period = 60
+        self.scheduler.mark_dirty()
+        self.scheduler.shutdown()
+        self.assertEqual(len(self.flushes), 1)
+
+if __name__ == '__main__':
+    unittest.main()
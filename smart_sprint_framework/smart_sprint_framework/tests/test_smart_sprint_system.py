@@ -1,11 +1,13 @@
 import unittest
 import sys
 import os
+import tempfile
 
 # Add parent directory to path to import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from smart_sprint_system import SmartSprintSystem
+from ticket_index import summarize
 from data_generator import generate_small_developers_csv, generate_small_sprint_documents_csv, generate_small_performance_data
 
 class TestSmartSprintSystem(unittest.TestCase):
@@ -96,6 +98,147 @@ class TestSmartSprintSystem(unittest.TestCase):
                 if developer:
                     self.assertEqual(developer['current_workload'], 0)
     
+    def test_id_lookups(self):
+        """Test that id lookups stay in step with created and renumbered tickets"""
+        ticket = self.system.process_feature_story({
+            "title": "Indexed Feature",
+            "description": "Look this ticket up by id",
+            "priority": "low",
+            "estimated_hours": 2
+        })
+        self.assertIs(self.system.get_ticket(ticket['id']), ticket)
+        
+        self.system.reset_ticket_ids()
+        for t in self.system.tickets:
+            self.assertIs(self.system.get_ticket(t['id']), t)
+        for d in self.system.developers:
+            self.assertIs(self.system.get_developer(d['id']), d)
+        self.assertIsNone(self.system.get_ticket(len(self.system.tickets) + 1))
+    
+    def test_journal_replay(self):
+        """Test that journaled changes survive a restart without a full save"""
+        ticket = self.system.process_feature_story({
+            "title": "Journaled Feature",
+            "description": "This ticket only exists in the change journal",
+            "priority": "low",
+            "estimated_hours": 4
+        })
+        
+        # Hold the state lock so the background save cannot compact the journal first
+        with self.system.state_lock:
+            restarted = SmartSprintSystem()
+        replayed = next((t for t in restarted.tickets if t['id'] == ticket['id']), None)
+        self.assertIsNotNone(replayed)
+        self.assertEqual(replayed['title'], "Journaled Feature")
+    
+    def test_auto_save_compaction_threshold(self):
+        """Test that background saves only sync a short journal and compact it once it is long"""
+        storage = self.system.storage
+        self.system.manual_save()
+        try:
+            storage.journal_compaction_threshold = 1000
+            self.system.process_feature_story({
+                "title": "Synced Feature",
+                "description": "Only journaled until compaction",
+                "priority": "low",
+                "estimated_hours": 2
+            })
+            signature = storage.data_file_signature()
+            self.assertTrue(self.system.auto_save())
+            self.assertEqual(storage.data_file_signature(), signature)
+            self.assertGreater(storage.journal.record_count, 0)
+            
+            storage.journal_compaction_threshold = 1
+            self.assertTrue(self.system.auto_save())
+            self.assertEqual(storage.journal.record_count, 0)
+        finally:
+            storage.journal_compaction_threshold = 200
+    
+    def test_metrics_log_restart(self):
+        """Test that metrics appended after the last save are loaded with the snapshot on restart"""
+        self.system.manual_save()
+        ticket = self.system.process_feature_story({
+            "title": "Logged Feature",
+            "description": "Its metric is only in the appended rows",
+            "priority": "low",
+            "estimated_hours": 1
+        })
+        developer = max(self.system.developers, key=lambda d: d['availability'] - d['current_workload'])
+        self.system.assign_developer_to_ticket(ticket['id'], developer['id'])
+        self.assertTrue(self.system.complete_ticket(ticket['id'], completion_time=3, revisions=0, sentiment_score=0.5))
+        
+        with self.system.state_lock:
+            restarted = SmartSprintSystem()
+        self.assertEqual(restarted.load_stats['source'], 'snapshot')
+        self.assertEqual(len(restarted.performance_tracker.metrics), len(self.system.performance_tracker.metrics))
+        self.assertEqual(restarted.performance_tracker.get_ticket_metrics(ticket['id'])[-1]['completion_time'], 3)
+    
+    def test_save_keeps_snapshot_metrics(self):
+        """Test that a save after a completion leaves the snapshot's metrics archive alone"""
+        self.system.manual_save()
+        metrics_path = self.system.state_snapshot.metrics_path
+        metrics_mtime = os.stat(metrics_path).st_mtime_ns
+        ticket = self.system.process_feature_story({
+            "title": "Archived Feature",
+            "description": "Its metric stays out of the metrics archive",
+            "priority": "low",
+            "estimated_hours": 1
+        })
+        developer = max(self.system.developers, key=lambda d: d['availability'] - d['current_workload'])
+        self.system.assign_developer_to_ticket(ticket['id'], developer['id'])
+        self.assertTrue(self.system.complete_ticket(ticket['id'], completion_time=4, revisions=0, sentiment_score=0.5))
+        self.system.manual_save()
+        
+        self.assertEqual(os.stat(metrics_path).st_mtime_ns, metrics_mtime)
+        with self.system.state_lock:
+            restarted = SmartSprintSystem()
+        self.assertEqual(restarted.load_stats['source'], 'snapshot')
+        self.assertEqual(restarted.performance_tracker.get_ticket_metrics(ticket['id'])[-1]['completion_time'], 4)
+    
+    def test_cached_timeline_estimates(self):
+        """Test that repeated timeline estimates come from the cache and match fresh ones"""
+        ticket = self.system.process_feature_story({
+            "title": "Estimated Feature",
+            "description": "Estimate this ticket twice",
+            "priority": "low",
+            "estimated_hours": 6
+        })
+        is_trained = self.system.training_module.is_trained
+        self.system.training_module.is_trained = False
+        try:
+            first = self.system.estimate_ticket_timeline(ticket['id'])
+            hits = self.system.estimate_cache.hits
+            self.assertEqual(self.system.estimate_ticket_timeline(ticket['id']), first)
+            self.assertEqual(self.system.estimate_cache.hits, hits + 1)
+            
+            self.system.estimate_cache.clear()
+            self.assertEqual(self.system.estimate_ticket_timeline(ticket['id']), first)
+        finally:
+            self.system.training_module.is_trained = is_trained
+    
+    def test_sqlite_restart(self):
+        """Test that a sqlite-backed system restarts over its database with completed tickets"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = os.path.join(temp_dir, 'restart.db')
+            first = SmartSprintSystem(storage_backend='sqlite', db_path=db_path)
+            next_id = max((t['id'] for t in first.tickets), default=0) + 1
+            # Completed tickets seeded without a completion time, as from the CSV files
+            for ticket_id in range(next_id, next_id + 5):
+                first.storage.db.add_ticket({
+                    'id': ticket_id, 'title': 'Seeded', 'description': 'Done before tracking', 'priority': 'low',
+                    'complexity': 2, 'estimated_hours': 3, 'status': 'completed', 'tasks': []
+                })
+            first.shutdown()
+            
+            restarted = SmartSprintSystem(storage_backend='sqlite', db_path=db_path)
+            try:
+                self.assertEqual(restarted.load_stats['source'], 'sqlite')
+                seeded = restarted.get_ticket(next_id)
+                self.assertEqual(seeded['status'], 'completed')
+                self.assertNotIn('completion_time', seeded)
+            finally:
+                restarted.shutdown()
+    
     def test_get_system_status(self):
         """Test getting system status"""
         status = self.system.get_system_status()
@@ -114,6 +257,25 @@ class TestSmartSprintSystem(unittest.TestCase):
         for key in expected_keys:
             self.assertIn(key, status)
     
+    def test_summary_counts(self):
+        """Test that the running counters agree with a full scan after ticket transitions"""
+        ticket = self.system.process_feature_story({
+            "title": "Counted Feature",
+            "description": "Move this ticket through every status",
+            "priority": "low",
+            "estimated_hours": 1
+        })
+        developer = max(self.system.developers, key=lambda d: d['availability'] - d['current_workload'])
+        self.system.assign_developer_to_ticket(ticket['id'], developer['id'])
+        self.system.complete_ticket(ticket['id'], 2, 0, 0.8)
+        
+        counts = self.system.get_summary_counts()
+        expected = summarize(self.system.tickets, self.system.developers)
+        self.assertEqual(counts['status_counts'], expected['status_counts'])
+        self.assertEqual(counts['total_tickets'], expected['total_tickets'])
+        self.assertAlmostEqual(counts['total_workload'], expected['total_workload'])
+        self.assertAlmostEqual(counts['completion_time_total'], expected['completion_time_total'])
+    
     def test_get_developer_performance(self):
         """Test getting developer performance"""
         if self.system.developers:
@@ -126,6 +288,8 @@ class TestSmartSprintSystem(unittest.TestCase):
                 self.assertIn('accuracy', performance)
                 self.assertIn('total_completed_tickets', performance)
                 self.assertIn('average_sentiment', performance)
+                self.assertLessEqual(performance['completion_time_percentiles']['p50'],
+                                     performance['completion_time_percentiles']['p95'])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,64 @@
+import unittest
+import sys
+import os
+import datetime
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sprint_forecast import SprintForecaster
+from monte_carlo import MonteCarloEstimator
+
+def make_ticket(ticket_id, hours, assigned_to=None, dependencies=None, complexity=1, status='in_progress'):
+    return {'id': ticket_id, 'title': f'Ticket {ticket_id}', 'status': status, 'priority': 'medium',
+            'complexity': complexity, 'estimated_hours': hours, 'assigned_to': assigned_to,
+            'dependencies': dependencies or []}
+
+class TestSprintForecaster(unittest.TestCase):
+    def setUp(self):
+        # Exact durations make the schedule easy to check by hand
+        estimator = MonteCarloEstimator()
+        estimator.complexity_factors = {1: (1.0, 1.0), 3: (0.6, 1.4)}
+        self.forecaster = SprintForecaster(estimator, shard_size=300)
+        self.developers = [{'id': 1, 'availability': 40}, {'id': 2, 'availability': 20}]
+    
+    def test_dependencies_and_developer_capacity(self):
+        """Test that dependent tickets and one developer's tickets run one after another"""
+        tickets = [
+            make_ticket(1, 8, assigned_to=1),
+            make_ticket(2, 16, assigned_to=1),
+            make_ticket(3, 4, assigned_to=2, dependencies=[1]),
+            make_ticket(4, 4, assigned_to=2, status='completed')
+        ]
+        plan = self.forecaster.plan(tickets, self.developers)
+        forecast = self.forecaster.forecast(plan, n_samples=1000, start_date=datetime.date(2025, 8, 1))
+        
+        # Developer 1 works 8 hours a day on tickets 1 then 2; ticket 3 waits for ticket 1 at 4 hours a day
+        self.assertEqual(forecast['open_tickets'], 3)
+        self.assertEqual(forecast['completion_days'], {'p50': 3.0, 'p80': 3.0, 'p95': 3.0})
+        # A Friday start finishes on the third working day, after the weekend
+        self.assertEqual(forecast['completion_dates']['p80'], '2025-08-05')
+        self.assertEqual(forecast['criticality'], [
+            {'ticket_id': 1, 'criticality': 1.0},
+            {'ticket_id': 2, 'criticality': 1.0}
+        ])
+    
+    def test_uncertain_durations(self):
+        """Test quantile ordering, sharding across workers and seeded repeatability"""
+        tickets = [make_ticket(i, 8, assigned_to=1 + i % 2, complexity=3) for i in range(1, 7)]
+        tickets.append(make_ticket(7, 8, complexity=3, dependencies=[1, 2], status='backlog'))
+        plan = self.forecaster.plan(tickets, self.developers)
+        
+        forecast = self.forecaster.forecast(plan, n_samples=1000, seed=4)
+        days = forecast['completion_days']
+        self.assertLessEqual(days['p50'], days['p80'])
+        self.assertLessEqual(days['p80'], days['p95'])
+        self.assertEqual(forecast, self.forecaster.forecast(plan, n_samples=1000, seed=4, workers=2))
+        self.assertTrue(all(0 < item['criticality'] <= 1 for item in forecast['criticality']))
+        
+        empty = self.forecaster.forecast(self.forecaster.plan([], self.developers))
+        self.assertEqual(empty['open_tickets'], 0)
+        self.assertEqual(empty['criticality'], [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import state_snapshot
+from state_snapshot import StateSnapshot
+
+class TestStateSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.snapshot = StateSnapshot(os.path.join(self.temp_dir.name, 'state_snapshot.npz'))
+        
+        self.developers = [
+            {'id': 1, 'name': 'John', 'skills': ['python', 'django'], 'availability': 40.0, 'current_workload': 0.0, 'experience_level': 4},
+            {'id': 2, 'name': 'Mary', 'skills': ['react'], 'availability': 35.0, 'current_workload': 8.5, 'experience_level': 3}
+        ]
+        self.tickets = [
+            {'id': 1, 'title': 'API', 'description': 'Build API', 'priority': 'high', 'complexity': 3,
+             'estimated_hours': 8, 'status': 'completed', 'tasks': ['Design', 'Build'], 'assigned_to': 1,
+             'entities': {'priorities': ['high'], 'dependencies': []}, 'completion_time': 6.5},
+            {'id': 2, 'title': 'UI', 'description': 'Build UI', 'priority': 'low', 'complexity': 2,
+             'estimated_hours': 5, 'status': 'backlog', 'tasks': [], 'assigned_to': None,
+             'entities': {'priorities': ['low'], 'dependencies': [1]}}
+        ]
+        self.metrics = [
+            {'developer_id': 1, 'ticket_id': 1, 'completion_time': 6.5, 'revisions': 1,
+             'sentiment_score': 0.4, 'timestamp': None}
+        ]
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_round_trip(self):
+        """Test that every table reads back exactly as written"""
+        self.snapshot.write(self.developers, self.tickets, self.metrics, {'tickets.csv': [10, 1]})
+        state = self.snapshot.read({'tickets.csv': [10, 1]})
+        
+        self.assertEqual(state['developers'], self.developers)
+        self.assertEqual(state['tickets'], self.tickets)
+        self.assertEqual(state['metrics'], self.metrics)
+        # Missing keys stay missing rather than becoming None
+        self.assertNotIn('completion_time', state['tickets'][1])
+        self.assertIs(type(state['tickets'][0]['id']), int)
+    
+    def test_stale_snapshot_is_ignored(self):
+        """Test that a snapshot written for other data files is not used"""
+        self.snapshot.write(self.developers, self.tickets, self.metrics, {'tickets.csv': [10, 1]})
+        self.assertIsNone(self.snapshot.read({'tickets.csv': [12, 2]}))
+    
+    def test_version_mismatch_is_ignored(self):
+        """Test that a snapshot from another format version is not used"""
+        self.snapshot.write(self.developers, self.tickets, self.metrics)
+        original_version = state_snapshot.SNAPSHOT_VERSION
+        state_snapshot.SNAPSHOT_VERSION = original_version + 1
+        try:
+            self.assertIsNone(self.snapshot.read())
+        finally:
+            state_snapshot.SNAPSHOT_VERSION = original_version
+    
+    def test_metrics_archive_kept(self):
+        """Test that a write without metrics keeps the metrics archive and its log offset"""
+        self.snapshot.write(self.developers, self.tickets, self.metrics, metrics_log_size=120)
+        metrics_mtime = os.stat(self.snapshot.metrics_path).st_mtime_ns
+        self.developers[0]['current_workload'] = 5.0
+        self.snapshot.write(self.developers, self.tickets)
+        
+        self.assertEqual(os.stat(self.snapshot.metrics_path).st_mtime_ns, metrics_mtime)
+        state = StateSnapshot(self.snapshot.path).read()
+        self.assertEqual(state['developers'], self.developers)
+        self.assertEqual(state['metrics'], self.metrics)
+        self.assertEqual(state['meta']['metrics_log_size'], 120)
+    
+    def test_metrics_archive_mismatch_is_ignored(self):
+        """Test that a snapshot is not used with a metrics archive written after it"""
+        self.snapshot.write(self.developers, self.tickets, self.metrics)
+        other = StateSnapshot(os.path.join(self.temp_dir.name, 'other.npz'))
+        other.write(self.developers, self.tickets, [])
+        os.replace(other.metrics_path, self.snapshot.metrics_path)
+        self.assertIsNone(self.snapshot.read())
+    
+    def test_corrupt_snapshot_is_ignored(self):
+        """Test that an unreadable snapshot falls back to None"""
+        with open(self.snapshot.path, 'wb') as f:
+            f.write(b'not a snapshot')
+        self.assertIsNone(self.snapshot.read())
+
+if __name__ == '__main__':
+    unittest.main()
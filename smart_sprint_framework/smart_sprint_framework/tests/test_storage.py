@@ -0,0 +1,101 @@
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import gc
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import DatabaseStorage
+from change_journal import TICKET_CREATED, TICKET_ASSIGNED, METRIC_RECORDED
+
+class TestDatabaseStorage(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'test.db')
+        self.storage = DatabaseStorage(self.db_path)
+        
+        self.developers = [
+            {'id': 1, 'name': 'John', 'skills': ['python'], 'availability': 40, 'current_workload': 0, 'experience_level': 4},
+            {'id': 2, 'name': 'Mary', 'skills': ['react'], 'availability': 40, 'current_workload': 8, 'experience_level': 3}
+        ]
+        self.tickets = [
+            {'id': 5, 'title': 'API', 'description': 'Build API', 'priority': 'high', 'complexity': 3,
+             'estimated_hours': 8, 'status': 'backlog', 'tasks': ['Design'], 'assigned_to': None}
+        ]
+        self.storage.replace_state(self.developers, self.tickets, [])
+    
+    def tearDown(self):
+        self.storage.close()
+        self.temp_dir.cleanup()
+    
+    def test_connection_settings(self):
+        """Test that connections use WAL and are reused per thread"""
+        db = self.storage.db
+        conn = db.get_connection()
+        self.assertIs(conn, db.get_connection())
+        self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+        
+        other = []
+        thread = threading.Thread(target=lambda: other.append(db.get_connection()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], conn)
+    
+    def test_thread_connections_released(self):
+        """Test that connections opened by short-lived threads are closed when the threads end"""
+        db = self.storage.db
+        db.get_connection()
+        for _ in range(50):
+            thread = threading.Thread(target=db.get_connection)
+            thread.start()
+            thread.join()
+        gc.collect()
+        self.assertEqual(len(db._connections), 1)
+    
+    def test_row_level_changes_round_trip(self):
+        """Test that recorded changes are visible after reopening the database"""
+        self.storage.record_change(TICKET_CREATED, {'ticket': {
+            'id': 6, 'title': 'UI', 'description': 'Build UI', 'priority': 'low', 'complexity': 2,
+            'estimated_hours': 4, 'status': 'backlog', 'tasks': []
+        }})
+        self.storage.record_change(TICKET_ASSIGNED, {
+            'ticket_id': 5,
+            'fields': {'status': 'in_progress', 'assigned_to': 1},
+            'workloads': [[1, 8]]
+        })
+        self.storage.record_change(METRIC_RECORDED, {'metric': {
+            'developer_id': 1, 'ticket_id': 5, 'completion_time': 9.5,
+            'revisions': 1, 'sentiment_score': 0.8, 'timestamp': '2025-07-30T16:00:00'
+        }})
+        self.storage.close()
+        
+        developers, tickets, metrics = DatabaseStorage(self.db_path).load()
+        self.assertEqual([t['id'] for t in tickets], [5, 6])
+        self.assertEqual(tickets[0]['assigned_to'], 1)
+        self.assertEqual(tickets[0]['status'], 'in_progress')
+        self.assertEqual(developers[0]['current_workload'], 8)
+        self.assertEqual(metrics[0]['completion_time'], 9.5)
+    
+    def test_null_optional_columns_left_out(self):
+        """Test that NULL optional ticket columns load as missing keys, like the CSV path"""
+        self.storage.record_change(TICKET_CREATED, {'ticket': {
+            'id': 7, 'title': 'Docs', 'description': 'Write docs', 'priority': 'low', 'complexity': 1,
+            'estimated_hours': 2, 'status': 'completed', 'tasks': []
+        }})
+        _, tickets, _ = self.storage.load()
+        completed = tickets[-1]
+        self.assertNotIn('completion_time', completed)
+        self.assertNotIn('jira_id', completed)
+        self.assertEqual(completed.get('completion_time', completed['estimated_hours']), 2)
+    
+    def test_empty_database_loads_none(self):
+        """Test that an empty database asks the caller to import data"""
+        empty = DatabaseStorage(os.path.join(self.temp_dir.name, 'empty.db'))
+        self.assertIsNone(empty.load())
+        empty.close()
+
+if __name__ == '__main__':
+    unittest.main()
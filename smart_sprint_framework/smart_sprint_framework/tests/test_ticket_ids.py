@@ -0,0 +1,70 @@
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import multiprocessing
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ticket_ids import TicketIdSequence
+
+
+def _allocate_many(path, count, results):
+    sequence = TicketIdSequence(path)
+    results.extend([sequence.allocate() for _ in range(count)])
+
+
+class TestTicketIdSequence(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'ticket_id_sequence.json')
+        self.sequence = TicketIdSequence(self.path)
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_allocate_and_reset(self):
+        """Test that ids are monotonic, persisted, and can be moved past or reset"""
+        self.assertEqual(self.sequence.allocate(), 1)
+        self.assertEqual(self.sequence.allocate(count=3), 2)
+        self.assertEqual(TicketIdSequence(self.path).peek(), 5)
+        
+        self.sequence.ensure_above(10)
+        self.sequence.ensure_above(3)
+        self.assertEqual(self.sequence.allocate(), 11)
+        
+        self.sequence.reset(4)
+        self.assertEqual(self.sequence.allocate(), 4)
+        
+        with open(self.path, 'w') as f:
+            f.write('{"next_')
+        self.sequence.ensure_above(7)
+        self.assertEqual(self.sequence.allocate(), 8)
+    
+    def test_concurrent_allocation(self):
+        """Test that threads and separate processes never receive the same id"""
+        results = []
+        threads = [threading.Thread(target=_allocate_many, args=(self.path, 25, results)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(results), list(range(1, 101)))
+        
+        if os.name == 'nt':
+            return
+        context = multiprocessing.get_context('fork')
+        with context.Manager() as manager:
+            shared = manager.list()
+            processes = [context.Process(target=_allocate_many, args=(self.path, 20, shared)) for _ in range(3)]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+                self.assertEqual(process.exitcode, 0)
+            self.assertEqual(sorted(shared), list(range(101, 161)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ticket_index import TicketIndex, WorkloadTotals, summarize
+
+class TestTicketIndex(unittest.TestCase):
+    def setUp(self):
+        self.tickets = [
+            {'id': 1, 'status': 'backlog', 'priority': 'high', 'complexity': 'low', 'assigned_to': None},
+            {'id': 2, 'status': 'in_progress', 'priority': 'medium', 'complexity': 'high', 'assigned_to': 1},
+            {'id': 3, 'status': 'completed', 'priority': 'low', 'complexity': 'high', 'assigned_to': 1, 'completion_time': 6}
+        ]
+        self.index = TicketIndex(self.tickets)
+    
+    def test_buckets_follow_transitions(self):
+        """Test that refreshing a changed ticket moves it between buckets"""
+        self.assertEqual(self.index.counts('status'), {'backlog': 1, 'in_progress': 1, 'completed': 1})
+        self.assertEqual(self.index.count('complexity', 'high'), 2)
+        
+        ticket = self.tickets[0]
+        ticket['status'] = 'in_progress'
+        ticket['assigned_to'] = 1
+        self.index.refresh(ticket)
+        self.assertEqual(self.index.count('status', 'backlog'), 0)
+        self.assertNotIn('backlog', self.index.counts('status'))
+        self.assertEqual([t['id'] for t in self.index.tickets('assigned_to', 1)], [2, 3, 1])
+        
+        ticket['status'] = 'completed'
+        ticket['completion_time'] = 4
+        self.index.refresh(ticket)
+        self.assertEqual(self.index.count('status', 'completed'), 2)
+        self.assertEqual(self.index.completion_time_total, 10)
+        self.assertEqual(self.index.completed_with_time, 2)
+        
+        # Tickets sharing an id are still counted separately
+        self.index.add({'id': 1, 'status': 'backlog', 'priority': 'low', 'complexity': 'low', 'assigned_to': None})
+        self.assertEqual(len(self.index), 4)
+        
+        summary = summarize(self.tickets, [])
+        self.assertEqual(summary['status_counts'], {'completed': 2, 'in_progress': 1})
+        self.assertEqual(summary['completion_time_total'], 10)
+    
+    def test_workload_totals(self):
+        """Test that workload totals track in-place changes"""
+        developers = [
+            {'id': 1, 'current_workload': 10, 'availability': 40},
+            {'id': 2, 'current_workload': 0, 'availability': 30}
+        ]
+        totals = WorkloadTotals(developers)
+        self.assertEqual((totals.total_workload, totals.total_availability), (10, 70))
+        
+        developers[1]['current_workload'] += 8
+        totals.refresh(developers[1])
+        totals.refresh(developers[1])
+        self.assertEqual((totals.total_workload, totals.total_availability), (18, 70))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import contextlib
+import json
+import os
+import threading
+from atomic_write import atomic_write, resolve_durability, DURABILITY_ALWAYS, DURABILITY_NONE
+
+
+@contextlib.contextmanager
+def _file_lock(path):
+    """Hold an exclusive lock on `path` that other processes also respect"""
+    with open(path, 'a+b') as f:
+        if os.name == 'nt':
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class TicketIdSequence:
+    """Persisted sequence of ticket ids shared by every process using the same file.
+
+    Each allocation reads the next free id from the file and writes back the
+    following one while holding a lock file, so threads and worker processes
+    never hand out the same id and creating a ticket costs the same however
+    large the backlog is. Only the always durability policy syncs each
+    allocation; after a crash the sequence is moved past the highest loaded
+    ticket id by ensure_above, so an unsynced allocation is never reused.
+    """
+    def __init__(self, path='ticket_id_sequence.json', durability=None):
+        self.path = path
+        self.lock_path = path + '.lock'
+        self.durability = DURABILITY_ALWAYS if resolve_durability(durability) == DURABILITY_ALWAYS else DURABILITY_NONE
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def _locked(self):
+        with self._lock, _file_lock(self.lock_path):
+            yield
+
+    def _read(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return int(json.load(f)['next_id'])
+        except FileNotFoundError:
+            return 1
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Warning: Could not read {self.path}, restarting ticket ids from the loaded tickets: {e}")
+            return 1
+
+    def _write(self, next_id):
+        with atomic_write(self.path, 'w', self.durability, encoding='utf-8') as f:
+            json.dump({'next_id': next_id}, f)
+
+    def peek(self):
+        """The id the next allocation will return"""
+        with self._locked():
+            return self._read()
+
+    def allocate(self, count=1):
+        """Reserve `count` consecutive ids and return the first"""
+        with self._locked():
+            first_id = self._read()
+            self._write(first_id + count)
+            return first_id
+
+    def ensure_above(self, ticket_id):
+        """Move the sequence past an id that is already in use"""
+        with self._locked():
+            if self._read() <= ticket_id:
+                self._write(ticket_id + 1)
+
+    def reset(self, next_id):
+        """Restart the sequence at next_id, after ticket ids were renumbered"""
+        with self._locked():
+            self._write(next_id)
@@ -0,0 +1,136 @@
+from collections import defaultdict
+
+# Ticket fields that get a bucket per distinct value
+INDEXED_FIELDS = ('status', 'priority', 'complexity', 'assigned_to')
+
+
+def summarize(tickets, developers):
+    """Compute the summary counters from scratch, for callers without an index"""
+    status_counts = defaultdict(int)
+    completion_time_total = 0
+    completed_with_time = 0
+    for ticket in tickets:
+        status_counts[ticket.get('status')] += 1
+        if ticket.get('status') == 'completed' and ticket.get('completion_time'):
+            completion_time_total += ticket['completion_time']
+            completed_with_time += 1
+
+    return {
+        'total_tickets': len(tickets),
+        'status_counts': dict(status_counts),
+        'completion_time_total': completion_time_total,
+        'completed_with_time': completed_with_time,
+        'total_workload': sum(dev['current_workload'] for dev in developers),
+        'total_availability': sum(dev['availability'] for dev in developers)
+    }
+
+
+class TicketIndex:
+    """Tickets bucketed by status, priority, complexity and assignee.
+
+    Each ticket is remembered with the field values it was bucketed under,
+    so after changing a ticket in place the owner only has to call
+    refresh(ticket) to move it between buckets. Counts and the running
+    completion time total are then available without scanning the tickets.
+    """
+    def __init__(self, tickets=()):
+        self.rebuild(tickets)
+
+    def rebuild(self, tickets):
+        """Re-index every ticket, used when the ticket list is replaced"""
+        # Keyed by object identity so tickets sharing an id are still counted separately
+        self._entries = {}
+        self._buckets = {field: defaultdict(dict) for field in INDEXED_FIELDS}
+        self.completion_time_total = 0
+        self.completed_with_time = 0
+        for ticket in tickets:
+            self.add(ticket)
+
+    def add(self, ticket):
+        """Index a new ticket"""
+        if id(ticket) in self._entries:
+            self.refresh(ticket)
+            return
+        values = self._values(ticket)
+        self._entries[id(ticket)] = (ticket, values)
+        self._insert(ticket, values)
+
+    def refresh(self, ticket):
+        """Move a ticket to the buckets matching its current field values"""
+        entry = self._entries.get(id(ticket))
+        if entry is None:
+            self.add(ticket)
+            return
+        values = self._values(ticket)
+        if values == entry[1]:
+            return
+        self._discard(ticket, entry[1])
+        self._entries[id(ticket)] = (ticket, values)
+        self._insert(ticket, values)
+
+    def _values(self, ticket):
+        completion_time = ticket.get('completion_time') if ticket.get('status') == 'completed' else None
+        return tuple(ticket.get(field) for field in INDEXED_FIELDS) + (completion_time or None,)
+
+    def _insert(self, ticket, values):
+        for field, value in zip(INDEXED_FIELDS, values):
+            self._buckets[field][value][id(ticket)] = ticket
+        if values[-1]:
+            self.completion_time_total += values[-1]
+            self.completed_with_time += 1
+
+    def _discard(self, ticket, values):
+        for field, value in zip(INDEXED_FIELDS, values):
+            bucket = self._buckets[field][value]
+            del bucket[id(ticket)]
+            if not bucket:
+                del self._buckets[field][value]
+        if values[-1]:
+            self.completion_time_total -= values[-1]
+            self.completed_with_time -= 1
+
+    def __len__(self):
+        return len(self._entries)
+
+    def count(self, field, value):
+        """Number of tickets whose `field` equals `value`"""
+        bucket = self._buckets[field].get(value)
+        return len(bucket) if bucket else 0
+
+    def counts(self, field):
+        """Ticket count for each value of `field`"""
+        return {value: len(bucket) for value, bucket in self._buckets[field].items()}
+
+    def tickets(self, field, value):
+        """Tickets whose `field` equals `value`, in the order they were indexed"""
+        bucket = self._buckets[field].get(value)
+        return list(bucket.values()) if bucket else []
+
+
+class WorkloadTotals:
+    """Running totals of developer workload and availability.
+
+    Works like TicketIndex: call refresh(developer) after changing a
+    developer's workload or availability in place.
+    """
+    def __init__(self, developers=()):
+        self.rebuild(developers)
+
+    def rebuild(self, developers):
+        """Recompute the totals, used when the developer list is replaced"""
+        self._entries = {}
+        self.total_workload = 0
+        self.total_availability = 0
+        for developer in developers:
+            self.refresh(developer)
+
+    def refresh(self, developer):
+        """Fold a developer's current workload and availability into the totals"""
+        workload, availability = developer['current_workload'], developer['availability']
+        entry = self._entries.get(id(developer))
+        if entry is not None:
+            self.total_workload -= entry[1]
+            self.total_availability -= entry[2]
+        self._entries[id(developer)] = (developer, workload, availability)
+        self.total_workload += workload
+        self.total_availability += availability
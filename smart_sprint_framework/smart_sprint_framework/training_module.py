@@ -18,6 +18,8 @@ class TrainingModule:
         self.dev_recommendation_preprocessor = None
         self.timeline_estimation_preprocessor = None
         self.is_trained = False
+        # Changes whenever different models are trained or loaded, so cached predictions can tell
+        self.model_version = 0
         
     def prepare_training_data(self, tickets, developers, performance_data):
         """Prepare training data from historical tickets and developer performance"""
@@ -209,6 +211,7 @@ class TrainingModule:
         timeline_rmse = self.train_timeline_estimation_model(training_data)
         
         self.is_trained = True
+        self.model_version += 1
         print("\nModels trained successfully!")
         print(f"Developer Recommendation Accuracy: {dev_rec_accuracy:.2f}")
         print(f"Timeline Estimation RMSE: {timeline_rmse:.2f} hours")
@@ -240,6 +243,7 @@ class TrainingModule:
                 print("Timeline estimation model loaded.")
             
             self.is_trained = True
+            self.model_version += 1
             return True
         except Exception as e:
             print(f"Error loading models: {e}")
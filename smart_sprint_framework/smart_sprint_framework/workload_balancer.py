@@ -2,7 +2,9 @@ import numpy as np
 from collections import defaultdict
 
 class WorkloadBalancer:
-    def __init__(self):
+    def __init__(self, performance_view='all'):
+        # Which PerformanceTracker view of each developer's history sets their capacity
+        self.performance_view = performance_view
         self.developer_capacity = {}
         self.task_complexity_weights = {
             1: 1.0,